@@ -0,0 +1,212 @@
+"""
+Adaptive concurrency control for outbound API calls.
+
+AIMD (additive-increase / multiplicative-decrease) concurrency limiting plus a
+circuit breaker, so that a provider slowdown shrinks our in-flight request count
+instead of turning into a retry storm of 429s.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# gRPC status names (xai-sdk) that signal provider overload rather than a bad request
+OVERLOAD_STATUS_CODES = {"RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED", "INTERNAL"}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """Return True for 429/5xx/timeout style errors from an API client."""
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    code = getattr(exc, "code", None)
+    if callable(code):  # grpc.RpcError
+        try:
+            return getattr(code(), "name", None) in OVERLOAD_STATUS_CODES
+        except Exception:
+            return False
+
+    status_code = getattr(exc, "status_code", None)  # HTTP clients
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+
+    return False
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Extract a retry-after hint (seconds) from an API error, if the server sent one."""
+    metadata = getattr(exc, "trailing_metadata", None)
+    if callable(metadata):  # grpc.RpcError
+        try:
+            for key, value in metadata() or ():
+                if key.lower() == "retry-after":
+                    return float(value)
+        except Exception:
+            return None
+
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is not None:  # HTTP clients
+        try:
+            value = headers.get("retry-after")
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    return None
+
+
+class AIMDController:
+    """
+    Adaptive concurrency limit with a circuit breaker.
+
+    - Each successful call under the target latency raises the limit by `increase`
+    - Each overload error multiplies the limit by `decrease` and pauses new calls
+      for the server's retry-after (if any)
+    - `failure_threshold` consecutive overload errors within `failure_window` seconds
+      open the circuit; calls fail fast until `open_seconds` pass, then a single
+      trial call decides whether to close it again
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: float = 8,
+        c_min: float = 1,
+        c_max: float = 64,
+        target_latency: float = 10.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        failure_threshold: int = 5,
+        failure_window: float = 30.0,
+        open_seconds: float = 30.0,
+    ):
+        self.name = name
+        self.cur = float(initial)
+        self.c_min = float(c_min)
+        self.c_max = float(c_max)
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.open_seconds = open_seconds
+
+        self.in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._resume_at = 0.0
+
+        # Circuit breaker state
+        self._consecutive_failures = 0
+        self._first_failure_at = 0.0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def limit(self) -> int:
+        """Current integer concurrency limit."""
+        return max(1, int(self.cur))
+
+    @property
+    def state(self) -> str:
+        """Circuit breaker state: closed, open or half_open."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.open_seconds:
+            return "open"
+        return "half_open"
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of a call."""
+        is_trial = await self._acquire()
+        try:
+            yield
+        finally:
+            await self._release(is_trial)
+
+    async def _acquire(self) -> bool:
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            raise CircuitOpenError(f"Circuit open for {self.name}")
+        is_trial = state == "half_open"
+        if is_trial:
+            self._trial_in_flight = True
+
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        try:
+            # Honor a server retry-after before taking a slot
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            async with self._condition:
+                await self._condition.wait_for(lambda: self.in_flight < self.limit)
+                self.in_flight += 1
+        except BaseException:
+            if is_trial:
+                self._trial_in_flight = False
+            raise
+
+        return is_trial
+
+    async def _release(self, is_trial: bool) -> None:
+        if is_trial:
+            self._trial_in_flight = False
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Additive increase when the call finished within the latency target."""
+        self._consecutive_failures = 0
+        if self._opened_at is not None:
+            logger.info("Circuit closed for %s", self.name)
+            self._opened_at = None
+
+        if latency <= self.target_latency:
+            self.cur = min(self.c_max, self.cur + self.increase)
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease on overload; may open the circuit."""
+        now = time.monotonic()
+        self.cur = max(self.c_min, self.cur * self.decrease)
+        if retry_after:
+            self._resume_at = max(self._resume_at, now + retry_after)
+
+        if self._consecutive_failures == 0 or now - self._first_failure_at > self.failure_window:
+            self._first_failure_at = now
+            self._consecutive_failures = 0
+        self._consecutive_failures += 1
+
+        state = self.state
+        if state == "half_open":
+            # The trial call failed: back to open for another cool-down
+            logger.warning("Circuit re-opened for %s after failed trial", self.name)
+            self._opened_at = now
+        elif state == "closed" and self._consecutive_failures >= self.failure_threshold:
+            logger.warning(
+                "Circuit opened for %s after %d failures", self.name, self._consecutive_failures
+            )
+            self._opened_at = now
+
+        logger.info("Backing off %s: concurrency limit now %d", self.name, self.limit)
+
+
+__all__ = [
+    "AIMDController",
+    "CircuitOpenError",
+    "is_overload_error",
+    "retry_after_seconds",
+]
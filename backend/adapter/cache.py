@@ -0,0 +1,173 @@
+"""
+Small in-process caches shared by the adapters.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, FrozenSet, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    Least recently used entries are evicted once `maxsize` is exceeded.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self._misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key, evicting the least recently used entries if full.
+
+        `ttl` overrides the cache-wide TTL for this entry.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cache metrics
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
+
+            return {
+                "entries": len(self._data),
+                "maxsize": self.maxsize,
+                "cache_hits": self._hits,
+                "cache_misses": self._misses,
+                "total_requests": total_requests,
+                "hit_rate_percent": round(hit_rate, 2),
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SimilarityCache:
+    """
+    Near-duplicate lookup for prompt text.
+
+    Entries are grouped into buckets (e.g. schema + topic); within a bucket a lookup
+    returns the stored value whose text has the highest Jaccard similarity over word
+    bigrams, if it reaches `threshold`. Bigrams never span a line break, so reordering
+    lines (e.g. posts in a prompt) leaves the similarity unchanged. Each bucket keeps
+    its `maxsize` newest entries, and the least recently used buckets are evicted once
+    there are more than `max_buckets`.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        maxsize: int = 64,
+        ttl: float = 900.0,
+        max_buckets: int = 1024,
+    ):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_buckets = max_buckets
+        self._buckets: "OrderedDict[Hashable, Deque[Tuple[float, FrozenSet[int], Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _shingles(text: str) -> FrozenSet[int]:
+        shingles = set()
+        for line in text.lower().splitlines():
+            words = line.split()
+            shingles.update(map(hash, zip(words, words[1:])))
+        return frozenset(shingles)
+
+    def get(self, bucket: Hashable, text: str, default: Optional[Any] = None) -> Any:
+        """Return the most similar cached value in bucket, or default."""
+        shingles = self._shingles(text)
+        if not shingles:
+            return default
+
+        now = time.monotonic()
+        best_score, best_value = self.threshold, default
+        with self._lock:
+            entries = self._buckets.get(bucket)
+            if entries is None:
+                return default
+            # Entries share one TTL, so the expired ones are always at the front
+            while entries and entries[0][0] <= now:
+                entries.popleft()
+            if not entries:
+                del self._buckets[bucket]
+                return default
+            self._buckets.move_to_end(bucket)
+            for _, other, value in entries:
+                # Jaccard can't exceed the size ratio, so skip the set ops when it can't match
+                smaller, larger = sorted((len(shingles), len(other)))
+                if smaller < best_score * larger:
+                    continue
+                score = len(shingles & other) / len(shingles | other)
+                if score >= best_score:
+                    best_score, best_value = score, value
+        return best_value
+
+    def set(self, bucket: Hashable, text: str, value: Any) -> None:
+        shingles = self._shingles(text)
+        if not shingles:
+            return
+        with self._lock:
+            entries = self._buckets.get(bucket)
+            if entries is None:
+                entries = self._buckets[bucket] = deque(maxlen=self.maxsize)
+                while len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(bucket)
+            entries.append((time.monotonic() + self.ttl, shingles, value))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+__all__ = ["SimilarityCache", "TTLCache"]
@@ -5,32 +5,366 @@ Typed helper wrapping Grok (xai-sdk) flows for the X Terminal backend.
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
+import hashlib
+import heapq
+import importlib.util
+import io
+import json
 import logging
+import math
 import os
+import random
+import re
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import weakref
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import compress, islice
+from operator import attrgetter, itemgetter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from dotenv import find_dotenv, load_dotenv
-from pydantic import BaseModel, Field
-
-from ..models import Tick
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..backpressure import (
+    AIMDController,
+    CircuitOpenError,
+    is_overload_error,
+    retry_after_seconds,
+)
+from ..cache import SimilarityCache, TTLCache
+from ..models import Metrics, Tick
 from ..rate_limiter import RateLimiter, shared_limiter
 
-load_dotenv(find_dotenv(usecwd=True))
+try:
+    import orjson
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
 
 try:
-    from xai_sdk import Client
-    from xai_sdk.chat import system, user
+    import diskcache
+
+    DISKCACHE_AVAILABLE = True
+except ImportError:  # optional persistent response cache
+    diskcache = None  # type: ignore[assignment]
+    DISKCACHE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Cheap local spam filter, run before posts are sent to Grok
+_SPAM_PATTERNS = re.compile(
+    r"(send.{0,10}(btc|eth|sol)|dm me|100x|free airdrop|giveaway|join my (group|channel)"
+    r"|0x[a-f0-9]{20,})",
+    re.IGNORECASE,
+)
+# Share of spam in a bar above which "High spam ratio" is added to key_themes
+_HIGH_SPAM_RATIO = 0.5
+
+
+# Bars with at least this many ticks are scanned in a worker thread (async paths)
+_OFFLOAD_TICKS = 2000
+
+# Longest excerpt of a single post sent to Grok (characters)
+_MAX_POST_CHARS = 500
+
+# Cap on a prompt assembled from a list of free-text lines (characters)
+_MAX_LIST_PROMPT_CHARS = 4096
+
+# Most recent bars included in a topic digest prompt (12 x 5min bars = 1 hour)
+_DIGEST_BARS = 12
+
+
+# Full-jitter backoff bounds for retried overload errors, in seconds
+_BASE_BACKOFF = 0.5
+_MAX_BACKOFF = 60.0
+
+# Completion tokens booked against a tokens-per-minute limit on top of the prompt
+_COMPLETION_TOKENS = 512
+
+
+def _estimate_tokens(n_chars: int) -> int:
+    """Fast token estimate (~4 characters per token for English BPE vocabularies)."""
+    return n_chars // 4 + 1
+
+
+def _truncate_post(text: str, max_chars: int = _MAX_POST_CHARS) -> str:
+    """Shorten a post to max_chars, cutting at a word boundary."""
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", 0, max_chars)
+    return text[: cut if cut > 0 else max_chars] + "..."
+
+
+def _join_lines(lines: Iterable[str], prefix: str = "") -> str:
+    """
+    Join lines into a prompt, stopping before it would exceed _MAX_LIST_PROMPT_CHARS.
+
+    Each line is shortened with _truncate_post first, so one long entry can't crowd
+    out the rest and the prompt's token estimate stays bounded.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    total = 0
+    for line in lines:
+        line = _truncate_post(line)
+        total += len(prefix) + len(line) + 1
+        if total > _MAX_LIST_PROMPT_CHARS and buf.tell():
+            break
+        if buf.tell():
+            write("\n")
+        write(prefix)
+        write(line)
+    return buf.getvalue()
+
+
+class _DigestBar(NamedTuple):
+    """The fields of a bar dict that a topic digest reads."""
+
+    start: Any
+    summary: Any
+    post_count: Any
+    sentiment: Any
+
+
+def _digest_bars(bars_data: List[Dict[str, Any]]) -> List[_DigestBar]:
+    """
+    Read the last _DIGEST_BARS bar dicts once, for both the cache key and the prompt.
+
+    Walks the tail with islice so the input list is never copied.
+    """
+    return [
+        _DigestBar(
+            bar.get("start", "unknown"),
+            bar.get("summary", "No summary"),
+            bar.get("post_count", 0),
+            bar.get("sentiment"),
+        )
+        for bar in islice(bars_data, max(len(bars_data) - _DIGEST_BARS, 0), None)
+    ]
+
+
+def _build_posts_text(ticks: List[Tick], token_budget: int) -> Tuple[str, int]:
+    """
+    Greedily pack posts into the prompt, in the given order, until the token budget is spent.
+
+    Pass the posts in priority order; the ones that fit are written in chronological order.
+
+    Returns:
+        (posts_text, number of posts included)
+    """
+    packed: List[Tuple[datetime, str, str]] = []
+    used = 0
+    for tick in ticks:
+        text = _truncate_post(tick.text)
+        cost = _estimate_tokens(len(tick.author) + len(text) + 3)  # "@author: text"
+        if used + cost > token_budget and packed:
+            break
+        packed.append((tick.timestamp, tick.author, text))
+        used += cost
+    packed.sort(key=itemgetter(0))
+
+    buf = io.StringIO()
+    write = buf.write
+    for _, author, text in packed:
+        if buf.tell():
+            write("\n")
+        write("@")
+        write(author)
+        write(": ")
+        write(text)
+    return buf.getvalue(), len(packed)
+
+
+# Engagement score weights used to rank posts for highlights and prompt sampling
+_ENGAGEMENT_WEIGHTS = Metrics(like_count=3, retweet_count=5, reply_count=2, quote_count=4)
+_get_id = attrgetter("id")
+# Flips _TickBatch.spam flags into a keep-legit mask for itertools.compress
+_NOT_SPAM = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+def _highlight_rank(tick: Tick) -> Tuple[int, datetime]:
+    """Engagement score, then recency: the ranking key for highlight posts."""
+    w_like, w_rt, w_reply, w_quote = _ENGAGEMENT_WEIGHTS
+    likes, retweets, replies, quotes = tick.counts
+    return likes * w_like + retweets * w_rt + replies * w_reply + quotes * w_quote, tick.timestamp
+
+
+def _highlight_ids(ticks: List[Tick], k: int = 2) -> List[str]:
+    """
+    Same IDs as _TickBatch(ticks).top_ids(k), without building the batch.
+
+    Used on bar-cache hits: ticks are ranked first and the spam filter only runs on
+    the leading candidates, widening the window until k legitimate ticks are found.
+    """
+    spam_search = _SPAM_PATTERNS.search
+    n = k
+    while True:
+        top = heapq.nlargest(n, ticks, key=_highlight_rank)
+        ids = [tick.id for tick in top if spam_search(tick.text) is None]
+        if len(ids) >= k or n >= len(ticks):
+            return ids[:k]
+        n *= 4
+
+
+@lru_cache(maxsize=1024)
+def _format_time_window(start_time: datetime, end_time: datetime) -> str:
+    """HH:MM-HH:MM label for a bar; adjacent bars share boundaries, so this is memoized."""
+    return f"{start_time.strftime('%H:%M')}-{end_time.strftime('%H:%M')}"
+
+
+# Bands of the bar sentiment scale, shared with the mocks: < 0.4 is negative, > 0.6 is
+# positive, anything in between (including the 0.5 default for noise) is neutral
+_SENTIMENT_CUTS = (0.4, math.nextafter(0.6, 1.0))
+_SENTIMENT_LABELS = ("negative", "neutral", "positive")
+
+
+def _sentiment_label(sentiment: Any) -> str:
+    """Label a bar's sentiment score for the digest prompt."""
+    if sentiment is None:
+        return "unknown"
+    if isinstance(sentiment, (int, float)):
+        return f"{_SENTIMENT_LABELS[bisect_right(_SENTIMENT_CUTS, sentiment)]} ({sentiment:.2f})"
+    return str(sentiment)
+
+
+class _TickBatch:
+    """
+    Column-oriented view over a bar's ticks, filled in a single walk.
+
+    Engagement scores, timestamps and spam flags live in parallel arrays, so
+    highlight ranking, spam counting and prompt building share one pass over
+    each tick's metrics.
+    """
+
+    __slots__ = ("ticks", "scores", "timestamps", "spam", "legit_ticks")
+
+    def __init__(self, ticks: List[Tick]):
+        self.ticks = ticks
+        self.scores = array("q")
+        self.timestamps = array("d")
+        self.spam = bytearray()
+        self.legit_ticks: List[Tick] = []
+
+        # Bind everything the loop touches to locals once per bar
+        w_like, w_rt, w_reply, w_quote = _ENGAGEMENT_WEIGHTS
+        add_score, add_ts, add_spam = self.scores.append, self.timestamps.append, self.spam.append
+        add_legit = self.legit_ticks.append
+        spam_search = _SPAM_PATTERNS.search
+
+        for tick in ticks:
+            likes, retweets, replies, quotes = tick.counts
+            add_score(likes * w_like + retweets * w_rt + replies * w_reply + quotes * w_quote)
+            add_ts(tick.timestamp.timestamp())
+            is_spam = spam_search(tick.text) is not None
+            add_spam(is_spam)
+            if not is_spam:
+                add_legit(tick)
+
+    @property
+    def spam_count(self) -> int:
+        return len(self.ticks) - len(self.legit_ticks)
+
+    def _top_indices(self, k: int, include_spam: bool) -> List[int]:
+        # Rank plain (score, timestamp, -index) tuples so every comparison stays in C;
+        # the negated index keeps the earlier tick first on a full tie, as a key would
+        rows = zip(self.scores, self.timestamps, range(0, -len(self.ticks), -1))
+        if not include_spam:
+            rows = compress(rows, self.spam.translate(_NOT_SPAM))
+        return [-row[2] for row in heapq.nlargest(k, rows)]
+
+    def top_ids(self, k: int, include_spam: bool = False) -> List[str]:
+        """IDs of the k ticks with the highest engagement, most recent first on ties."""
+        return list(map(_get_id, map(self.ticks.__getitem__, self._top_indices(k, include_spam))))
+
+    def sample(self, k: int) -> List[Tick]:
+        """The k most engaging legitimate ticks (all of them if k <= 0), most engaging first."""
+        if k <= 0 or k > len(self.legit_ticks):
+            k = len(self.legit_ticks)
+        return list(map(self.ticks.__getitem__, self._top_indices(k, include_spam=False)))
+
+
+# Import monitoring (lazy to avoid circular imports)
+_monitor = None
+
+
+def _get_monitor():
+    global _monitor
+    if _monitor is None:
+        try:
+            from monitoring import monitor
+            _monitor = monitor
+        except ImportError:
+            _monitor = None
+    return _monitor
+
+
+def _record_grok_call(start_ns: int, error: bool = False, response: Any = None) -> int:
+    """
+    Record a Grok call started at start_ns (perf_counter_ns); returns its latency in ns.
 
-    XAI_SDK_AVAILABLE = True
-except ImportError:  # xai-sdk might not be installed in local dev
+    Prompt and cached prompt token counts are taken from the response usage, so the
+    provider's prompt-cache hit rate on our static prompt prefixes shows in metrics.
+    """
+    latency_ns = time.perf_counter_ns() - start_ns
+    mon = _get_monitor()
+    if mon:
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0)
+        cached_tokens = getattr(usage, "cached_prompt_text_tokens", 0)
+        if not (isinstance(prompt_tokens, int) and isinstance(cached_tokens, int)):
+            prompt_tokens = cached_tokens = 0
+        mon.metrics.record_grok_call(
+            latency_ns / 1e6,
+            error=error,
+            prompt_tokens=prompt_tokens,
+            cached_prompt_tokens=cached_tokens,
+        )
+    return latency_ns
+
+
+_DOTENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """Load .env once, on first adapter construction rather than at import."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv(find_dotenv(usecwd=True))
+        _DOTENV_LOADED = True
+
+
+# xai-sdk (grpc, protobuf, aiohttp) is imported on first live use rather than here, so
+# code that only needs the models or the mocks doesn't pay for it
+XAI_SDK_AVAILABLE = importlib.util.find_spec("xai_sdk") is not None
+_XAI_SDK_NAMES = ("AsyncClient", "Client", "chat_pb2", "system", "user")
+
+if not XAI_SDK_AVAILABLE:  # xai-sdk might not be installed in local dev
+    AsyncClient = None  # type: ignore[assignment]
     Client = None  # type: ignore[assignment]
-    XAI_SDK_AVAILABLE = False
+    chat_pb2 = None  # type: ignore[assignment]
 
     def system(content: str) -> str:  # type: ignore[override]
         return content
@@ -39,7 +373,184 @@ except ImportError:  # xai-sdk might not be installed in local dev
         return content
 
 
-class IntelSummary(BaseModel):
+def _load_xai_sdk() -> None:
+    """
+    Bind the xai-sdk names used by this module, importing the SDK once.
+
+    Only missing names are bound, so a name that is already set (e.g. patched in a
+    test) is never overwritten, and a name that was removed is bound again.
+    """
+    module_globals = globals()
+    if not XAI_SDK_AVAILABLE or all(name in module_globals for name in _XAI_SDK_NAMES):
+        return
+    from xai_sdk import AsyncClient, Client
+    from xai_sdk.chat import system, user
+    from xai_sdk.proto import chat_pb2
+
+    loaded = dict(
+        AsyncClient=AsyncClient, Client=Client, chat_pb2=chat_pb2, system=system, user=user
+    )
+    for name in _XAI_SDK_NAMES:
+        module_globals.setdefault(name, loaded[name])
+
+
+def __getattr__(name: str) -> Any:
+    if name in _XAI_SDK_NAMES and XAI_SDK_AVAILABLE:
+        _load_xai_sdk()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _system_message(prompt: str) -> Any:
+    """
+    system() message for one of the constant system prompts, built once.
+
+    Safe to share: chat.append copies the message into the request proto.
+    """
+    _load_xai_sdk()
+    return system(prompt)
+
+
+class _PartialJSONObject:
+    """
+    Incremental scanner for a JSON object arriving in chunks.
+
+    feed() returns the members parsed so far whenever another top-level member
+    closes, so callers can act on early fields before the object is complete.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        self.text += chunk
+        closed_at = None
+        for i in range(self._pos, len(self.text)):
+            char = self.text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    closed_at = i
+            elif char == "," and self._depth == 1:
+                closed_at = i
+        self._pos = len(self.text)
+
+        if closed_at is None:
+            return None
+        prefix = self.text[:closed_at].rstrip()
+        try:
+            return _json_loads(prefix if prefix.endswith("}") else prefix + "}")
+        except ValueError:
+            return None
+
+
+# Process-wide xai-sdk clients keyed by API key, so every GrokAdapter shares one
+# warm gRPC channel instead of paying a TLS/HTTP2 handshake per instance.
+# Async clients are bound to the event loop they were created on.
+_CLIENT_CACHE: "Dict[str, Client]" = {}  # type: ignore[type-arg]
+_ACLIENT_CACHE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENT_LOCK = threading.Lock()
+
+# How long a deferred (batch) completion may stay queued before we give up
+_DEFERRED_TIMEOUT = timedelta(minutes=30)
+
+
+def _shared_client(api_key: str) -> Client:  # type: ignore[type-arg]
+    # Double-checked: only the first construction per key takes the lock
+    client = _CLIENT_CACHE.get(api_key)
+    if client is not None:
+        return client
+    _load_xai_sdk()
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = _CLIENT_CACHE[api_key] = Client(api_key=api_key)  # type: ignore[misc]
+        return client
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    """Close sync clients still open at exit, e.g. from CLI runs that never call aclose()."""
+    with _CLIENT_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug("Failed to close xAI client: %s", e)
+
+
+def _shared_async_client(api_key: str) -> AsyncClient:  # type: ignore[type-arg]
+    loop = asyncio.get_running_loop()
+    client = _ACLIENT_CACHE.get(loop, {}).get(api_key)
+    if client is not None:
+        return client
+    _load_xai_sdk()
+    with _CLIENT_LOCK:
+        clients = _ACLIENT_CACHE.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = clients[api_key] = AsyncClient(api_key=api_key)  # type: ignore[misc]
+        return client
+
+
+# JSON schemas of the response models, built once per model instead of per request
+_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+_RESPONSE_FORMAT_CACHE: Dict[type, Any] = {}
+
+
+class _StructuredOutput(BaseModel):
+    """
+    Base for Grok response models: immutable, and caches the default JSON schema.
+
+    extra="forbid" puts additionalProperties: false in the schema sent to Grok, so
+    structured output stays within the declared fields.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:  # type: ignore[override]
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        schema = _SCHEMA_CACHE.get(cls)
+        if schema is None:
+            schema = _SCHEMA_CACHE[cls] = super().model_json_schema()
+        return schema
+
+
+def _response_format(schema: type[BaseModel]) -> Any:
+    """Prebuilt xai-sdk ResponseFormat for schema, serialized once per model."""
+    response_format = _RESPONSE_FORMAT_CACHE.get(schema)
+    if response_format is None:
+        _load_xai_sdk()
+        response_format = _RESPONSE_FORMAT_CACHE[schema] = chat_pb2.ResponseFormat(
+            format_type=chat_pb2.FORMAT_TYPE_JSON_SCHEMA,
+            schema=json.dumps(schema.model_json_schema(), separators=(",", ":")),
+        )
+    return response_format
+
+
+class IntelSummary(_StructuredOutput):
     handle: str = Field(description="The @handle that was analyzed")
     summary: str = Field(description="Short operator-facing summary")
     top_topics: List[str] = Field(description="Key subjects this handle talks about")
@@ -47,21 +558,21 @@ class IntelSummary(BaseModel):
     recent_activity: List[str] = Field(description="Bullet list of recent actions")
 
 
-class MonitorInsight(BaseModel):
+class MonitorInsight(_StructuredOutput):
     topic: str = Field(description="Topic being monitored")
     headline: str = Field(description="One-line headline for the latest pulse")
     impact_score: int = Field(description="0-100 subjective impact score", ge=0, le=100)
     tags: List[str] = Field(description="Tags that categorize the event")
 
 
-class FactCheckReport(BaseModel):
+class FactCheckReport(_StructuredOutput):
     url: str = Field(description="URL that was fact checked")
     verdict: str = Field(description="true / false / unclear verdict")
     rationale: str = Field(description="Why we decided on the verdict")
     confidence: str = Field(description="low / medium / high confidence level")
 
 
-class DigestOverview(BaseModel):
+class DigestOverview(_StructuredOutput):
     generated_at: datetime = Field(description="Timestamp when digest ran")
     highlights: List[str] = Field(description="Short snippets covering the situation")
     risk_outlook: str = Field(description="One paragraph describing risk posture")
@@ -69,7 +580,7 @@ class DigestOverview(BaseModel):
 
 
 # X Terminal specific models
-class BarSummary(BaseModel):
+class BarSummary(_StructuredOutput):
     """Summary for a time-barred window of posts."""
 
     summary: str = Field(
@@ -86,7 +597,7 @@ class BarSummary(BaseModel):
     )
 
 
-class TopicDigest(BaseModel):
+class TopicDigest(_StructuredOutput):
     """Digest over multiple bars for a topic."""
 
     topic: str = Field(description="Topic name")
@@ -103,12 +614,122 @@ class TopicDigest(BaseModel):
     )
 
 
+class TopicRollup(_StructuredOutput):
+    """Bar summaries and their digest, produced by a single fused call."""
+
+    bars: List[BarSummary] = Field(
+        description="One summary per bar section, in the order the bars were given"
+    )
+    digest: TopicDigest = Field(description="Digest across all of the bars")
+
+
+class BarSummaryBatch(_StructuredOutput):
+    """Summaries of several independent bars, produced by a single call."""
+
+    bars: List[BarSummary] = Field(
+        description="One summary per bar section, in the order the bars were given"
+    )
+
+
+# How long an identical structured call may be answered from the response cache
+_RESPONSE_TTL: Dict[type, float] = {
+    IntelSummary: 3600,
+    MonitorInsight: 60,  # live pulse, only dedupe bursts
+    FactCheckReport: 86400,
+    DigestOverview: 900,
+    BarSummary: 3600,
+    TopicDigest: 900,
+    TopicRollup: 900,
+    BarSummaryBatch: 3600,
+}
+
+# Schemas whose prompts may be answered by a near-duplicate cached prompt
+_SIMILARITY_SCHEMAS = (IntelSummary, BarSummary, TopicDigest)
+# Prompt lines that must match exactly for a near-duplicate hit
+_IDENTITY_PREFIXES = ("Topic:", "Handle:", "URL:")
+
+
+# System prompts, shared by the sync and async code paths. They hold every static
+# instruction and go first, so requests for a schema share one long token prefix that
+# provider-side prompt caching can reuse; user prompts carry only per-call data.
+_SYSTEM_SUMMARIZE_USER = "Summarize the following X account for an operator dashboard."
+_SYSTEM_MONITOR_TOPIC = (
+    "Provide a short monitor insight for a live-ops dashboard: "
+    "a headline, an impact score and tags for the given topic."
+)
+_SYSTEM_FACT_CHECK = "Fact check the provided X post. Respond with a structured verdict."
+_SYSTEM_DIGEST = "Produce an executive digest for a social-ops dashboard."
+
+_SYSTEM_BAR_SUMMARY = """You are a critical analyst summarizing social media posts for a professional trading/monitoring dashboard.
+
+SPAM FILTERING (CRITICAL - apply first):
+Obvious spam has already been removed. Identify and EXCLUDE any that remains:
+- Giveaway scams ("Send X get Y back", "Free BTC/ETH")
+- Trading signal promotions ("Join my group", "100x gains")
+- Bot-like repetitive content
+- Wallet address begging
+- Obvious pump-and-dump shills
+- "DM me" or follow-bait posts
+
+Your summary should focus ONLY on legitimate content. Only include posts that are not spam or scams. If there are no posts that are not spam or scams, say nothing, and return an empty output.
+
+If there are spam, do not mention it at all. Again, say nothing if no legitimate posts exist.
+
+SENTIMENT SCORING (based on NON-SPAM content only):
+- 0.0-0.3: Very negative (panic, crashes, scams exposed, major bad news)
+- 0.3-0.6: Negative (concerns, doubt, bearish sentiment, criticism)
+- 0.6-0.7: Neutral (mixed signals, factual updates, no clear direction)
+- 0.7-0.8: Positive (optimism, good news, bullish but measured)
+- 0.8-1.0: Very positive (euphoria, major wins, breakthrough news)
+
+ANALYSIS RULES:
+1. Base sentiment ONLY on legitimate posts, not spam
+2. "Moon" talk without substance = skeptical (0.5-0.6 max)
+3. Distinguish genuine news from hype
+4. Default to neutral (0.5) when content is mostly noise
+
+KEY_THEMES should reflect actual topics discussed (excluding spam).
+
+HIGHLIGHT_POSTS should be from legitimate content only, not spam."""
+
+_SYSTEM_TOPIC_DIGEST = """You are creating an executive digest for a topic's recent activity across multiple time windows.
+Provide contextual analysis of trends, developments, and recommendations for monitoring."""
+
+_SYSTEM_TOPIC_ROLLUP = f"""{_SYSTEM_BAR_SUMMARY}
+
+You will receive several consecutive time windows for one topic, each under its own
+=== BAR n [HH:MM-HH:MM] === header. Return one bar summary per window, in order,
+following the rules above. Then create an executive digest across all windows with
+contextual analysis of trends, developments, and recommendations for monitoring."""
+
+_SYSTEM_BAR_BATCH = f"""{_SYSTEM_BAR_SUMMARY}
+
+You will receive several independent time windows, possibly for different topics, each
+under its own === BAR n: topic [HH:MM-HH:MM] === header. Summarize every window on its
+own, following the rules above, and return one bar summary per window, in order."""
+
+# Most bars packed into one summarize_bars_batch request; they share the posts budget
+_BAR_BATCH_SIZE = 8
+
+
+class _PendingBar(NamedTuple):
+    """A bar of summarize_bars_batch that still needs a Grok summary."""
+
+    index: int
+    topic: str
+    batch: _TickBatch
+    start_time: datetime
+    end_time: datetime
+    cache_key: bytes
+
+
 class GrokAdapter:
     """
     Adapter for Grok API calls with proper error handling, logging, and rate limiting.
     """
 
     def __init__(self, rate_limiter: Optional[RateLimiter] = None) -> None:
+        _ensure_env()
         self.api_key = os.getenv("XAI_API_KEY")
         self.fast_model = os.getenv(
             "GROK_MODEL_FAST", "grok-4-1-fast"
@@ -118,13 +739,55 @@ class GrokAdapter:
         )  # Updated to current model
         self._client: Optional[Client] = None  # type: ignore[type-arg]
         self.rate_limiter = rate_limiter or shared_limiter
+        # Approximate token budget for the posts section of bar prompts
+        self.prompt_token_budget = int(os.getenv("GROK_PROMPT_TOKENS", "2048"))
+        # Max posts (top by engagement) considered for each bar prompt; 0 = all
+        self.bar_sample_k = int(os.getenv("GROK_BAR_SAMPLE_K", "25"))
+        # Retries (with jittered exponential backoff) after 429/5xx/timeout errors
+        self.max_retries = int(os.getenv("GROK_MAX_RETRIES", "3"))
+        # Upper bound on concurrent in-flight calls for the batched async helpers
+        self.max_concurrency = int(os.getenv("GROK_MAX_CONCURRENCY", "16"))
+        # Route offline digest batches through deferred completions
+        self.use_batch = os.getenv("GROK_USE_BATCH", "0") == "1"
+        # Finished bar summaries / digests keyed by a hash of their inputs
+        self._bar_cache = TTLCache(maxsize=4096, ttl=900)
+        self._digest_cache = TTLCache(maxsize=1024, ttl=900)
+        # Parsed payloads keyed by (model, prompts, schema), TTL per schema capped
+        # at GROK_RESPONSE_CACHE_TTL; a size of 0 disables the cache
+        self.response_cache_ttl = float(os.getenv("GROK_RESPONSE_CACHE_TTL", "86400"))
+        self._response_cache = TTLCache(
+            maxsize=int(os.getenv("GROK_RESPONSE_CACHE_SIZE", "4096")),
+            ttl=self.response_cache_ttl,
+        )
+        # Optional on-disk copy of the response cache, reused across restarts and
+        # shared by workers pointing at the same directory (requires diskcache)
+        self._disk_cache = self._open_disk_cache(os.getenv("GROK_DISK_CACHE_DIR", ""))
+        # Optional near-duplicate lookup for bar/digest prompts (0 = disabled)
+        similarity_threshold = float(os.getenv("GROK_SIMILARITY_THRESHOLD", "0"))
+        self._similar_cache: Optional[SimilarityCache] = (
+            SimilarityCache(threshold=similarity_threshold) if similarity_threshold > 0 else None
+        )
+        # In-flight async calls keyed by request hash (single-flight coalescing)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Same for blocking calls made from worker threads
+        self._inflight_sync: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Adaptive concurrency + circuit breaker per rate limit category (async path)
+        self._backpressure: Dict[str, AIMDController] = {
+            "grok_fast": AIMDController(
+                "grok_fast", c_max=self.max_concurrency * 4, target_latency=5.0
+            ),
+            "grok_reasoning": AIMDController(
+                "grok_reasoning", c_max=self.max_concurrency * 4, target_latency=20.0
+            ),
+        }
 
         if XAI_SDK_AVAILABLE and self.api_key:
             try:
-                self._client = Client(api_key=self.api_key)  # type: ignore[call-arg]
+                self._client = _shared_client(self.api_key)
                 logger.info("GrokAdapter initialized with live API client")
             except Exception as e:
-                logger.warning(f"Failed to initialize xAI client: {e}")
+                logger.warning("Failed to initialize xAI client: %s", e)
                 self._client = None
         else:
             logger.warning(
@@ -136,6 +799,57 @@ class GrokAdapter:
     def is_live(self) -> bool:
         return self._client is not None
 
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss statistics for the response, bar and digest caches."""
+        return {
+            "response": self._response_cache.get_stats(),
+            "bar": self._bar_cache.get_stats(),
+            "digest": self._digest_cache.get_stats(),
+        }
+
+    @staticmethod
+    def _open_disk_cache(directory: str) -> Optional[Any]:
+        if not directory:
+            return None
+        if not DISKCACHE_AVAILABLE:
+            logger.warning("GROK_DISK_CACHE_DIR is set but diskcache is not installed")
+            return None
+        return diskcache.Cache(directory, size_limit=2**30)
+
+    def _get_async_client(self) -> Optional[AsyncClient]:  # type: ignore[type-arg]
+        """Shared AsyncClient for the running event loop (None when not live)."""
+        if not self._client:
+            return None
+        try:
+            return _shared_async_client(self.api_key)  # type: ignore[arg-type]
+        except Exception as e:
+            logger.warning("Failed to initialize async xAI client: %s", e)
+            return None
+
+    async def aclose(self) -> None:
+        """
+        Close the shared xAI clients for this API key (call on shutdown).
+        Every adapter using the same key shares these clients.
+        """
+        if not self.api_key:
+            return
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.pop(self.api_key, None)
+            async_clients = [
+                clients.pop(self.api_key)
+                for clients in _ACLIENT_CACHE.values()
+                if self.api_key in clients
+            ]
+        if client is not None:
+            client.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+        for async_client in async_clients:
+            try:
+                await async_client.close()
+            except Exception as e:  # Channel may belong to another (closed) loop
+                logger.debug("Failed to close async xAI client: %s", e)
+
     def _structured_call(
         self,
         *,
@@ -147,100 +861,507 @@ class GrokAdapter:
         """
         Perform a structured chat call via xai-sdk if available.
         Includes rate limiting and proper error handling.
+
+        Concurrent calls from other threads with identical (model, prompts, schema)
+        share a single API request, like the async path.
         """
         if not self._client:
             logger.debug("No client available, returning None")
             return None
 
+        key = self._request_key(model, system_prompt, user_prompt, schema)
+        cached = self._cached_response(key, model, user_prompt, schema)
+        if cached is not None:
+            return cached
+
+        with self._inflight_lock:
+            future = self._inflight_sync.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight_sync[key] = concurrent.futures.Future()
+
+        if not is_leader:
+            logger.debug("Joining in-flight API call")
+            payload = future.result()
+            return payload.model_copy(deep=True) if payload is not None else None
+
         try:
-            # Apply rate limiting with appropriate category
-            category = (
-                "grok_reasoning" if model == self.reasoning_model else "grok_fast"
+            payload = self._send_structured_call(
+                model=model,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                schema=schema,
             )
-            self.rate_limiter.wait_if_needed(category)
+            self._store_response(key, model, user_prompt, schema, payload)
+            future.set_result(payload)
+            return payload
+        except BaseException as exc:
+            # Followers see the leader's failure rather than a silent None
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight_sync[key]
+
+    def _send_structured_call(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel],
+    ) -> Optional[BaseModel]:
+        """Issue one blocking structured call (rate limited, retrying overload errors)."""
+        try:
+            # Apply rate limiting with appropriate category
+            category = self._rate_limit_category(model)
+            for attempt in range(self.max_retries + 1):
+                self._wait_for_rate_limit(category, system_prompt, user_prompt)
 
-            logger.debug(
-                f"Making API call to model {model} with rate limit category {category}"
-            )
+                logger.debug(
+                    "Making API call to model %s with rate limit category %s", model, category
+                )
 
-            # Try the current API pattern first
-            try:
                 chat = self._client.chat.create(model=model)
-                chat.append(system(system_prompt))
+                chat.append(_system_message(system_prompt))
                 chat.append(user(user_prompt))
-                _, payload = chat.parse(schema)  # type: ignore[arg-type]
+                start_ns = time.perf_counter_ns()
+                try:
+                    response, payload = chat.parse(schema)  # type: ignore[arg-type]
+                except Exception as e:
+                    _record_grok_call(start_ns, error=True)
+                    delay = self._retry_delay(attempt, e)
+                    if delay is None:
+                        raise
+                    logger.warning("API call overloaded (%s), retrying in %.2fs", e, delay)
+                    time.sleep(delay)
+                    continue
+                _record_grok_call(start_ns, response=response)
                 logger.debug("API call successful")
                 return payload
-            except AttributeError:
-                # Fallback for potential API changes in newer versions
-                logger.debug("Trying alternative API pattern")
-                # If the API has changed, we might need different method calls
-                # For now, fall back to the error case
-                raise
 
         except Exception as e:
-            logger.error(f"API call failed: {e}", exc_info=True)
+            logger.error("API call failed: %s", e, exc_info=True)
+        return None
+
+    def _retry_delay(self, attempt: int, exc: BaseException) -> Optional[float]:
+        """Seconds to back off before retrying exc, or None if it shouldn't be retried."""
+        if attempt >= self.max_retries or not is_overload_error(exc):
             return None
+        # Full jitter keeps concurrent callers from retrying in lockstep
+        delay = random.uniform(0, min(_MAX_BACKOFF, _BASE_BACKOFF * 2**attempt))
+        return max(delay, retry_after_seconds(exc) or 0.0)
 
-    # ---------------------------------------------------------------------
-    # Public high-level helpers
-    # ---------------------------------------------------------------------
+    async def _structured_call_async(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel],
+    ) -> Optional[BaseModel]:
+        """
+        Async version of _structured_call using the xai-sdk AsyncClient.
+        Awaits both the rate limiter and the API call, so no thread is held per request.
 
-    def summarize_user(self, handle: str, recent_posts: List[str]) -> IntelSummary:
-        prompt = "\n".join(recent_posts[:5]) or "No recent posts"
-        payload = self._structured_call(
-            model=self.fast_model,
-            system_prompt="Summarize the following X account for an operator dashboard.",
-            user_prompt=f"Handle: {handle}\nRecent posts:\n{prompt}",
-            schema=IntelSummary,
-        )
-        if isinstance(payload, IntelSummary):
-            return payload
-        raise RuntimeError(
-            f"Grok API call failed for summarize_user({handle}). No fallback available."
-        )
+        Concurrent calls with identical (model, prompts, schema) share a single API
+        request: the first caller starts it in a task and every caller awaits that task,
+        so cancelling one caller doesn't fail the others.
+        """
+        if not self._client:
+            logger.debug("No client available, returning None")
+            return None
 
-    def monitor_topic(self, topic: str) -> MonitorInsight:
-        payload = self._structured_call(
-            model=self.fast_model,
-            system_prompt="Provide a short monitor insight for a live-ops dashboard.",
-            user_prompt=f"Topic: {topic}\nNeed headline + impact score + tags.",
-            schema=MonitorInsight,
-        )
-        if isinstance(payload, MonitorInsight):
-            return payload
-        raise RuntimeError(
-            f"Grok API call failed for monitor_topic({topic}). No fallback available."
-        )
+        key = self._request_key(model, system_prompt, user_prompt, schema)
+        cached = self._cached_response(key, model, user_prompt, schema)
+        if cached is not None:
+            return cached
 
-    def fact_check(self, url: str, text: str) -> FactCheckReport:
-        payload = self._structured_call(
-            model=self.reasoning_model,
-            system_prompt="Fact check the provided X post. Respond with a structured verdict.",
-            user_prompt=f"URL: {url}\nText:\n{text}",
-            schema=FactCheckReport,
-        )
-        if isinstance(payload, FactCheckReport):
-            return payload
-        raise RuntimeError(
-            f"Grok API call failed for fact_check({url}). No fallback available."
+        task = self._inflight.get(key)
+        if task is not None:
+            logger.debug("Joining in-flight API call")
+            payload = await asyncio.shield(task)
+            # Results hold mutable lists, so each caller gets its own copy
+            return payload.model_copy(deep=True) if payload is not None else None
+
+        task = asyncio.ensure_future(
+            self._send_and_store_async(key, model, system_prompt, user_prompt, schema)
         )
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
 
-    def digest(self, highlights: List[str]) -> DigestOverview:
-        prompt = "\n".join(f"- {item}" for item in highlights) or "No highlights yet."
-        payload = self._structured_call(
-            model=self.reasoning_model,
-            system_prompt="Produce an executive digest for a social-ops dashboard.",
-            user_prompt=prompt,
-            schema=DigestOverview,
+    async def _send_and_store_async(
+        self,
+        key: str,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel],
+    ) -> Optional[BaseModel]:
+        """Send one coalesced structured call and cache its result."""
+        payload = await self._send_structured_call_async(
+            model=model,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            schema=schema,
+        )
+        self._store_response(key, model, user_prompt, schema, payload)
+        return payload
+
+    async def _send_structured_call_async(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel],
+    ) -> Optional[BaseModel]:
+        """Issue one async structured call (rate limited, with backpressure)."""
+        async_client = self._get_async_client()
+        if async_client is None:
+            return None
+
+        category = self._rate_limit_category(model)
+        controller = self._backpressure[category]
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                # The circuit breaker is checked first so an open circuit fails fast
+                async with controller.slot():
+                    await self._wait_for_rate_limit_async(category, system_prompt, user_prompt)
+
+                    logger.debug(
+                        "Making async API call to model %s with rate limit category %s",
+                        model,
+                        category,
+                    )
+
+                    chat = async_client.chat.create(model=model)
+                    chat.append(_system_message(system_prompt))
+                    chat.append(user(user_prompt))
+
+                    start_ns = time.perf_counter_ns()
+                    try:
+                        response, payload = await chat.parse(schema)  # type: ignore[arg-type]
+                    except Exception as e:
+                        _record_grok_call(start_ns, error=True)
+                        if is_overload_error(e):
+                            controller.record_failure(retry_after_seconds(e))
+                        delay = self._retry_delay(attempt, e)
+                        if delay is None:
+                            raise
+                        logger.warning(
+                            "Async API call overloaded (%s), retrying in %.2fs", e, delay
+                        )
+                    else:
+                        controller.record_success(
+                            _record_grok_call(start_ns, response=response) / 1e9
+                        )
+                        logger.debug("Async API call successful")
+                        return payload
+
+                # Back off outside the slot so other calls can use it meanwhile
+                await asyncio.sleep(delay)
+
+        except CircuitOpenError as e:
+            logger.warning("Skipping API call: %s", e)
+        except Exception as e:
+            logger.error("Async API call failed: %s", e, exc_info=True)
+        return None
+
+    async def _deferred_structured_call_async(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel],
+    ) -> Optional[BaseModel]:
+        """
+        Issue one structured call as a deferred completion.
+
+        The request is queued server-side and polled until done, so it does not hold
+        a backpressure slot while waiting. Only the submission is rate limited.
+        """
+        async_client = self._get_async_client()
+        if async_client is None:
+            return None
+
+        category = self._rate_limit_category(model)
+
+        try:
+            await self._wait_for_rate_limit_async(category, system_prompt, user_prompt)
+
+            chat = async_client.chat.create(model=model, response_format=_response_format(schema))
+            chat.append(_system_message(system_prompt))
+            chat.append(user(user_prompt))
+
+            start_ns = time.perf_counter_ns()
+            try:
+                response = await chat.defer(timeout=_DEFERRED_TIMEOUT)
+            except Exception:
+                _record_grok_call(start_ns, error=True)
+                raise
+            _record_grok_call(start_ns, response=response)
+            return schema.model_validate_json(response.content)
+
+        except Exception as e:
+            logger.error("Deferred API call failed: %s", e, exc_info=True)
+            return None
+
+    async def _stream_structured_call_async(
+        self,
+        *,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a structured call, yielding the fields parsed so far each time a
+        top-level JSON member closes. The last item holds every field returned.
+
+        The backpressure slot is held until the stream ends, so callers must aclose()
+        the generator if they stop early. Time spent in the consumer is left out of
+        the latency sample.
+        """
+        async_client = self._get_async_client()
+        if async_client is None:
+            return
+
+        category = self._rate_limit_category(model)
+        controller = self._backpressure[category]
+
+        try:
+            async with controller.slot():
+                await self._wait_for_rate_limit_async(category, system_prompt, user_prompt)
+
+                chat = async_client.chat.create(model=model, response_format=_response_format(schema))
+                chat.append(_system_message(system_prompt))
+                chat.append(user(user_prompt))
+
+                parser = _PartialJSONObject()
+                response = None
+                start_ns = time.perf_counter_ns()
+                try:
+                    async for response, chunk in chat.stream():
+                        fields = parser.feed(chunk.content)
+                        if fields is not None:
+                            paused_ns = time.perf_counter_ns()
+                            yield fields
+                            # Shift the start past the consumer's turn
+                            start_ns += time.perf_counter_ns() - paused_ns
+                except Exception as e:
+                    _record_grok_call(start_ns, error=True)
+                    if is_overload_error(e):
+                        controller.record_failure(retry_after_seconds(e))
+                    raise
+                controller.record_success(_record_grok_call(start_ns, response=response) / 1e9)
+
+        except CircuitOpenError as e:
+            logger.warning("Skipping API call: %s", e)
+        except Exception as e:
+            logger.error("Streaming API call failed: %s", e, exc_info=True)
+
+    def _cached_response(
+        self, key: str, model: str, user_prompt: str, schema: type[BaseModel]
+    ) -> Optional[BaseModel]:
+        payload = self._response_cache.get(key)
+        if payload is None and self._disk_cache is not None:
+            payload = self._disk_cache.get(key)
+            if payload is not None:
+                self._response_cache.set(key, payload, ttl=self._response_ttl(schema))
+        if payload is None and self._similar_cache is not None and schema in _SIMILARITY_SCHEMAS:
+            payload = self._similar_cache.get(
+                self._similarity_bucket(model, user_prompt, schema), user_prompt
+            )
+        if payload is None:
+            return None
+        logger.debug("Serving API call from response cache")
+        # Parsing the stored JSON in pydantic-core is ~3x cheaper than a deep copy
+        try:
+            result = schema.model_validate_json(payload)
+        except ValueError:  # Persisted by an older version of the schema
+            return None
+        if isinstance(result, TopicDigest):
+            # Stamped like a digest-cache hit, not with the stored call's time
+            result = result.model_copy(update={"generated_at": datetime.now(timezone.utc)})
+        return result
+
+    def _store_response(
+        self,
+        key: str,
+        model: str,
+        user_prompt: str,
+        schema: type[BaseModel],
+        payload: Optional[BaseModel],
+    ) -> None:
+        if not isinstance(payload, schema):
+            return
+        # Stored as JSON so every hit builds a fresh instance with its own lists
+        stored = payload.model_dump_json()
+        ttl = self._response_ttl(schema)
+        self._response_cache.set(key, stored, ttl=ttl)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, stored, expire=ttl)
+        if self._similar_cache is not None and schema in _SIMILARITY_SCHEMAS:
+            self._similar_cache.set(
+                self._similarity_bucket(model, user_prompt, schema), user_prompt, stored
+            )
+
+    def _response_ttl(self, schema: type[BaseModel]) -> float:
+        return min(_RESPONSE_TTL.get(schema, self.response_cache_ttl), self.response_cache_ttl)
+
+    @staticmethod
+    def _similarity_bucket(model: str, user_prompt: str, schema: type[BaseModel]) -> Tuple[str, ...]:
+        """Near-duplicate hits must match exactly on model, schema and identity lines."""
+        identity = (line for line in user_prompt.splitlines() if line.startswith(_IDENTITY_PREFIXES))
+        return (model, schema.__name__, *identity)
+
+    @staticmethod
+    def _request_key(
+        model: str, system_prompt: str, user_prompt: str, schema: type[BaseModel]
+    ) -> str:
+        """Stable hash identifying a structured call."""
+        key = "\0".join((model, system_prompt, user_prompt, schema.__name__))
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def _rate_limit_category(self, model: str) -> str:
+        """Map a model name to its rate limit category."""
+        return "grok_reasoning" if model == self.reasoning_model else "grok_fast"
+
+    def _rate_limit_costs(
+        self, category: str, system_prompt: str, user_prompt: str
+    ) -> Dict[str, float]:
+        """One request, plus estimated prompt + completion tokens if a token limit is set."""
+        costs: Dict[str, float] = {category: 1}
+        token_category = f"{category}_tokens"
+        if token_category in self.rate_limiter.configs:
+            costs[token_category] = (
+                _estimate_tokens(len(system_prompt) + len(user_prompt)) + _COMPLETION_TOKENS
+            )
+        return costs
+
+    def _wait_for_rate_limit(self, category: str, system_prompt: str, user_prompt: str) -> None:
+        """Book the request and token limits together, sleeping once for the longer wait."""
+        self.rate_limiter.wait_for_all(self._rate_limit_costs(category, system_prompt, user_prompt))
+
+    async def _wait_for_rate_limit_async(
+        self, category: str, system_prompt: str, user_prompt: str
+    ) -> None:
+        """Async version of _wait_for_rate_limit."""
+        await self.rate_limiter.wait_for_all_async(
+            self._rate_limit_costs(category, system_prompt, user_prompt)
         )
-        if isinstance(payload, DigestOverview):
-            return payload
-        raise RuntimeError(f"Grok API call failed for digest(). No fallback available.")
 
     # ---------------------------------------------------------------------
-    # X Terminal specific methods
-    # ---------------------------------------------------------------------
+    # Public high-level helpers
+    # ---------------------------------------------------------------------
+
+    def summarize_user(self, handle: str, recent_posts: List[str]) -> IntelSummary:
+        """Summarize an account's recent posts. No posts returns an empty summary without a call."""
+        if not recent_posts:
+            return self._empty_intel_summary(handle)
+        payload = self._structured_call(**self._summarize_user_request(handle, recent_posts))
+        if isinstance(payload, IntelSummary):
+            return payload
+        raise RuntimeError(
+            f"Grok API call failed for summarize_user({handle}). No fallback available."
+        )
+
+    def monitor_topic(self, topic: str) -> MonitorInsight:
+        payload = self._structured_call(**self._monitor_topic_request(topic))
+        if isinstance(payload, MonitorInsight):
+            return payload
+        raise RuntimeError(
+            f"Grok API call failed for monitor_topic({topic}). No fallback available."
+        )
+
+    def fact_check(self, url: str, text: str) -> FactCheckReport:
+        """Fact check a post. Blank text returns an 'unclear' verdict without a call."""
+        if not text.strip():
+            return self._empty_fact_check(url)
+        payload = self._structured_call(**self._fact_check_request(url, text))
+        if isinstance(payload, FactCheckReport):
+            return payload
+        raise RuntimeError(
+            f"Grok API call failed for fact_check({url}). No fallback available."
+        )
+
+    def digest(self, highlights: List[str]) -> DigestOverview:
+        """Digest operator highlights. No highlights returns an empty digest without a call."""
+        if not highlights:
+            return self._empty_digest_overview()
+        payload = self._structured_call(**self._digest_request(highlights))
+        if isinstance(payload, DigestOverview):
+            return payload
+        raise RuntimeError(f"Grok API call failed for digest(). No fallback available.")
+
+    # Degenerate inputs are answered locally and never consume rate limit quota
+
+    def _empty_intel_summary(self, handle: str) -> IntelSummary:
+        return IntelSummary(
+            handle=handle,
+            summary="No recent posts to summarize",
+            top_topics=[],
+            sentiment="neutral",
+            recent_activity=[],
+        )
+
+    def _empty_fact_check(self, url: str) -> FactCheckReport:
+        return FactCheckReport(
+            url=url,
+            verdict="unclear",
+            rationale="No text was provided to fact check",
+            confidence="low",
+        )
+
+    def _empty_digest_overview(self) -> DigestOverview:
+        return DigestOverview(
+            generated_at=datetime.now(timezone.utc),
+            highlights=[],
+            risk_outlook="No highlights yet; nothing to assess.",
+            recommended_actions=["Continue monitoring for activity"],
+        )
+
+    def _summarize_user_request(self, handle: str, recent_posts: List[str]) -> Dict[str, Any]:
+        prompt = _join_lines(islice(recent_posts, 5))
+        return dict(
+            model=self.fast_model,
+            system_prompt=_SYSTEM_SUMMARIZE_USER,
+            user_prompt=f"Handle: {handle}\nRecent posts:\n{prompt}",
+            schema=IntelSummary,
+        )
+
+    def _monitor_topic_request(self, topic: str) -> Dict[str, Any]:
+        return dict(
+            model=self.fast_model,
+            system_prompt=_SYSTEM_MONITOR_TOPIC,
+            user_prompt=f"Topic: {topic}",
+            schema=MonitorInsight,
+        )
+
+    def _fact_check_request(self, url: str, text: str) -> Dict[str, Any]:
+        return dict(
+            model=self.reasoning_model,
+            system_prompt=_SYSTEM_FACT_CHECK,
+            user_prompt=f"URL: {url}\nText:\n{text}",
+            schema=FactCheckReport,
+        )
+
+    def _digest_request(self, highlights: List[str]) -> Dict[str, Any]:
+        prompt = _join_lines(highlights, prefix="- ")
+        return dict(
+            model=self.reasoning_model,
+            system_prompt=_SYSTEM_DIGEST,
+            user_prompt=prompt,
+            schema=DigestOverview,
+        )
+
+    # ---------------------------------------------------------------------
+    # X Terminal specific methods
+    # ---------------------------------------------------------------------
 
     def summarize_bar(
         self, topic: str, ticks: List[Tick], start_time: datetime, end_time: datetime
@@ -259,158 +1380,205 @@ class GrokAdapter:
             BarSummary with sentiment as float (0.0-1.0) and highlight_posts
         """
         if not ticks:
-            return BarSummary(
-                summary="No posts in this time window",
-                key_themes=[],
-                sentiment=0.5,  # Neutral
-                post_count=0,
-                engagement_level="low",
-                highlight_posts=[],
-            )
+            return self._empty_bar_summary()
 
-        # Select highlight posts (top 1-2 by engagement)
-        highlight_posts = self._select_highlight_posts(ticks)
+        cache_key = self._bar_cache_key(topic, ticks, start_time, end_time)
+        cached = self._bar_cache.get(cache_key)
+        if cached is not None:
+            # Engagement may have moved since the summary was cached
+            return cached.model_copy(update={"highlight_posts": _highlight_ids(ticks)}, deep=True)
 
-        # Create a readable representation of the posts
-        posts_text = "\n".join(
-            [
-                f"@{tick.author}: {tick.text[:200]}..."
-                for tick in ticks[:10]  # Limit to first 10 posts for summary
-            ]
+        batch = _TickBatch(ticks)
+        if batch.legit_ticks:
+            # Select highlight posts (top 1-2 by engagement)
+            highlight_posts = batch.top_ids(2)
+
+            payload = self._structured_call(
+                **self._summarize_bar_request(topic, batch, start_time, end_time, highlight_posts)
+            )
+            summary = self._finalize_bar_summary(topic, payload, batch, highlight_posts)
+        else:
+            summary = self._spam_only_bar_summary(ticks)
+        self._bar_cache.set(cache_key, summary.model_copy(deep=True))
+        return summary
+
+    @staticmethod
+    def _bar_cache_key(
+        topic: str, ticks: List[Tick], start_time: datetime, end_time: datetime
+    ) -> bytes:
+        """Content hash of a bar: topic, window and the IDs of its ticks."""
+        # One join + encode is several times cheaper than an update() per tick
+        key = "\0".join(
+            [topic, str(start_time.timestamp()), str(end_time.timestamp()), *(t.id for t in ticks)]
+        )
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+    def _empty_bar_summary(self) -> BarSummary:
+        return BarSummary(
+            summary="No posts in this time window",
+            key_themes=[],
+            sentiment=0.5,  # Neutral
+            post_count=0,
+            engagement_level="low",
+            highlight_posts=[],
         )
 
-        time_range = f"{start_time.strftime('%H:%M')}-{end_time.strftime('%H:%M')}"
+    def _spam_only_bar_summary(self, ticks: List[Tick]) -> BarSummary:
+        return BarSummary(
+            summary="No legitimate posts in this time window",
+            key_themes=["High spam ratio"],
+            sentiment=0.5,  # Neutral
+            post_count=len(ticks),
+            engagement_level="low",
+            highlight_posts=[],
+        )
+
+    def _summarize_bar_request(
+        self,
+        topic: str,
+        batch: _TickBatch,
+        start_time: datetime,
+        end_time: datetime,
+        highlight_posts: List[str],
+    ) -> Dict[str, Any]:
+        ticks, legit_ticks = batch.ticks, batch.legit_ticks
+        # Most engaging posts claim the token budget first, then read chronologically
+        posts_text, included = _build_posts_text(
+            batch.sample(self.bar_sample_k), self.prompt_token_budget
+        )
 
         user_prompt = f"""Topic: {topic}
-Time Window: {time_range}
-Posts ({len(ticks)} total):
+Time Window: {_format_time_window(start_time, end_time)}
+Posts ({len(ticks)} total, {batch.spam_count} spam removed, showing {included} of {len(legit_ticks)}):
 
 {posts_text}
 
-{"... and " + str(len(ticks) - 10) + " more posts" if len(ticks) > 10 else ""}
-
 Highlight post IDs: {highlight_posts}"""
 
-        payload = self._structured_call(
+        return dict(
             model=self.fast_model,
-            system_prompt="""You are a critical analyst summarizing social media posts for a professional trading/monitoring dashboard.
-
-SPAM FILTERING (CRITICAL - apply first):
-Identify and EXCLUDE these from your summary:
-- Giveaway scams ("Send X get Y back", "Free BTC/ETH")
-- Trading signal promotions ("Join my group", "100x gains")
-- Bot-like repetitive content
-- Wallet address begging
-- Obvious pump-and-dump shills
-- "DM me" or follow-bait posts
-
-Your summary should focus ONLY on legitimate content. Only include posts that are not spam or scams. If there are no posts that are not spam or scams, say nothing, and return an empty output.
-
-If there are spam, do not mention it at all. Again, say nothing if no legitimate posts exist.
-
-SENTIMENT SCORING (based on NON-SPAM content only):
-- 0.0-0.3: Very negative (panic, crashes, scams exposed, major bad news)
-- 0.3-0.6: Negative (concerns, doubt, bearish sentiment, criticism)
-- 0.6-0.7: Neutral (mixed signals, factual updates, no clear direction)
-- 0.7-0.8: Positive (optimism, good news, bullish but measured)
-- 0.8-1.0: Very positive (euphoria, major wins, breakthrough news)
-
-ANALYSIS RULES:
-1. Base sentiment ONLY on legitimate posts, not spam
-2. "Moon" talk without substance = skeptical (0.5-0.6 max)
-3. Distinguish genuine news from hype
-4. If >50% spam, add "High spam ratio" to key_themes
-5. Default to neutral (0.5) when content is mostly noise
-
-KEY_THEMES should reflect actual topics discussed (excluding spam). If spam dominates, include "High spam ratio" as a theme.
-
-HIGHLIGHT_POSTS should be from legitimate content only, not spam.""",
+            system_prompt=_SYSTEM_BAR_SUMMARY,
             user_prompt=user_prompt,
             schema=BarSummary,
         )
 
+    def _finalize_bar_summary(
+        self,
+        topic: str,
+        payload: Optional[BaseModel],
+        batch: _TickBatch,
+        highlight_posts: List[str],
+    ) -> BarSummary:
         if isinstance(payload, BarSummary):
-            # Ensure post_count matches actual data
-            payload.post_count = len(ticks)
-            # Set highlight posts
-            payload.highlight_posts = highlight_posts
-            return payload
+            # post_count must match the actual data; highlights are picked locally
+            update: Dict[str, Any] = {
+                "post_count": len(batch.ticks),
+                "highlight_posts": highlight_posts,
+            }
+            # Spam was filtered locally, so flag it here rather than in the prompt
+            spam_ratio = batch.spam_count / len(batch.ticks)
+            if spam_ratio > _HIGH_SPAM_RATIO and "High spam ratio" not in payload.key_themes:
+                update["key_themes"] = [*payload.key_themes, "High spam ratio"]
+            return payload.model_copy(update=update)
 
         raise RuntimeError(
             f"Grok API call failed for summarize_bar({topic}). No fallback available."
         )
 
-    def _select_highlight_posts(self, ticks: List[Tick]) -> List[str]:
-        """
-        Select 1-2 highlight posts based on engagement and recency.
-
-        Returns:
-            List of post IDs (1-2 highlights)
-        """
-        if not ticks:
-            return []
-
-        def calculate_engagement(tick: Tick) -> int:
-            metrics = tick.metrics or {}
-            return (
-                metrics.get("like_count", 0) * 3
-                + metrics.get("retweet_count", 0) * 5
-                + metrics.get("reply_count", 0) * 2
-                + metrics.get("quote_count", 0) * 4
-            )
-
-        # Sort by engagement (desc), then by recency (desc)
-        sorted_ticks = sorted(
-            ticks, key=lambda t: (calculate_engagement(t), t.timestamp), reverse=True
-        )
-
-        # Return IDs of top 1-2 posts
-        return [tick.id for tick in sorted_ticks[:2]]
-
     def create_topic_digest(
-        self, topic: str, bars_data: List[Dict[str, Any]], lookback_hours: int = 1
+        self,
+        topic: str,
+        bars_data: List[Dict[str, Any]],
+        lookback_hours: int = 1,
+        now: Optional[datetime] = None,
     ) -> TopicDigest:
         """
         Create a digest over multiple bars for a topic.
         Uses reasoning model for higher-quality analysis.
+
+        `now` stamps empty and cached digests; batch callers pass one shared value.
         """
         if not bars_data:
-            return TopicDigest(
-                topic=topic,
-                generated_at=datetime.now(timezone.utc),
-                time_range=f"Last {lookback_hours} hour(s)",
-                overall_summary="No recent activity to summarize",
-                key_developments=[],
-                trending_elements=[],
-                sentiment_trend="stable",
-                recommendations=["Continue monitoring for activity"],
-            )
+            return self._empty_topic_digest(topic, lookback_hours, now)
 
-        # Create a summary of the bars
-        bars_summary = "\n".join(
-            [
-                f"Bar {i + 1} ({bar.get('start', 'unknown')}): {bar.get('summary', 'No summary')} "
-                f"({bar.get('post_count', 0)} posts)"
-                for i, bar in enumerate(
-                    bars_data[-12:]
-                )  # Last 12 bars (assuming 5min bars = 1 hour)
-            ]
+        bars = _digest_bars(bars_data)
+        cache_key = self._digest_cache_key(topic, bars, len(bars_data), lookback_hours)
+        cached = self._cached_topic_digest(cache_key, now)
+        if cached is not None:
+            return cached
+
+        request = self._topic_digest_request(topic, bars, len(bars_data), lookback_hours)
+
+        payload = self._structured_call(**request)
+        digest = self._finalize_topic_digest(topic, payload)
+        self._digest_cache.set(cache_key, digest.model_copy(deep=True))
+        return digest
+
+    def _empty_topic_digest(
+        self, topic: str, lookback_hours: int, now: Optional[datetime] = None
+    ) -> TopicDigest:
+        return TopicDigest(
+            topic=topic,
+            generated_at=now or datetime.now(timezone.utc),
+            time_range=f"Last {lookback_hours} hour(s)",
+            overall_summary="No recent activity to summarize",
+            key_developments=[],
+            trending_elements=[],
+            sentiment_trend="stable",
+            recommendations=["Continue monitoring for activity"],
         )
 
+    def _topic_digest_request(
+        self, topic: str, bars: List[_DigestBar], total_bars: int, lookback_hours: int
+    ) -> Dict[str, Any]:
+        buf = io.StringIO()
+        write = buf.write
+        for i, bar in enumerate(bars, 1):
+            if i > 1:
+                write("\n")
+            write(
+                f"Bar {i} ({bar.start}): {bar.summary} "
+                f"({bar.post_count} posts, sentiment {_sentiment_label(bar.sentiment)})"
+            )
+        bars_summary = buf.getvalue()
+
         user_prompt = f"""Topic: {topic}
 Time Period: Last {lookback_hours} hour(s)
-Bar Summaries ({len(bars_data)} total bars):
+Bar Summaries ({total_bars} total bars):
 
 {bars_summary}"""
 
-        payload = self._structured_call(
+        return dict(
             model=self.reasoning_model,
-            system_prompt="""You are creating an executive digest for a topic's recent activity across multiple time windows.
-Provide contextual analysis of trends, developments, and recommendations for monitoring.""",
+            system_prompt=_SYSTEM_TOPIC_DIGEST,
             user_prompt=user_prompt,
             schema=TopicDigest,
         )
 
+    def _digest_cache_key(
+        self, topic: str, bars: List[_DigestBar], total_bars: int, lookback_hours: int
+    ) -> bytes:
+        """
+        Content hash over the bar fields a digest depends on.
+
+        Only the last _DIGEST_BARS bars reach the prompt, so the key covers just their stable
+        subset and a digest hit skips building the prompt altogether.
+        """
+        key = repr((self.reasoning_model, topic, lookback_hours, total_bars, *map(tuple, bars)))
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+    def _cached_topic_digest(
+        self, cache_key: bytes, now: Optional[datetime] = None
+    ) -> Optional[TopicDigest]:
+        """Return a copy of a cached digest stamped with a fresh generated_at, if any."""
+        cached = self._digest_cache.get(cache_key)
+        if cached is None:
+            return None
+        return cached.model_copy(
+            update={"generated_at": now or datetime.now(timezone.utc)}, deep=True
+        )
+
+    def _finalize_topic_digest(self, topic: str, payload: Optional[BaseModel]) -> TopicDigest:
         if isinstance(payload, TopicDigest):
             return payload
 
@@ -418,37 +1586,563 @@ Provide contextual analysis of trends, developments, and recommendations for mon
             f"Grok API call failed for create_topic_digest({topic}). No fallback available."
         )
 
+    def summarize_bars_batch(
+        self, jobs: List[Tuple[str, List[Tick], datetime, datetime]]
+    ) -> List[BarSummary]:
+        """
+        Summarize many bars with one structured call per _BAR_BATCH_SIZE bars.
+
+        Cached, empty and spam-only bars are answered locally; the rest share a
+        request (and a single rate limit slot) instead of a round-trip each. Unlike
+        rollup_topic, bars may belong to different topics and no digest is produced.
+
+        Args:
+            jobs: List of (topic, ticks, start_time, end_time) tuples
+
+        Returns:
+            BarSummary list in the same order as jobs
+        """
+        results, misses = self._cached_bar_batch(jobs)
+        batches = [_TickBatch(jobs[index][1]) for index, _ in misses]
+        pending = self._pending_bars(jobs, results, misses, batches)
+        for start in range(0, len(pending), _BAR_BATCH_SIZE):
+            group = pending[start : start + _BAR_BATCH_SIZE]
+            payload = self._structured_call(**self._bar_batch_request(group))
+            self._finalize_bar_batch(results, group, payload)
+        return results  # type: ignore[return-value]
+
+    def _cached_bar_batch(
+        self, jobs: List[Tuple[str, List[Tick], datetime, datetime]]
+    ) -> Tuple[List[Optional[BarSummary]], List[Tuple[int, bytes]]]:
+        """Fill in empty and cached bars; return (index, cache_key) of the cache misses."""
+        results: List[Optional[BarSummary]] = [None] * len(jobs)
+        misses: List[Tuple[int, bytes]] = []
+        for index, (topic, ticks, start_time, end_time) in enumerate(jobs):
+            if not ticks:
+                results[index] = self._empty_bar_summary()
+                continue
+            cache_key = self._bar_cache_key(topic, ticks, start_time, end_time)
+            cached = self._bar_cache.get(cache_key)
+            if cached is not None:
+                results[index] = cached.model_copy(
+                    update={"highlight_posts": _highlight_ids(ticks)}, deep=True
+                )
+            else:
+                misses.append((index, cache_key))
+        return results, misses
+
+    def _pending_bars(
+        self,
+        jobs: List[Tuple[str, List[Tick], datetime, datetime]],
+        results: List[Optional[BarSummary]],
+        misses: List[Tuple[int, bytes]],
+        batches: List[_TickBatch],
+    ) -> List[_PendingBar]:
+        """Fill in spam-only cache misses; return the bars that need a Grok summary."""
+        pending: List[_PendingBar] = []
+        for (index, cache_key), batch in zip(misses, batches):
+            topic, ticks, start_time, end_time = jobs[index]
+            if batch.legit_ticks:
+                pending.append(_PendingBar(index, topic, batch, start_time, end_time, cache_key))
+            else:
+                summary = self._spam_only_bar_summary(ticks)
+                self._bar_cache.set(cache_key, summary.model_copy(deep=True))
+                results[index] = summary
+        return pending
+
+    def _bar_batch_request(self, group: List[_PendingBar]) -> Dict[str, Any]:
+        if len(group) == 1:
+            bar = group[0]
+            return self._summarize_bar_request(
+                bar.topic, bar.batch, bar.start_time, bar.end_time, bar.batch.top_ids(2)
+            )
+
+        # The posts budget is shared by every bar in the prompt
+        token_budget = self.prompt_token_budget // len(group)
+
+        buf = io.StringIO()
+        write = buf.write
+        for i, bar in enumerate(group, 1):
+            batch = bar.batch
+            posts_text, included = _build_posts_text(batch.sample(self.bar_sample_k), token_budget)
+            window = _format_time_window(bar.start_time, bar.end_time)
+            write(
+                f"=== BAR {i}: {bar.topic} [{window}] ===\n"
+                f"Posts ({len(batch.ticks)} total, {batch.spam_count} spam removed, "
+                f"showing {included} of {len(batch.legit_ticks)}):\n{posts_text}\n\n"
+            )
+
+        return dict(
+            model=self.fast_model,
+            system_prompt=_SYSTEM_BAR_BATCH,
+            user_prompt=buf.getvalue(),
+            schema=BarSummaryBatch,
+        )
+
+    def _finalize_bar_batch(
+        self,
+        results: List[Optional[BarSummary]],
+        group: List[_PendingBar],
+        payload: Optional[BaseModel],
+    ) -> None:
+        if len(group) == 1:
+            summaries: List[Optional[BaseModel]] = [payload]
+        elif isinstance(payload, BarSummaryBatch) and len(payload.bars) == len(group):
+            summaries = list(payload.bars)
+        else:
+            topics = ", ".join(dict.fromkeys(bar.topic for bar in group))
+            raise RuntimeError(
+                f"Grok API call failed for summarize_bars_batch({topics}). No fallback available."
+            )
+
+        for bar, summary in zip(group, summaries):
+            result = self._finalize_bar_summary(bar.topic, summary, bar.batch, bar.batch.top_ids(2))
+            self._bar_cache.set(bar.cache_key, result.model_copy(deep=True))
+            results[bar.index] = result
+
+    def rollup_topic(
+        self,
+        topic: str,
+        windows: List[Tuple[List[Tick], datetime, datetime]],
+        lookback_hours: int = 1,
+    ) -> TopicRollup:
+        """
+        Summarize several bars and digest them in one structured call.
+
+        Replaces summarize_bar per window followed by create_topic_digest (N+1
+        round-trips) with a single call that sees every window's posts.
+
+        Args:
+            topic: Topic name
+            windows: List of (ticks, start_time, end_time) tuples, oldest first
+            lookback_hours: Period the digest covers
+
+        Returns:
+            TopicRollup with one BarSummary per window, in the same order
+        """
+        batches = [_TickBatch(ticks) for ticks, _, _ in windows]
+        if not any(batch.legit_ticks for batch in batches):
+            return self._empty_topic_rollup(topic, batches, lookback_hours)
+
+        payload = self._structured_call(
+            **self._topic_rollup_request(topic, windows, batches, lookback_hours)
+        )
+        return self._finalize_topic_rollup(topic, payload, batches)
+
+    def _topic_rollup_request(
+        self,
+        topic: str,
+        windows: List[Tuple[List[Tick], datetime, datetime]],
+        batches: List[_TickBatch],
+        lookback_hours: int,
+    ) -> Dict[str, Any]:
+        # Windows without legitimate posts are summarized locally and left out
+        live = [
+            (batch, start_time, end_time)
+            for batch, (_, start_time, end_time) in zip(batches, windows)
+            if batch.legit_ticks
+        ]
+        # The posts budget is shared by every window in the prompt
+        token_budget = self.prompt_token_budget // len(live)
+
+        buf = io.StringIO()
+        write = buf.write
+        write(f"Topic: {topic}\nTime Period: Last {lookback_hours} hour(s)\n")
+        for i, (batch, start_time, end_time) in enumerate(live, 1):
+            posts_text, included = _build_posts_text(batch.sample(self.bar_sample_k), token_budget)
+            write(
+                f"\n=== BAR {i} [{_format_time_window(start_time, end_time)}] ===\n"
+                f"Posts ({len(batch.ticks)} total, {batch.spam_count} spam removed, "
+                f"showing {included} of {len(batch.legit_ticks)}):\n{posts_text}\n"
+            )
+
+        return dict(
+            model=self.reasoning_model,
+            system_prompt=_SYSTEM_TOPIC_ROLLUP,
+            user_prompt=buf.getvalue(),
+            schema=TopicRollup,
+        )
+
+    def _empty_topic_rollup(
+        self, topic: str, batches: List[_TickBatch], lookback_hours: int
+    ) -> TopicRollup:
+        return TopicRollup(
+            bars=[
+                self._spam_only_bar_summary(batch.ticks) if batch.ticks else self._empty_bar_summary()
+                for batch in batches
+            ],
+            digest=self._empty_topic_digest(topic, lookback_hours),
+        )
+
+    def _finalize_topic_rollup(
+        self, topic: str, payload: Optional[BaseModel], batches: List[_TickBatch]
+    ) -> TopicRollup:
+        live_count = sum(1 for batch in batches if batch.legit_ticks)
+        if not isinstance(payload, TopicRollup) or len(payload.bars) != live_count:
+            raise RuntimeError(
+                f"Grok API call failed for rollup_topic({topic}). No fallback available."
+            )
+
+        summaries = iter(payload.bars)
+        bars = []
+        for batch in batches:
+            if batch.legit_ticks:
+                bars.append(
+                    self._finalize_bar_summary(topic, next(summaries), batch, batch.top_ids(2))
+                )
+            elif batch.ticks:
+                bars.append(self._spam_only_bar_summary(batch.ticks))
+            else:
+                bars.append(self._empty_bar_summary())
+        return payload.model_copy(update={"bars": bars})
+
     # -------------------------------------------------------------------------
-    # Async versions (run blocking calls in thread pool)
+    # Async versions (native xai-sdk AsyncClient, no thread pool)
     # -------------------------------------------------------------------------
 
+    async def summarize_user_async(self, handle: str, recent_posts: List[str]) -> IntelSummary:
+        """Async version of summarize_user."""
+        if not recent_posts:
+            return self._empty_intel_summary(handle)
+        payload = await self._structured_call_async(
+            **self._summarize_user_request(handle, recent_posts)
+        )
+        if isinstance(payload, IntelSummary):
+            return payload
+        raise RuntimeError(
+            f"Grok API call failed for summarize_user({handle}). No fallback available."
+        )
+
+    async def monitor_topic_async(self, topic: str) -> MonitorInsight:
+        """Async version of monitor_topic."""
+        payload = await self._structured_call_async(**self._monitor_topic_request(topic))
+        if isinstance(payload, MonitorInsight):
+            return payload
+        raise RuntimeError(
+            f"Grok API call failed for monitor_topic({topic}). No fallback available."
+        )
+
+    async def fact_check_async(self, url: str, text: str) -> FactCheckReport:
+        """Async version of fact_check."""
+        if not text.strip():
+            return self._empty_fact_check(url)
+        payload = await self._structured_call_async(**self._fact_check_request(url, text))
+        if isinstance(payload, FactCheckReport):
+            return payload
+        raise RuntimeError(
+            f"Grok API call failed for fact_check({url}). No fallback available."
+        )
+
+    async def digest_async(self, highlights: List[str]) -> DigestOverview:
+        """Async version of digest."""
+        if not highlights:
+            return self._empty_digest_overview()
+        payload = await self._structured_call_async(**self._digest_request(highlights))
+        if isinstance(payload, DigestOverview):
+            return payload
+        raise RuntimeError(f"Grok API call failed for digest(). No fallback available.")
+
     async def summarize_bar_async(
         self, topic: str, ticks: List[Tick], start_time: datetime, end_time: datetime
     ) -> BarSummary:
         """
         Async version of summarize_bar.
-        Runs the blocking xai-sdk call in a thread pool to avoid blocking the event loop.
+        Awaits the xai-sdk AsyncClient directly instead of occupying a thread-pool slot.
         """
-        return await asyncio.to_thread(
-            self.summarize_bar,
-            topic=topic,
-            ticks=ticks,
-            start_time=start_time,
-            end_time=end_time,
-        )
+        if not ticks:
+            return self._empty_bar_summary()
+
+        cache_key = self._bar_cache_key(topic, ticks, start_time, end_time)
+        cached = self._bar_cache.get(cache_key)
+        if cached is not None:
+            # Engagement may have moved since the summary was cached
+            return cached.model_copy(update={"highlight_posts": _highlight_ids(ticks)}, deep=True)
+
+        batch = await self._tick_batch_async(ticks)
+        if batch.legit_ticks:
+            highlight_posts = batch.top_ids(2)
+
+            payload = await self._structured_call_async(
+                **self._summarize_bar_request(topic, batch, start_time, end_time, highlight_posts)
+            )
+            summary = self._finalize_bar_summary(topic, payload, batch, highlight_posts)
+        else:
+            summary = self._spam_only_bar_summary(ticks)
+        self._bar_cache.set(cache_key, summary.model_copy(deep=True))
+        return summary
+
+    @staticmethod
+    async def _tick_batch_async(ticks: List[Tick]) -> _TickBatch:
+        """
+        Build the bar's _TickBatch, off the event loop for very large bars.
+
+        Spam scanning and scoring are O(N) Python work that has to finish before the
+        prompt (which embeds the highlight IDs) can be sent, so it cannot overlap the
+        Grok call itself. Running it in a worker thread keeps other bars' requests
+        moving while it runs.
+        """
+        if len(ticks) < _OFFLOAD_TICKS:
+            return _TickBatch(ticks)
+        return await asyncio.to_thread(_TickBatch, ticks)
 
     async def create_topic_digest_async(
-        self, topic: str, bars_data: List[Dict[str, Any]], lookback_hours: int = 1
+        self,
+        topic: str,
+        bars_data: List[Dict[str, Any]],
+        lookback_hours: int = 1,
+        now: Optional[datetime] = None,
     ) -> TopicDigest:
         """
         Async version of create_topic_digest.
-        Runs the blocking xai-sdk call in a thread pool to avoid blocking the event loop.
+        Awaits the xai-sdk AsyncClient directly instead of occupying a thread-pool slot.
         """
-        return await asyncio.to_thread(
-            self.create_topic_digest,
-            topic=topic,
-            bars_data=bars_data,
-            lookback_hours=lookback_hours,
+        if not bars_data:
+            return self._empty_topic_digest(topic, lookback_hours, now)
+
+        bars = _digest_bars(bars_data)
+        cache_key = self._digest_cache_key(topic, bars, len(bars_data), lookback_hours)
+        cached = self._cached_topic_digest(cache_key, now)
+        if cached is not None:
+            return cached
+
+        request = self._topic_digest_request(topic, bars, len(bars_data), lookback_hours)
+
+        payload = await self._structured_call_async(**request)
+        digest = self._finalize_topic_digest(topic, payload)
+        self._digest_cache.set(cache_key, digest.model_copy(deep=True))
+        return digest
+
+    async def rollup_topic_async(
+        self,
+        topic: str,
+        windows: List[Tuple[List[Tick], datetime, datetime]],
+        lookback_hours: int = 1,
+    ) -> TopicRollup:
+        """Async version of rollup_topic."""
+        batches = [_TickBatch(ticks) for ticks, _, _ in windows]
+        if not any(batch.legit_ticks for batch in batches):
+            return self._empty_topic_rollup(topic, batches, lookback_hours)
+
+        payload = await self._structured_call_async(
+            **self._topic_rollup_request(topic, windows, batches, lookback_hours)
+        )
+        return self._finalize_topic_rollup(topic, payload, batches)
+
+    async def summarize_bar_stream(
+        self, topic: str, ticks: List[Tick], start_time: datetime, end_time: datetime
+    ) -> AsyncIterator[BarSummary]:
+        """
+        Streaming version of summarize_bar_async.
+
+        Yields partial BarSummary objects as soon as each top-level field has been
+        generated (e.g. `summary` before `key_themes`), so a dashboard can start
+        rendering early. Partial items are built with model_construct and only carry
+        the fields received so far; the last item is the complete, validated summary.
+        """
+        if not ticks:
+            yield self._empty_bar_summary()
+            return
+
+        cache_key = self._bar_cache_key(topic, ticks, start_time, end_time)
+        cached = self._bar_cache.get(cache_key)
+        if cached is not None:
+            yield cached.model_copy(update={"highlight_posts": _highlight_ids(ticks)}, deep=True)
+            return
+
+        batch = await self._tick_batch_async(ticks)
+        if not batch.legit_ticks:
+            yield self._spam_only_bar_summary(ticks)
+            return
+
+        highlight_posts = batch.top_ids(2)
+        fields: Dict[str, Any] = {}
+        stream = self._stream_structured_call_async(
+            **self._summarize_bar_request(topic, batch, start_time, end_time, highlight_posts)
+        )
+        try:
+            async for fields in stream:
+                yield BarSummary.model_construct(**fields)
+        finally:
+            # Release the backpressure slot now if the consumer stops early
+            await stream.aclose()
+
+        try:
+            payload: Optional[BarSummary] = BarSummary.model_validate(fields)
+        except ValueError:
+            payload = None
+        summary = self._finalize_bar_summary(topic, payload, batch, highlight_posts)
+        self._bar_cache.set(cache_key, summary.model_copy(deep=True))
+        yield summary
+
+    async def create_topic_digest_stream(
+        self,
+        topic: str,
+        bars_data: List[Dict[str, Any]],
+        lookback_hours: int = 1,
+        now: Optional[datetime] = None,
+    ) -> AsyncIterator[TopicDigest]:
+        """
+        Streaming version of create_topic_digest_async.
+
+        Yields partial TopicDigest objects (built with model_construct) as each
+        top-level field arrives, so `overall_summary` can render before the lists
+        that follow it. The last item is the complete, validated digest.
+        """
+        if not bars_data:
+            yield self._empty_topic_digest(topic, lookback_hours, now)
+            return
+
+        bars = _digest_bars(bars_data)
+        cache_key = self._digest_cache_key(topic, bars, len(bars_data), lookback_hours)
+        cached = self._cached_topic_digest(cache_key, now)
+        if cached is not None:
+            yield cached
+            return
+
+        fields: Dict[str, Any] = {}
+        stream = self._stream_structured_call_async(
+            **self._topic_digest_request(topic, bars, len(bars_data), lookback_hours)
+        )
+        try:
+            async for fields in stream:
+                yield TopicDigest.model_construct(**fields)
+        finally:
+            # Release the backpressure slot now if the consumer stops early
+            await stream.aclose()
+
+        try:
+            payload: Optional[TopicDigest] = TopicDigest.model_validate(fields)
+        except ValueError:
+            payload = None
+        digest = self._finalize_topic_digest(topic, payload)
+        self._digest_cache.set(cache_key, digest.model_copy(deep=True))
+        yield digest
+
+    async def summarize_bars_async(
+        self,
+        jobs: List[Tuple[str, List[Tick], datetime, datetime]],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[BarSummary, BaseException]]:
+        """
+        Summarize many bars concurrently.
+
+        Args:
+            jobs: List of (topic, ticks, start_time, end_time) tuples
+            max_concurrency: Max in-flight calls (default: GROK_MAX_CONCURRENCY)
+            return_exceptions: Return a failed bar's exception in its slot instead of
+                raising, so one failure doesn't discard the rest of the batch
+
+        Returns:
+            BarSummary list in the same order as jobs
+        """
+        return await self._gather_bounded(
+            [self.summarize_bar_async(*job) for job in jobs], max_concurrency, return_exceptions
+        )
+
+    async def summarize_bars_batch_async(
+        self, jobs: List[Tuple[str, List[Tick], datetime, datetime]]
+    ) -> List[BarSummary]:
+        """Async version of summarize_bars_batch; the batched requests run concurrently."""
+        results, misses = self._cached_bar_batch(jobs)
+        batches = await asyncio.gather(
+            *(self._tick_batch_async(jobs[index][1]) for index, _ in misses)
+        )
+        pending = self._pending_bars(jobs, results, misses, batches)
+        groups = [
+            pending[start : start + _BAR_BATCH_SIZE]
+            for start in range(0, len(pending), _BAR_BATCH_SIZE)
+        ]
+        payloads = await asyncio.gather(
+            *(self._structured_call_async(**self._bar_batch_request(group)) for group in groups)
+        )
+        for group, payload in zip(groups, payloads):
+            self._finalize_bar_batch(results, group, payload)
+        return results  # type: ignore[return-value]
+
+    async def create_topic_digests_async(
+        self,
+        jobs: List[Tuple[str, List[Dict[str, Any]], int]],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[TopicDigest, BaseException]]:
+        """
+        Create digests for many topics concurrently.
+
+        Args:
+            jobs: List of (topic, bars_data, lookback_hours) tuples
+            max_concurrency: Max in-flight calls (default: GROK_MAX_CONCURRENCY)
+            return_exceptions: Return a failed topic's exception in its slot instead
+                of raising
+
+        Returns:
+            TopicDigest list in the same order as jobs
+        """
+        now = datetime.now(timezone.utc)
+        return await self._gather_bounded(
+            [self.create_topic_digest_async(*job, now=now) for job in jobs],
+            max_concurrency,
+            return_exceptions,
+        )
+
+    async def create_topic_digest_batch(
+        self, jobs: List[Tuple[str, List[Dict[str, Any]], int]]
+    ) -> List[TopicDigest]:
+        """
+        Create digests for non-realtime roll-ups (e.g. hourly jobs).
+
+        With GROK_USE_BATCH=1 every uncached digest is submitted as a deferred
+        completion and all of them are polled concurrently; otherwise this is the
+        same as create_topic_digests_async.
+
+        Args:
+            jobs: List of (topic, bars_data, lookback_hours) tuples
+
+        Returns:
+            TopicDigest list in the same order as jobs
+        """
+        if not self.use_batch:
+            return await self.create_topic_digests_async(jobs)
+
+        if self._get_async_client() is None:
+            raise RuntimeError("xAI SDK not available or API key not configured")
+
+        now = datetime.now(timezone.utc)
+
+        async def _one(topic: str, bars_data: List[Dict[str, Any]], lookback_hours: int) -> TopicDigest:
+            if not bars_data:
+                return self._empty_topic_digest(topic, lookback_hours, now)
+
+            bars = _digest_bars(bars_data)
+            cache_key = self._digest_cache_key(topic, bars, len(bars_data), lookback_hours)
+            cached = self._cached_topic_digest(cache_key, now)
+            if cached is not None:
+                return cached
+
+            request = self._topic_digest_request(topic, bars, len(bars_data), lookback_hours)
+
+            payload = await self._deferred_structured_call_async(**request)
+            digest = self._finalize_topic_digest(topic, payload)
+            self._digest_cache.set(cache_key, digest.model_copy(deep=True))
+            return digest
+
+        return list(await asyncio.gather(*(_one(*job) for job in jobs)))
+
+    async def _gather_bounded(
+        self,
+        coros: List[Awaitable[T]],
+        max_concurrency: Optional[int],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Await coroutines concurrently with at most max_concurrency running at once."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
+
+        async def _one(coro: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coro
+
+        return list(
+            await asyncio.gather(*(_one(coro) for coro in coros), return_exceptions=return_exceptions)
         )
 
 
@@ -460,4 +2154,6 @@ __all__ = [
     "DigestOverview",
     "BarSummary",
     "TopicDigest",
+    "TopicRollup",
+    "BarSummaryBatch",
 ]
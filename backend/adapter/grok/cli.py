@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timedelta, timezone
 from typing import List
 
+from pydantic import BaseModel
+
 from . import GrokAdapter
 from ..x import Tick
 
@@ -22,8 +25,8 @@ def _split_list(value: str) -> List[str]:
     return [item.strip() for item in value.split("|") if item.strip()]
 
 
-def _print(obj) -> None:
-    print(json.dumps(obj, indent=2, default=str))
+def _print(obj: BaseModel) -> None:
+    print(obj.model_dump_json(indent=2))
 
 
 def main() -> None:
@@ -52,26 +55,27 @@ def main() -> None:
             posts_raw = input("Recent posts (separate with |, optional): ").strip()
             posts = _split_list(posts_raw) if posts_raw else []
             summary = adapter.summarize_user(handle, posts)
-            _print(summary.model_dump())
+            _print(summary)
             continue
 
         if command == "factcheck":
             url = input("URL: ").strip() or "https://x.com/demo/status/1"
             text = input("Post text (optional): ").strip() or "Sample post text about Grok."
             report = adapter.fact_check(url, text)
-            _print(report.model_dump())
+            _print(report)
             continue
 
         if command == "digest":
             highlights_raw = input("Highlights (separate with |, optional): ").strip()
             highlights = _split_list(highlights_raw) if highlights_raw else []
             digest = adapter.digest(highlights)
-            _print(digest.model_dump())
+            _print(digest)
             continue
 
         if command == "barsum":
             topic = input('Topic (e.g. "$TSLA"): ').strip() or "$TSLA"
             posts_raw = input("Posts (format: author|text|author|text...): ").strip()
+            now = datetime.now(timezone.utc)
             ticks = []
             if posts_raw:
                 parts = posts_raw.split("|")
@@ -83,19 +87,15 @@ def main() -> None:
                             id=f"cli_{i//2}",
                             author=author,
                             text=text,
-                            timestamp=datetime.now(timezone.utc),
+                            timestamp=now,
                             permalink=f"https://twitter.com/{author}/status/cli_{i//2}",
                             metrics={"retweet_count": 0, "like_count": 0, "reply_count": 0, "quote_count": 0},
                             topic=topic
                         )
                         ticks.append(tick)
 
-            from datetime import datetime, timedelta, timezone
-            start_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-            end_time = datetime.now(timezone.utc)
-
-            summary = adapter.summarize_bar(topic, ticks, start_time, end_time)
-            _print(summary.model_dump())
+            summary = adapter.summarize_bar(topic, ticks, now - timedelta(minutes=5), now)
+            _print(summary)
             continue
 
         if command == "topicdig":
@@ -116,7 +116,7 @@ def main() -> None:
                     ]
 
             digest = adapter.create_topic_digest(topic, bars_data, lookback_hours=1)
-            _print(digest.model_dump())
+            _print(digest)
             continue
 
         print("Unknown command. Type 'help' to see options.")
@@ -1,22 +1,52 @@
 """
 Mock implementations for GrokAdapter fallback data.
 These are separated from the main adapter to avoid using fake data in production.
+
+Every value is generated locally with the declared field types, so models are built
+with model_construct and skip pydantic validation.
 """
 
 from __future__ import annotations
 
 import random
+import zlib
+from bisect import bisect_right
 from datetime import datetime, timezone
 from typing import List, Dict, Any
 
-from . import IntelSummary, FactCheckReport, DigestOverview, BarSummary, TopicDigest
+from . import (
+    _SENTIMENT_CUTS,
+    _SENTIMENT_LABELS,
+    BarSummary,
+    DigestOverview,
+    FactCheckReport,
+    IntelSummary,
+    TopicDigest,
+)
 from ..models import Tick
 
 
+# Draw pools, built once rather than on every mock call
+_INTEL_SENTIMENTS = ("positive", "neutral", "mixed", "skeptical")
+_INTEL_TOPICS = ("ai", "politics", "creators", "growth", "culture", "sports", "finance")
+_VERDICTS = ("true", "false", "unclear")
+_LEVELS = ("low", "medium", "high")
+_BASE_THEMES = ("discussion", "updates", "reactions", "analysis")
+_TECH_THEMES = _BASE_THEMES + ("innovation", "development", "trends")
+_FINANCE_THEMES = _BASE_THEMES + ("market", "investment", "analysis")
+_SENTIMENT_TRENDS = ("improving", "declining", "stable", "volatile")
+_TRENDING_ELEMENTS = (
+    "User engagement metrics",
+    "Content quality indicators",
+    "Cross-platform discussion",
+    "Influencer participation",
+)
+
+
 def mock_rng(seed_source: str) -> random.Random:
     """Create a deterministic random number generator for consistent mock data."""
-    seed = abs(hash(seed_source)) % (2**32)
-    return random.Random(seed)
+    # crc32 rather than hash(): str hashes are salted per process (PYTHONHASHSEED)
+    return random.Random(zlib.crc32(seed_source.encode()))
 
 
 def mock_intel_summary(handle: str, posts: List[str]) -> IntelSummary:
@@ -27,18 +57,15 @@ def mock_intel_summary(handle: str, posts: List[str]) -> IntelSummary:
         "Morning note on AI x politics crossover.",
         "Retweeting a hot take about creators' economy.",
     ]
-    sentiment = rng.choice(["positive", "neutral", "mixed", "skeptical"])
-    topics = rng.sample(
-        ["ai", "politics", "creators", "growth", "culture", "sports", "finance"],
-        k=3,
-    )
+    sentiment = rng.choice(_INTEL_SENTIMENTS)
+    topics = rng.sample(_INTEL_TOPICS, k=3)
     summary = (
         f"{handle} keeps a tight signal on {topics[0]} and blends it with "
         f"{topics[1]} commentary. Tone feels {sentiment} with regular "
         "threads that travel."
     )
     recent = [sample_posts[i % len(sample_posts)] for i in range(3)]
-    return IntelSummary(
+    return IntelSummary.model_construct(
         handle=handle,
         summary=summary,
         top_topics=topics,
@@ -50,8 +77,8 @@ def mock_intel_summary(handle: str, posts: List[str]) -> IntelSummary:
 def mock_fact_check_report(url: str, text: str) -> FactCheckReport:
     """Mock implementation of FactCheckReport for testing."""
     rng = mock_rng(url + text)
-    verdict = rng.choice(["true", "false", "unclear"])
-    confidence = rng.choice(["low", "medium", "high"])
+    verdict = rng.choice(_VERDICTS)
+    confidence = rng.choice(_LEVELS)
     rationale = (
         "Verified against archived statements and recent reporting."
         if verdict == "true"
@@ -59,7 +86,9 @@ def mock_fact_check_report(url: str, text: str) -> FactCheckReport:
         if verdict == "false"
         else "Source material is thin; more corroboration required."
     )
-    return FactCheckReport(url=url, verdict=verdict, rationale=rationale, confidence=confidence)
+    return FactCheckReport.model_construct(
+        url=url, verdict=verdict, rationale=rationale, confidence=confidence
+    )
 
 
 def mock_digest_overview(highlights: List[str]) -> DigestOverview:
@@ -70,7 +99,7 @@ def mock_digest_overview(highlights: List[str]) -> DigestOverview:
         "Add a fact-check flag to the contested link.",
         "Schedule a digest push to the leadership chat.",
     ]
-    return DigestOverview(
+    return DigestOverview.model_construct(
         generated_at=datetime.now(timezone.utc),
         highlights=base[:4],
         risk_outlook="Moderate risk. Sentiment is noisy but nothing is on fire.",
@@ -84,7 +113,7 @@ def mock_bar_summary(topic: str, ticks: List[Tick], start_time: datetime, end_ti
     post_count = len(ticks)
 
     if post_count == 0:
-        return BarSummary(
+        return BarSummary.model_construct(
             summary="No posts in this time window",
             key_themes=[],
             sentiment=0.5,  # Neutral
@@ -96,22 +125,24 @@ def mock_bar_summary(topic: str, ticks: List[Tick], start_time: datetime, end_ti
     highlight_posts = [tick.id for tick in ticks[:2]] if ticks else None
 
     # Generate plausible themes based on topic
-    base_themes = ["discussion", "updates", "reactions", "analysis"]
-    if "tech" in topic.lower() or "ai" in topic.lower():
-        base_themes.extend(["innovation", "development", "trends"])
-    elif "finance" in topic.lower() or "$" in topic:
-        base_themes.extend(["market", "investment", "analysis"])
+    lowered = topic.lower()
+    if "tech" in lowered or "ai" in lowered:
+        base_themes = _TECH_THEMES
+    elif "finance" in lowered or "$" in topic:
+        base_themes = _FINANCE_THEMES
+    else:
+        base_themes = _BASE_THEMES
 
     themes = rng.sample(base_themes, k=min(3, len(base_themes)))
     # Generate random sentiment as float (0.0-1.0)
     sentiment = round(rng.random(), 2)
-    engagement = rng.choice(["low", "medium", "high"])
+    engagement = rng.choice(_LEVELS)
     
     # Create sentiment label for summary text
-    sentiment_label = "positive" if sentiment > 0.6 else ("negative" if sentiment < 0.4 else "neutral")
+    sentiment_label = _SENTIMENT_LABELS[bisect_right(_SENTIMENT_CUTS, sentiment)]
     summary = f"{post_count} posts about {topic} with {sentiment_label} sentiment ({sentiment:.2f}) and {engagement} engagement."
 
-    return BarSummary(
+    return BarSummary.model_construct(
         summary=summary,
         key_themes=themes,
         sentiment=sentiment,
@@ -126,12 +157,12 @@ def mock_topic_digest(topic: str, bars_data: List[Dict[str, Any]], lookback_hour
     rng = mock_rng(f"{topic}_digest_{lookback_hours}")
 
     total_posts = sum(bar.get('post_count', 0) for bar in bars_data)
-    active_bars = len([b for b in bars_data if b.get('post_count', 0) > 0])
+    active_bars = sum(1 for b in bars_data if b.get('post_count', 0) > 0)
 
     time_range = f"Last {lookback_hours} hour(s)"
 
     if total_posts == 0:
-        return TopicDigest(
+        return TopicDigest.model_construct(
             topic=topic,
             generated_at=datetime.now(timezone.utc),
             time_range=time_range,
@@ -143,7 +174,7 @@ def mock_topic_digest(topic: str, bars_data: List[Dict[str, Any]], lookback_hour
         )
 
     # Generate plausible digest content
-    sentiment_trend = rng.choice(["improving", "declining", "stable", "volatile"])
+    sentiment_trend = rng.choice(_SENTIMENT_TRENDS)
 
     developments = [
         f"Consistent discussion across {active_bars} time windows",
@@ -151,12 +182,7 @@ def mock_topic_digest(topic: str, bars_data: List[Dict[str, Any]], lookback_hour
         "Community engagement shows steady patterns"
     ]
 
-    trending = rng.sample([
-        "User engagement metrics",
-        "Content quality indicators",
-        "Cross-platform discussion",
-        "Influencer participation"
-    ], k=rng.randint(1, 3))
+    trending = rng.sample(_TRENDING_ELEMENTS, k=rng.randint(1, 3))
 
     recommendations = [
         "Maintain current monitoring intensity",
@@ -166,7 +192,7 @@ def mock_topic_digest(topic: str, bars_data: List[Dict[str, Any]], lookback_hour
 
     overall_summary = f"{topic} shows {sentiment_trend} activity with {total_posts} total posts across {len(bars_data)} time windows."
 
-    return TopicDigest(
+    return TopicDigest.model_construct(
         topic=topic,
         generated_at=datetime.now(timezone.utc),
         time_range=time_range,
@@ -3,11 +3,32 @@ Shared data models for adapters.
 """
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterable, NamedTuple, Optional
 
 from pydantic import BaseModel, Field
 
 
+class Metrics(NamedTuple):
+    """Fixed-layout view of a tick's engagement counts."""
+
+    like_count: int = 0
+    retweet_count: int = 0
+    reply_count: int = 0
+    quote_count: int = 0
+
+    @classmethod
+    def from_dict(cls, metrics: Dict[str, int]) -> "Metrics":
+        get = metrics.get
+        return cls(
+            get("like_count", 0), get("retweet_count", 0), get("reply_count", 0), get("quote_count", 0)
+        )
+
+    @classmethod
+    def total(cls, items: Iterable["Metrics"]) -> "Metrics":
+        """Column-wise sum of many Metrics in one pass."""
+        return cls(*map(sum, zip(*items)))
+
+
 class Tick(BaseModel):
     """
     A single post (tweet) from X, representing a tick in our system.
@@ -27,6 +48,16 @@ class Tick(BaseModel):
     metrics: Dict[str, int] = Field(default_factory=dict, description="Engagement metrics")
     topic: str = Field(description="Topic this tick belongs to")
 
+    @property
+    def counts(self) -> Metrics:
+        """
+        Engagement metrics as a Metrics tuple.
+
+        Built on each access rather than cached, so it always reflects `metrics`,
+        including after model_copy(update=...) or in-place edits. Read it once per tick.
+        """
+        return Metrics.from_dict(self.metrics or {})
+
 
-__all__ = ["Tick"]
+__all__ = ["Metrics", "Tick"]
 
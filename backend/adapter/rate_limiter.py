@@ -7,11 +7,15 @@ Designed to be shared between X API and Grok API adapters.
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
 import time
 import logging
-from typing import Dict, List, Optional, Literal
+from typing import Callable, Deque, Dict, Optional, Literal
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import takewhile
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +25,38 @@ class RateLimitConfig:
     """Configuration for a specific rate limit."""
     requests_per_window: int
     window_seconds: int
-    strategy: Literal["sliding_window", "fixed_window", "token_bucket"] = "sliding_window"
+    strategy: Literal["sliding_window", "fixed_window", "token_bucket", "gcra"] = "sliding_window"
+    # Requests allowed back-to-back before GCRA spaces them out (gcra only)
+    burst: int = 1
+
+
+class _CompiledLimit:
+    """Constants derived from a RateLimitConfig, computed once in configure_limit."""
+
+    __slots__ = (
+        "reserve", "limit", "window_seconds", "emission_interval", "burst", "burst_allowance"
+    )
+
+    def __init__(self, config: RateLimitConfig, reserve: Callable[..., float]):
+        # The strategy's RateLimiter._reserve_* method, looked up once instead of per call
+        self.reserve = reserve
+        self.limit = config.requests_per_window
+        self.window_seconds = config.window_seconds
+        # Seconds per request (or token): the reciprocal of the refill rate
+        self.emission_interval = config.window_seconds / config.requests_per_window
+        self.burst = config.burst
+        # How far GCRA's theoretical arrival time may run ahead of now without waiting
+        self.burst_allowance = self.emission_interval * max(1, config.burst)
+
+
+class _FixedWindow:
+    """Mutable fixed-window state, updated in place on every reservation."""
+
+    __slots__ = ("window_start", "count")
+
+    def __init__(self, window_start: int, count: int):
+        self.window_start = window_start
+        self.count = count
 
 
 class RateLimiter:
@@ -31,142 +66,237 @@ class RateLimiter:
     Features:
     - Multiple time windows (per minute, 15-min, hourly, daily)
     - Different limits per category (e.g., search vs user_lookup vs ai_generation)
-    - Configurable strategies (sliding window, fixed window, token bucket)
+    - Configurable strategies (sliding window, fixed window, token bucket, GCRA)
     - Shared state across multiple API clients
     """
 
     def __init__(self):
-        # category -> list of (timestamp, count) tuples for sliding window
-        self.sliding_windows: Dict[str, List[float]] = defaultdict(list)
+        # category -> newest booked request timestamps for sliding window, oldest first
+        self.sliding_windows: Dict[str, Deque[float]] = defaultdict(deque)
 
-        # category -> (window_start, count) for fixed window
-        self.fixed_windows: Dict[str, tuple[int, int]] = {}
+        # category -> window start and request count for fixed window
+        self.fixed_windows: Dict[str, _FixedWindow] = {}
 
-        # category -> available tokens for token bucket
-        self.token_buckets: Dict[str, float] = {}
+        # category -> "zero time" for token bucket: the moment the bucket was (or will
+        # be) empty, so tokens available now are (now - zero_time) * rate, capped
+        self.token_zero_times: Dict[str, float] = {}
 
-        # Configuration per category
+        # Configuration per category, and its derived constants
         self.configs: Dict[str, RateLimitConfig] = {}
+        self._compiled: Dict[str, _CompiledLimit] = {}
+
+        # category -> theoretical arrival time (TAT) for GCRA
+        self.gcra_tats: Dict[str, float] = {}
 
-        # Last refill times for token buckets
-        self.last_refill: Dict[str, float] = {}
+        # category -> lock for its state. Reservations are check-and-book in one step
+        # and sleeping happens outside the lock; categories never contend with each other
+        self._locks: Dict[str, threading.Lock] = {}
 
     def configure_limit(self, category: str, config: RateLimitConfig) -> None:
         """Configure rate limiting for a specific category."""
-        self.configs[category] = config
-
-        if config.strategy == "token_bucket":
-            self.token_buckets[category] = config.requests_per_window
-            self.last_refill[category] = time.time()
+        reserve = self._STRATEGIES.get(config.strategy)
+        if reserve is None:
+            raise ValueError(f"Unknown rate limit strategy: {config.strategy!r}")
 
-        logger.info(f"Configured rate limit for {category}: {config.requests_per_window} req/{config.window_seconds}s ({config.strategy})")
+        # Lock first: a category is usable as soon as its config is visible
+        self._locks.setdefault(category, threading.Lock())
+        self._compiled[category] = _CompiledLimit(config, reserve)
+        self.configs[category] = config
 
-    def wait_if_needed(self, category: str = "default") -> None:
+        if config.strategy == "sliding_window":
+            # Only the newest requests_per_window bookings decide a wait, so the deque
+            # is capped there and older ones fall off as new ones are appended
+            self.sliding_windows[category] = deque(
+                self.sliding_windows.get(category, ()), maxlen=config.requests_per_window
+            )
+        elif config.strategy == "token_bucket":
+            # Start full: empty exactly one full refill ago
+            self.token_zero_times[category] = time.monotonic() - config.window_seconds
+
+        logger.info(
+            "Configured rate limit for %s: %s req/%ss (%s)",
+            category,
+            config.requests_per_window,
+            config.window_seconds,
+            config.strategy,
+        )
+
+    def wait_if_needed(self, category: str = "default", cost: float = 1) -> None:
         """
         Wait if the rate limit would be exceeded for the given category.
 
         Args:
             category: Rate limit category (e.g., "x_search", "x_user", "grok_fast", "grok_reasoning")
+            cost: Units this request consumes, e.g. estimated tokens for a token-per-minute
+                limit. Token bucket and GCRA limits are weighted by it; window strategies
+                count requests and ignore it.
         """
-        if category not in self.configs:
-            logger.warning(f"No rate limit configured for category '{category}', allowing request")
-            return
+        wait_time = self._reserve(category, cost)
+        if wait_time > 0:
+            time.sleep(wait_time)
 
-        config = self.configs[category]
+    async def wait_if_needed_async(self, category: str = "default", cost: float = 1) -> None:
+        """
+        Async version of wait_if_needed.
 
-        if config.strategy == "sliding_window":
-            self._wait_sliding_window(category, config)
-        elif config.strategy == "fixed_window":
-            self._wait_fixed_window(category, config)
-        elif config.strategy == "token_bucket":
-            self._wait_token_bucket(category, config)
+        Reserves the request slot synchronously and then awaits the computed delay
+        with asyncio.sleep, so waiting callers never pin an event loop or worker thread.
+        Sync and async callers share the same reservations.
+        """
+        wait_time = self._reserve(category, cost)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def wait_for_all(self, costs: Dict[str, float]) -> None:
+        """
+        Book several limits at once and sleep for the longest of their waits.
+
+        Use this when one request counts against more than one limit (e.g. requests
+        per minute and tokens per minute): the limits refill in parallel, so waiting
+        for each in turn would oversleep by the shorter wait.
+
+        Args:
+            costs: Category -> cost of this request in that category
+        """
+        wait_time = max(
+            (self._reserve(category, cost) for category, cost in costs.items()), default=0.0
+        )
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def wait_for_all_async(self, costs: Dict[str, float]) -> None:
+        """Async version of wait_for_all."""
+        wait_time = max(
+            (self._reserve(category, cost) for category, cost in costs.items()), default=0.0
+        )
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def _reserve(self, category: str, cost: float = 1) -> float:
+        """
+        Record a request for the category and return how long the caller must wait.
+
+        The request is booked at the time it will actually be allowed to run, so
+        callers only need to sleep for the returned number of seconds.
+        """
+        limit = self._compiled.get(category)
+        if limit is None:
+            logger.warning("No rate limit configured for category '%s', allowing request", category)
+            return 0.0
 
-    def _wait_sliding_window(self, category: str, config: RateLimitConfig) -> None:
+        with self._locks[category]:
+            return limit.reserve(self, category, limit, cost)
+
+    def _reserve_sliding_window(self, category: str, limit: _CompiledLimit, cost: float = 1) -> float:
         """Sliding window rate limiting."""
-        current_time = time.time()
+        current_time = time.monotonic()
+        wait_time = 0.0
 
-        # Remove timestamps outside the window
-        window_times = self.sliding_windows[category]
-        window_times[:] = [t for t in window_times if current_time - t < config.window_seconds]
+        window_times = self._prune_sliding_window(category, limit.window_seconds, current_time)
 
         # Check if we're at the limit
-        if len(window_times) >= config.requests_per_window:
-            # Wait until the oldest request is outside the window
-            oldest_time = min(window_times)
-            wait_time = config.window_seconds - (current_time - oldest_time)
+        if len(window_times) >= limit.limit:
+            # Wait until the oldest request in the window has expired
+            oldest_time = window_times[len(window_times) - limit.limit]
+            wait_time = max(0.0, limit.window_seconds - (current_time - oldest_time))
 
             if wait_time > 0:
-                logger.info(f"Rate limiting {category}: waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
+                logger.info("Rate limiting %s: waiting %.2f seconds", category, wait_time)
 
-                # Recalculate after waiting
-                current_time = time.time()
-                window_times[:] = [t for t in window_times if current_time - t < config.window_seconds]
+        # Record this request at the time it will be sent
+        window_times.append(current_time + wait_time)
+        return wait_time
+
+    def _prune_sliding_window(
+        self, category: str, window_seconds: float, current_time: float
+    ) -> Deque[float]:
+        """
+        Drop timestamps that have left the window and return the category's deque.
 
-        # Record this request
-        window_times.append(current_time)
+        Bookings are never earlier than the one before them, so the deque stays sorted
+        and expired entries are always at its left end.
+        """
+        window_times = self.sliding_windows[category]
+        while window_times and current_time - window_times[0] >= window_seconds:
+            window_times.popleft()
+        return window_times
 
-    def _wait_fixed_window(self, category: str, config: RateLimitConfig) -> None:
+    def _reserve_fixed_window(self, category: str, limit: _CompiledLimit, cost: float = 1) -> float:
         """Fixed window rate limiting."""
-        current_time = time.time()
-        window_start = int(current_time / config.window_seconds) * config.window_seconds
-
-        if category in self.fixed_windows:
-            stored_window, count = self.fixed_windows[category]
-            if stored_window == window_start:
-                # Same window
-                if count >= config.requests_per_window:
-                    # Wait for next window
-                    wait_time = (stored_window + config.window_seconds) - current_time
-                    if wait_time > 0:
-                        logger.info(f"Rate limiting {category}: waiting {wait_time:.2f} seconds for next window")
-                        time.sleep(wait_time)
-                        # Reset for new window after waiting
-                        window_start = int(time.time() / config.window_seconds) * config.window_seconds
-                        count = 0
-                else:
-                    count += 1
+        current_time = time.monotonic()
+        window_start = int(current_time / limit.window_seconds) * limit.window_seconds
+        wait_time = 0.0
+
+        state = self.fixed_windows.get(category)
+        if state is None:
+            self.fixed_windows[category] = _FixedWindow(window_start, 1)
+        elif state.window_start >= window_start:
+            # Same (or an already booked future) window
+            if state.count >= limit.limit:
+                # Wait for next window
+                state.window_start += limit.window_seconds
+                wait_time = state.window_start - current_time
+                logger.info("Rate limiting %s: waiting %.2f seconds for next window", category, wait_time)
+                state.count = 1
             else:
-                # New window
-                count = 1
+                state.count += 1
         else:
-            count = 1
+            # New window
+            state.window_start = window_start
+            state.count = 1
+
+        return wait_time
 
-        self.fixed_windows[category] = (window_start, count)
+    def _reserve_token_bucket(self, category: str, limit: _CompiledLimit, cost: float = 1) -> float:
+        """
+        Token bucket rate limiting, kept as a single "zero time" per category.
 
-    def _wait_token_bucket(self, category: str, config: RateLimitConfig) -> None:
-        """Token bucket rate limiting."""
-        current_time = time.time()
+        Refill and consumption collapse into one update: spending `cost` tokens moves
+        the zero time forward by cost / rate. A zero time in the future is a negative
+        balance, repaid by waiting until then.
+        """
+        current_time = time.monotonic()
 
-        # Refill tokens based on time passed
-        if category in self.last_refill:
-            time_passed = current_time - self.last_refill[category]
-            refill_rate = config.requests_per_window / config.window_seconds  # tokens per second
-            tokens_to_add = time_passed * refill_rate
+        # A full bucket caps how far back the zero time can lag behind now
+        full_since = current_time - limit.window_seconds
+        zero_time = max(self.token_zero_times.get(category, full_since), full_since)
+        zero_time += cost * limit.emission_interval
+        self.token_zero_times[category] = zero_time
 
-            current_tokens = self.token_buckets[category]
-            self.token_buckets[category] = min(config.requests_per_window, current_tokens + tokens_to_add)
+        wait_time = max(0.0, zero_time - current_time)
+        if wait_time > 0:
+            logger.info("Rate limiting %s: waiting %.2f seconds for token", category, wait_time)
 
-        self.last_refill[category] = current_time
+        return wait_time
 
-        # Check if we have a token available
-        if self.token_buckets[category] < 1:
-            # Calculate wait time for next token
-            refill_rate = config.requests_per_window / config.window_seconds
-            wait_time = (1 - self.token_buckets[category]) / refill_rate
+    def _reserve_gcra(self, category: str, limit: _CompiledLimit, cost: float = 1) -> float:
+        """
+        Generic Cell Rate Algorithm (virtual scheduling).
 
-            logger.info(f"Rate limiting {category}: waiting {wait_time:.2f} seconds for token")
-            time.sleep(wait_time)
+        Requests are spaced one emission interval apart, with up to `burst` allowed
+        back-to-back. State is a single theoretical arrival time per category, and the
+        returned wait is the exact delay until the request conforms. A request of
+        weight `cost` takes `cost` emission intervals.
+        """
+        current_time = time.monotonic()
+        increment = limit.emission_interval * cost
+
+        tat = max(current_time, self.gcra_tats.get(category, current_time))
+        wait_time = max(0.0, tat + increment - limit.burst_allowance - current_time)
+        self.gcra_tats[category] = tat + increment
 
-            # Recalculate after waiting
-            current_time = time.time()
-            time_passed = current_time - self.last_refill[category]
-            tokens_to_add = time_passed * refill_rate
-            self.token_buckets[category] = min(config.requests_per_window, self.token_buckets[category] + tokens_to_add)
-            self.last_refill[category] = current_time
+        if wait_time > 0:
+            logger.info("Rate limiting %s: waiting %.2f seconds", category, wait_time)
 
-        # Consume a token
-        self.token_buckets[category] -= 1
+        return wait_time
+
+    # Strategy name -> reservation method, bound to a category in configure_limit
+    _STRATEGIES: Dict[str, Callable[..., float]] = {
+        "sliding_window": _reserve_sliding_window,
+        "fixed_window": _reserve_fixed_window,
+        "token_bucket": _reserve_token_bucket,
+        "gcra": _reserve_gcra,
+    }
 
     def get_remaining_requests(self, category: str, time_window_seconds: Optional[int] = None) -> int:
         """
@@ -183,19 +313,78 @@ class RateLimiter:
             return float('inf')
 
         config = self.configs[category]
-        window_seconds = time_window_seconds or config.window_seconds
+        limit = self._compiled[category]
+        window_seconds = time_window_seconds or limit.window_seconds
 
         if config.strategy == "sliding_window":
-            current_time = time.time()
-            window_times = self.sliding_windows[category]
-            recent_times = [t for t in window_times if current_time - t < window_seconds]
-            return max(0, config.requests_per_window - len(recent_times))
+            current_time = time.monotonic()
+            with self._locks[category]:
+                window_times = self._prune_sliding_window(
+                    category, limit.window_seconds, current_time
+                )
+                if window_seconds == limit.window_seconds:
+                    recent = len(window_times)
+                else:
+                    # Sorted, so count back from the newest until one falls outside
+                    recent = sum(
+                        1 for _ in takewhile(
+                            lambda t: current_time - t < window_seconds, reversed(window_times)
+                        )
+                    )
+            return max(0, limit.limit - recent)
 
         elif config.strategy == "token_bucket":
-            return max(0, int(self.token_buckets.get(category, config.requests_per_window)))
+            zero_time = self.token_zero_times.get(category)
+            if zero_time is None:
+                return limit.limit
+            tokens = min((time.monotonic() - zero_time) / limit.emission_interval, limit.limit)
+            return max(0, int(tokens))
+
+        elif config.strategy == "gcra":
+            backlog = self.gcra_tats.get(category, 0.0) - time.monotonic()
+            if backlog <= 0:
+                return max(1, limit.burst)
+            return max(
+                0,
+                int((limit.emission_interval * limit.burst - backlog) // limit.emission_interval),
+            )
 
         # For fixed window, this is approximate
-        return config.requests_per_window // 2  # Conservative estimate
+        return limit.limit // 2  # Conservative estimate
+
+
+def _env_limit(name: str) -> Optional[int]:
+    """Positive integer from the environment; unset or blank gives None, bad values are logged."""
+    value = os.getenv(name, "").strip()
+    if not value:
+        return None
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit <= 0:
+        logger.warning("Ignoring %s=%r: expected a positive integer", name, value)
+        return None
+    return limit
+
+
+def apply_grok_overrides(limiter: RateLimiter) -> None:
+    """
+    Apply GROK_{FAST,REASONING}_{RPM,TPM} environment overrides to a limiter, if set.
+
+    Call once, where the limiter is built: configure_limit resets a category's state,
+    so re-applying on a live limiter would forget requests and tokens already booked.
+    An RPM override keeps the category's GCRA burst.
+    """
+    for prefix, category in (("GROK_FAST", "grok_fast"), ("GROK_REASONING", "grok_reasoning")):
+        rpm = _env_limit(f"{prefix}_RPM")
+        if rpm is not None:
+            current = limiter.configs.get(category)
+            burst = current.burst if current else max(1, rpm // 6)
+            limiter.configure_limit(category, RateLimitConfig(rpm, 60, "gcra", burst=burst))
+        tpm = _env_limit(f"{prefix}_TPM")
+        if tpm is not None:
+            limiter.configure_limit(f"{category}_tokens", RateLimitConfig(tpm, 60, "token_bucket"))
 
 
 # Pre-configured rate limiter instances for common API patterns
@@ -233,20 +422,38 @@ def create_grok_api_limiter() -> RateLimiter:
     limiter = RateLimiter()
 
     # Grok API rate limits (estimated, adjust based on actual limits)
+    # GCRA spaces calls evenly instead of letting a full window burst through,
+    # which is what trips strict per-minute provider caps.
     # Fast model: higher rate limit for quick responses
     limiter.configure_limit("grok_fast", RateLimitConfig(
         requests_per_window=60,
         window_seconds=60,
-        strategy="sliding_window"
+        strategy="gcra",
+        burst=10
     ))
 
     # reasoning model: lower rate limit for complex reasoning
     limiter.configure_limit("grok_reasoning", RateLimitConfig(
         requests_per_window=30,
         window_seconds=60,
-        strategy="sliding_window"
+        strategy="gcra",
+        burst=5
+    ))
+
+    # Prompt tokens per minute, booked with each call's estimated prompt size so a
+    # burst of large prompts can't exhaust the token quota (estimated, adjust as needed)
+    limiter.configure_limit("grok_fast_tokens", RateLimitConfig(
+        requests_per_window=2_000_000,
+        window_seconds=60,
+        strategy="token_bucket"
+    ))
+    limiter.configure_limit("grok_reasoning_tokens", RateLimitConfig(
+        requests_per_window=2_000_000,
+        window_seconds=60,
+        strategy="token_bucket"
     ))
 
+    apply_grok_overrides(limiter)
     return limiter
 
 
@@ -260,9 +467,12 @@ def create_shared_limiter() -> RateLimiter:
     limiter.configure_limit("x_recent_search", RateLimitConfig(60, 60, "token_bucket"))
 
     # Grok API limits
-    limiter.configure_limit("grok_fast", RateLimitConfig(60, 60, "sliding_window"))
-    limiter.configure_limit("grok_reasoning", RateLimitConfig(30, 60, "sliding_window"))
+    limiter.configure_limit("grok_fast", RateLimitConfig(60, 60, "gcra", burst=10))
+    limiter.configure_limit("grok_reasoning", RateLimitConfig(30, 60, "gcra", burst=5))
+    limiter.configure_limit("grok_fast_tokens", RateLimitConfig(2_000_000, 60, "token_bucket"))
+    limiter.configure_limit("grok_reasoning_tokens", RateLimitConfig(2_000_000, 60, "token_bucket"))
 
+    apply_grok_overrides(limiter)
     return limiter
 
 
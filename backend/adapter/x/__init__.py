@@ -11,6 +11,7 @@ import logging
 import os
 import time
 from datetime import datetime, timedelta, timezone
+from itertools import islice
 from typing import List, Optional
 
 import requests
@@ -21,12 +22,13 @@ from ..rate_limiter import RateLimiter, RateLimitConfig
 
 # Import monitoring (lazy to avoid circular imports)
 _monitor = None
+EventType = None  # monitoring.EventType, bound together with the monitor
 
 def _get_monitor():
-    global _monitor
+    global _monitor, EventType
     if _monitor is None:
         try:
-            from monitoring import monitor
+            from monitoring import EventType, monitor
             _monitor = monitor
         except ImportError:
             _monitor = None
@@ -180,9 +182,9 @@ class XAdapter:
         if self._rate_limit_status["remaining"] is not None:
             remaining = self._rate_limit_status["remaining"]
             if remaining <= 5:
-                logger.warning(f"X API rate limit nearly exhausted: {remaining} requests remaining")
+                logger.warning("X API rate limit nearly exhausted: %s requests remaining", remaining)
             elif remaining <= 20:
-                logger.info(f"X API rate limit: {remaining} requests remaining")
+                logger.info("X API rate limit: %s requests remaining", remaining)
 
     def _format_time(self, dt: datetime) -> str:
         """Format datetime for X API (ISO 8601 with Z suffix)."""
@@ -285,8 +287,10 @@ class XAdapter:
                 # Bar is too recent to query - X API will reject it
                 seconds_until_ready = (end_time - min_allowed_end).total_seconds()
                 logger.warning(
-                    f"Bar end_time {end_time.strftime('%H:%M:%S')} is too recent for X API. "
-                    f"Need to wait ~{seconds_until_ready:.0f}s. Returning empty results."
+                    "Bar end_time %s is too recent for X API. "
+                    "Need to wait ~%.0fs. Returning empty results.",
+                    end_time.strftime('%H:%M:%S'),
+                    seconds_until_ready,
                 )
                 return []
             
@@ -313,14 +317,14 @@ class XAdapter:
         url = f"{self.BASE_URL}/tweets/search/recent"
         
         try:
-            start_time_ms = time.time() * 1000
+            start_ns = time.perf_counter_ns()
             response = requests.get(
                 url,
                 headers=self.headers,
                 params=params,
                 timeout=15
             )
-            latency_ms = (time.time() * 1000) - start_time_ms
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
             
             # Always update rate limit status from headers (even on errors)
             self._update_rate_limit_status(response)
@@ -331,7 +335,6 @@ class XAdapter:
                 is_error = response.status_code >= 400
                 mon.metrics.record_x_api_call(latency_ms, error=is_error)
                 if is_error:
-                    from monitoring import EventType
                     mon.activity.add_event(EventType.ERROR, topic=topic, error=f"X API {response.status_code}")
             
             # Handle specific error codes
@@ -360,7 +363,7 @@ class XAdapter:
             
             # Check for empty results
             if "data" not in data or not data["data"]:
-                logger.info(f"No tweets found for query '{query}' in the last {minutes} minutes")
+                logger.info("No tweets found for query '%s' in the last %s minutes", query, minutes)
                 return []
             
             # Build users map for author lookup
@@ -374,12 +377,11 @@ class XAdapter:
                 tick = self._parse_tweet_to_tick(tweet, users_map, topic)
                 ticks.append(tick)
             
-            logger.info(f"Fetched {len(ticks)} ticks for query '{query}'")
+            logger.info("Fetched %d ticks for query '%s'", len(ticks), query)
             
             # Record successful X API call event
             mon = _get_monitor()
             if mon:
-                from monitoring import EventType
                 mon.activity.add_event(
                     EventType.X_API_CALL, 
                     topic=topic, 
@@ -531,13 +533,13 @@ class XAdapter:
         url = f"{self.BASE_URL}/trends/by/woeid/{woeid}"
 
         try:
-            start_time_ms = time.time() * 1000
+            start_ns = time.perf_counter_ns()
             response = requests.get(
                 url,
                 headers=self.headers,
                 timeout=15
             )
-            latency_ms = (time.time() * 1000) - start_time_ms
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             # Always update rate limit status from headers (even on errors)
             self._update_rate_limit_status(response)
@@ -548,7 +550,6 @@ class XAdapter:
                 is_error = response.status_code >= 400
                 mon.metrics.record_x_api_call(latency_ms, error=is_error)
                 if is_error:
-                    from monitoring import EventType
                     mon.activity.add_event(
                         EventType.ERROR,
                         topic="trends",
@@ -588,14 +589,14 @@ class XAdapter:
             # X API v2 trends response format:
             # { "data": [{ "trend_name": "...", "tweet_count": ... }, ...] }
             if "data" not in data or not data["data"]:
-                logger.info(f"No trending topics found for WOEID {woeid}")
+                logger.info("No trending topics found for WOEID %s", woeid)
                 return []
 
             trends_data = data["data"]
 
             # Format trends
             trends = []
-            for idx, trend in enumerate(trends_data[:limit], start=1):
+            for idx, trend in enumerate(islice(trends_data, limit), start=1):
                 trend_name = trend.get("trend_name", "")
                 # Create search query from trend name
                 query = trend_name.replace("#", "%23").replace(" ", "%20")
@@ -608,12 +609,11 @@ class XAdapter:
                     "rank": idx
                 })
 
-            logger.info(f"Fetched {len(trends)} trending topics for WOEID {woeid}")
+            logger.info("Fetched %d trending topics for WOEID %s", len(trends), woeid)
 
             # Record successful X API call event
             mon = _get_monitor()
             if mon:
-                from monitoring import EventType
                 mon.activity.add_event(
                     EventType.X_API_CALL,
                     topic="trends",
@@ -18,6 +18,7 @@ import sys
 from datetime import datetime, timedelta, timezone
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
 
 # Ensure backend is in path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -30,10 +31,13 @@ from adapter.x import (
     XAPIError,
     Tick
 )
-
+from adapter.models import Metrics
 
 load_dotenv()
 
+# Serializes a whole tick list in one pydantic-core call for JSON output
+_TICK_LIST = TypeAdapter(list[Tick])
+
 
 def _print_verbose_error(e: XAdapterError):
     """Print verbose error information."""
@@ -144,8 +148,7 @@ class XAdapterCLI(cmd.Cmd):
         if len(tick.text) > 100:
             text += "..."
         
-        likes = tick.metrics.get("like_count", 0)
-        retweets = tick.metrics.get("retweet_count", 0)
+        likes, retweets, _, _ = tick.counts
         
         print(f"{prefix}[{timestamp}] @{tick.author}")
         print(f"   {text}")
@@ -265,8 +268,8 @@ class XAdapterCLI(cmd.Cmd):
                 self._print_tick(tick, i)
             
             # Summary
-            total_likes = sum(t.metrics.get("like_count", 0) for t in ticks)
-            total_retweets = sum(t.metrics.get("retweet_count", 0) for t in ticks)
+            totals = Metrics.total(t.counts for t in ticks)
+            total_likes, total_retweets = totals.like_count, totals.retweet_count
             print("-" * 60)
             print(f"Total: {len(ticks)} posts, {total_likes} likes, {total_retweets} retweets")
             
@@ -328,8 +331,8 @@ class XAdapterCLI(cmd.Cmd):
                 self._print_tick(tick, i)
             
             # Bar summary
-            total_likes = sum(t.metrics.get("like_count", 0) for t in ticks)
-            total_retweets = sum(t.metrics.get("retweet_count", 0) for t in ticks)
+            totals = Metrics.total(t.counts for t in ticks)
+            total_likes, total_retweets = totals.like_count, totals.retweet_count
             print("-" * 60)
             print(f"Bar Summary:")
             print(f"  Window: {start_time.strftime('%Y-%m-%d %H:%M')} - {end_time.strftime('%H:%M')}")
@@ -427,8 +430,7 @@ class XAdapterCLI(cmd.Cmd):
                 max_results=max_results
             )
             
-            output = [tick.model_dump(mode="json") for tick in ticks]
-            print(json.dumps(output, indent=2, default=str))
+            print(_TICK_LIST.dump_json(ticks, indent=2).decode())
             
         except XAdapterError as e:
             _print_verbose_error(e)
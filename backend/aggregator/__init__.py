@@ -18,16 +18,20 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from collections import defaultdict
+from itertools import islice
 
 from pydantic import BaseModel, Field
 
 from adapter.grok import GrokAdapter, BarSummary, TopicDigest
-from adapter.models import Tick
+from adapter.models import Metrics, Tick
 
 logger = logging.getLogger(__name__)
 
+# (monitor, EventType), imported lazily on first use to avoid circular imports
+_monitoring = None
+
 
 # Minimum resolution (15s) - respects X API constraint (10s buffer)
 # All resolutions must be multiples of this for clean aggregation
@@ -320,11 +324,14 @@ class BarGenerator:
 
     # Lazy import to avoid circular dependency
     def _get_monitor_and_event_type(self):
-        try:
-            from monitoring import monitor, EventType
-            return monitor, EventType
-        except ImportError:
-            return None, None
+        global _monitoring
+        if _monitoring is None:
+            try:
+                from monitoring import monitor, EventType
+                _monitoring = (monitor, EventType)
+            except ImportError:
+                return None, None
+        return _monitoring
     
     def __init__(self, grok_adapter: GrokAdapter, tick_store: TickStore):
         """
@@ -362,13 +369,12 @@ class BarGenerator:
         ticks = self.tick_store.get_ticks(topic, start=start, end=end)
         
         # Aggregate metrics
-        total_likes = sum(t.metrics.get("like_count", 0) for t in ticks)
-        total_retweets = sum(t.metrics.get("retweet_count", 0) for t in ticks)
-        total_replies = sum(t.metrics.get("reply_count", 0) for t in ticks)
-        total_quotes = sum(t.metrics.get("quote_count", 0) for t in ticks)
+        total_likes, total_retweets, total_replies, total_quotes = Metrics.total(
+            t.counts for t in ticks
+        )
         
         # Sample post IDs (first 5)
-        sample_post_ids = [t.id for t in ticks[:5]]
+        sample_post_ids = [t.id for t in islice(ticks, 5)]
         
         # Create bar
         bar = Bar(
@@ -394,7 +400,7 @@ class BarGenerator:
                     end_time=end
                 )
             except Exception as e:
-                logger.error(f"Failed to generate bar summary: {e}")
+                logger.error("Failed to generate bar summary: %s", e)
 
         # Record bar generation event
         mon, EventType = self._get_monitor_and_event_type()
@@ -501,13 +507,12 @@ class BarGenerator:
         ticks = self.tick_store.get_ticks(topic, start=start, end=end)
         
         # Aggregate metrics (sync - fast computation)
-        total_likes = sum(t.metrics.get("like_count", 0) for t in ticks)
-        total_retweets = sum(t.metrics.get("retweet_count", 0) for t in ticks)
-        total_replies = sum(t.metrics.get("reply_count", 0) for t in ticks)
-        total_quotes = sum(t.metrics.get("quote_count", 0) for t in ticks)
+        total_likes, total_retweets, total_replies, total_quotes = Metrics.total(
+            t.counts for t in ticks
+        )
         
         # Sample post IDs (first 5)
-        sample_post_ids = [t.id for t in ticks[:5]]
+        sample_post_ids = [t.id for t in islice(ticks, 5)]
         
         # Create bar
         bar = Bar(
@@ -533,7 +538,7 @@ class BarGenerator:
                     end_time=end
                 )
             except Exception as e:
-                logger.error(f"Failed to generate bar summary: {e}")
+                logger.error("Failed to generate bar summary: %s", e)
 
         # Record bar generation event
         mon, EventType = self._get_monitor_and_event_type()
@@ -632,6 +637,28 @@ class DigestService:
         """
         self.grok_adapter = grok_adapter
 
+    @staticmethod
+    def _empty_digest(topic: str) -> TopicDigest:
+        """Digest returned when there are no bars to summarize."""
+        return TopicDigest(
+            topic=topic,
+            generated_at=datetime.now(timezone.utc),
+            time_range="No data",
+            overall_summary=f"No recent activity to summarize for {topic}",
+            key_developments=[],
+            trending_elements=[],
+            sentiment_trend="stable",
+            recommendations=["Continue monitoring for activity"]
+        )
+
+    @staticmethod
+    def _lookback_hours(bars: List[Bar]) -> int:
+        """Whole hours spanned by bars (at least 1)."""
+        oldest_bar = min(bars, key=lambda b: b.start)
+        newest_bar = max(bars, key=lambda b: b.end)
+        time_diff = newest_bar.end - oldest_bar.start
+        return max(1, int(time_diff.total_seconds() / 3600))
+
     def create_digest(self, topic: str, bars: List[Bar], lookback_bars: int = 12) -> TopicDigest:
         """
         Create a digest for a topic based on provided bars.
@@ -648,23 +675,11 @@ class DigestService:
         bars = bars[:lookback_bars] if bars else []
         
         if not bars:
-            logger.warning(f"No bars found for topic {topic}")
-            return TopicDigest(
-                topic=topic,
-                generated_at=datetime.now(timezone.utc),
-                time_range="No data",
-                overall_summary=f"No recent activity to summarize for {topic}",
-                key_developments=[],
-                trending_elements=[],
-                sentiment_trend="stable",
-                recommendations=["Continue monitoring for activity"]
-            )
+            logger.warning("No bars found for topic %s", topic)
+            return self._empty_digest(topic)
         
         # Calculate lookback hours from the bars
-        oldest_bar = min(bars, key=lambda b: b.start)
-        newest_bar = max(bars, key=lambda b: b.end)
-        time_diff = newest_bar.end - oldest_bar.start
-        lookback_hours = max(1, int(time_diff.total_seconds() / 3600))
+        lookback_hours = self._lookback_hours(bars)
         
         # Convert bars to dict format for GrokAdapter
         bars_data = [bar.to_dict() for bar in bars]
@@ -676,10 +691,10 @@ class DigestService:
                 bars_data=bars_data,
                 lookback_hours=lookback_hours
             )
-            logger.info(f"Generated digest for topic {topic} with {len(bars)} bars")
+            logger.info("Generated digest for topic %s with %s bars", topic, len(bars))
             return digest
         except Exception as e:
-            logger.error(f"Failed to generate digest for {topic}: {e}")
+            logger.error("Failed to generate digest for %s: %s", topic, e)
             raise RuntimeError(f"Failed to generate digest for {topic}: {e}") from e
 
     async def create_digest_async(self, topic: str, bars: List[Bar], lookback_bars: int = 12) -> TopicDigest:
@@ -691,23 +706,11 @@ class DigestService:
         bars = bars[:lookback_bars] if bars else []
         
         if not bars:
-            logger.warning(f"No bars found for topic {topic}")
-            return TopicDigest(
-                topic=topic,
-                generated_at=datetime.now(timezone.utc),
-                time_range="No data",
-                overall_summary=f"No recent activity to summarize for {topic}",
-                key_developments=[],
-                trending_elements=[],
-                sentiment_trend="stable",
-                recommendations=["Continue monitoring for activity"]
-            )
+            logger.warning("No bars found for topic %s", topic)
+            return self._empty_digest(topic)
         
         # Calculate lookback hours from the bars
-        oldest_bar = min(bars, key=lambda b: b.start)
-        newest_bar = max(bars, key=lambda b: b.end)
-        time_diff = newest_bar.end - oldest_bar.start
-        lookback_hours = max(1, int(time_diff.total_seconds() / 3600))
+        lookback_hours = self._lookback_hours(bars)
         
         # Convert bars to dict format for GrokAdapter
         bars_data = [bar.to_dict() for bar in bars]
@@ -719,10 +722,40 @@ class DigestService:
                 bars_data=bars_data,
                 lookback_hours=lookback_hours
             )
-            logger.info(f"Generated digest for topic {topic} with {len(bars)} bars (async)")
+            logger.info("Generated digest for topic %s with %s bars (async)", topic, len(bars))
             return digest
         except Exception as e:
-            logger.error(f"Failed to generate digest for {topic}: {e}")
+            logger.error("Failed to generate digest for %s: %s", topic, e)
+            raise RuntimeError(f"Failed to generate digest for {topic}: {e}") from e
+
+    async def create_digest_stream(
+        self, topic: str, bars: List[Bar], lookback_bars: int = 12
+    ) -> AsyncIterator[TopicDigest]:
+        """
+        Streaming version of create_digest_async.
+
+        Yields partial digests as Grok generates each field (see
+        GrokAdapter.create_topic_digest_stream); the last item is the complete digest.
+        """
+        bars = bars[:lookback_bars] if bars else []
+
+        if not bars:
+            logger.warning("No bars found for topic %s", topic)
+            yield self._empty_digest(topic)
+            return
+
+        bars_data = [bar.to_dict() for bar in bars]
+
+        try:
+            async for digest in self.grok_adapter.create_topic_digest_stream(
+                topic=topic,
+                bars_data=bars_data,
+                lookback_hours=self._lookback_hours(bars)
+            ):
+                yield digest
+            logger.info("Streamed digest for topic %s with %s bars", topic, len(bars))
+        except Exception as e:
+            logger.error("Failed to stream digest for %s: %s", topic, e)
             raise RuntimeError(f"Failed to generate digest for {topic}: {e}") from e
 
 
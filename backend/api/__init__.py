@@ -4,11 +4,13 @@ FastAPI routes for X Terminal backend.
 
 from __future__ import annotations
 
+import json
 import logging
 from datetime import datetime, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from core import TopicManager, Topic, TopicStatus, TickPoller, RESOLUTION_MAP, DEFAULT_RESOLUTION
@@ -690,6 +692,55 @@ async def create_digest(
         raise HTTPException(status_code=500, detail=f"Failed to generate digest: {e}")
 
 
+@router.post("/topics/{topic_id}/digest/stream")
+async def stream_digest(
+    topic_id: str,
+    lookback_bars: int = Query(default=12, ge=1, le=100, description="Number of bars to include"),
+    manager: TopicManager = Depends(get_topic_manager),
+    digest_service: DigestService = Depends(get_digest_service)
+):
+    """
+    Generate a digest for a topic, streamed as newline-delimited JSON.
+
+    Each line holds the digest fields generated so far, so the dashboard can render
+    `overall_summary` before the lists that follow it. The last line is the full digest.
+    """
+    topic = manager.get_topic(topic_id)
+    if not topic:
+        raise HTTPException(status_code=404, detail=f"Topic '{topic_id}' not found")
+
+    bars = await manager.get_bars_async(topic_id, limit=lookback_bars, generate_summaries=True)
+
+    stream = digest_service.create_digest_stream(
+        topic=topic.label,
+        bars=bars,
+        lookback_bars=lookback_bars
+    )
+    # Pull the first digest before the 200 is committed, so a failure to start
+    # maps to an error status like the non-streaming endpoint
+    try:
+        first = await stream.__anext__()
+    except StopAsyncIteration:
+        raise HTTPException(status_code=500, detail="Failed to generate digest: no output")
+    except Exception as e:
+        await stream.aclose()
+        raise HTTPException(status_code=500, detail=f"Failed to generate digest: {e}")
+
+    async def lines():
+        try:
+            yield first.model_dump_json(exclude_unset=True) + "\n"
+            async for digest in stream:
+                yield digest.model_dump_json(exclude_unset=True) + "\n"
+        except Exception as e:
+            # The status is already sent; end the body with an error line instead
+            logger.error(f"Digest stream failed for {topic_id}: {e}")
+            yield json.dumps({"error": f"Failed to generate digest: {e}"}) + "\n"
+        finally:
+            await stream.aclose()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # ----------------------------------------------------------------------------
 # Location & Trending Topics
 # ----------------------------------------------------------------------------
@@ -30,12 +30,13 @@ from aggregator import (
 
 # Import monitoring (lazy to avoid circular imports)
 _monitor = None
+EventType = None  # monitoring.EventType, bound together with the monitor
 
 def _get_monitor():
-    global _monitor
+    global _monitor, EventType
     if _monitor is None:
         try:
-            from monitoring import monitor
+            from monitoring import EventType, monitor
             _monitor = monitor
         except ImportError:
             _monitor = None
@@ -151,12 +152,11 @@ class TopicManager:
         )
         
         self._topics[topic_id] = topic
-        logger.info(f"Added topic: {topic_id} ({label}) with query '{query}' (default resolution: {resolution})")
+        logger.info("Added topic: %s (%s) with query '%s' (default resolution: %s)", topic_id, label, query, resolution)
         
         # Record topic added event
         mon = _get_monitor()
         if mon:
-            from monitoring import EventType
             mon.activity.add_event(
                 EventType.TOPIC_ADDED,
                 topic=label,
@@ -180,12 +180,11 @@ class TopicManager:
         self.bar_store.clear_topic(label)
         del self._topics[topic_id]
         
-        logger.info(f"Removed topic: {topic_id}")
+        logger.info("Removed topic: %s", topic_id)
         
         # Record topic removed event
         mon = _get_monitor()
         if mon:
-            from monitoring import EventType
             mon.activity.add_event(EventType.TOPIC_REMOVED, topic=label, topic_id=topic_id)
         
         return True
@@ -244,11 +243,11 @@ class TopicManager:
         """
         topic = self._topics.get(topic_id)
         if not topic:
-            logger.warning(f"Topic not found: {topic_id}")
+            logger.warning("Topic not found: %s", topic_id)
             return 0
         
         if topic.status != TopicStatus.ACTIVE:
-            logger.debug(f"Topic {topic_id} is not active, skipping poll")
+            logger.debug("Topic %s is not active, skipping poll", topic_id)
             return 0
         
         # Get a safe polling window (respects X API constraints)
@@ -274,14 +273,13 @@ class TopicManager:
             topic.last_error = None
             
             if new_count > 0:
-                logger.info(f"Poll {topic_id}: +{new_count} ticks ({start_time.strftime('%H:%M:%S')} - {end_time.strftime('%H:%M:%S')})")
+                logger.info("Poll %s: +%s ticks (%s - %s)", topic_id, new_count, start_time.strftime('%H:%M:%S'), end_time.strftime('%H:%M:%S'))
             else:
-                logger.debug(f"Poll {topic_id}: no new ticks")
+                logger.debug("Poll %s: no new ticks", topic_id)
             
             # Record poll and tick events
             mon = _get_monitor()
             if mon:
-                from monitoring import EventType
                 mon.activity.add_event(
                     EventType.POLL,
                     topic=topic.label,
@@ -301,24 +299,22 @@ class TopicManager:
         except XAdapterError as e:
             topic.status = TopicStatus.ERROR
             topic.last_error = str(e)
-            logger.error(f"Error polling {topic_id}: {e}")
+            logger.error("Error polling %s: %s", topic_id, e)
             
             # Record error event
             mon = _get_monitor()
             if mon:
-                from monitoring import EventType
                 mon.activity.add_event(EventType.ERROR, topic=topic.label, error=str(e)[:200])
             
             return 0
         except Exception as e:
             topic.status = TopicStatus.ERROR
             topic.last_error = str(e)
-            logger.error(f"Unexpected error polling {topic_id}: {e}")
+            logger.error("Unexpected error polling %s: %s", topic_id, e)
             
             # Record error event
             mon = _get_monitor()
             if mon:
-                from monitoring import EventType
                 mon.activity.add_event(EventType.ERROR, topic=topic.label, error=str(e)[:200])
             
             return 0
@@ -376,11 +372,11 @@ class TopicManager:
             
             # Ticks exist but no summaries yet - return bars with post counts only (FAST)
             # Summaries will be populated by BarScheduler on next run
-            logger.debug(f"BarStore has bars without summaries for {topic.label}/{resolution}, returning data-only bars")
+            logger.debug("BarStore has bars without summaries for %s/%s, returning data-only bars", topic.label, resolution)
             return bars
         
         # No cached bars - generate metrics only (no Grok calls for speed)
-        logger.debug(f"BarStore empty for {topic.label}/{resolution}, generating metrics-only bars")
+        logger.debug("BarStore empty for %s/%s, generating metrics-only bars", topic.label, resolution)
         return self.bar_generator.generate_bars(
             topic=topic.label,
             resolution=resolution,
@@ -444,11 +440,11 @@ class TopicManager:
             
             # Ticks exist but no summaries yet - return bars with post counts only (FAST)
             # Summaries will be populated by BarScheduler on next run
-            logger.debug(f"BarStore has bars without summaries for {topic.label}/{resolution}, returning data-only bars")
+            logger.debug("BarStore has bars without summaries for %s/%s, returning data-only bars", topic.label, resolution)
             return bars
         
         # No cached bars - generate metrics only (no Grok calls for speed)
-        logger.debug(f"BarStore empty for {topic.label}/{resolution}, generating metrics-only bars (async)")
+        logger.debug("BarStore empty for %s/%s, generating metrics-only bars (async)", topic.label, resolution)
         return await self.bar_generator.generate_bars_async(
             topic=topic.label,
             resolution=resolution,
@@ -510,7 +506,7 @@ class TickPoller:
         
         self._running = True
         self._task = asyncio.create_task(self._poll_loop())
-        logger.info(f"TickPoller started with {self.poll_interval}s interval")
+        logger.info("TickPoller started with %ss interval", self.poll_interval)
     
     async def stop(self):
         """Stop the background polling task."""
@@ -530,7 +526,7 @@ class TickPoller:
             try:
                 await self._poll_all_topics()
             except Exception as e:
-                logger.error(f"Error in poll loop: {e}")
+                logger.error("Error in poll loop: %s", e)
             
             # Wait for next poll interval
             await asyncio.sleep(self.poll_interval)
@@ -548,7 +544,7 @@ class TickPoller:
             try:
                 await self.topic_manager.poll_topic(topic.id)
             except Exception as e:
-                logger.error(f"Error polling topic {topic.id}: {e}")
+                logger.error("Error polling topic %s: %s", topic.id, e)
             
             # Small delay between topics to avoid rate limits
             await asyncio.sleep(0.5)
@@ -617,7 +613,7 @@ class BarScheduler:
             interval = RESOLUTION_MAP[resolution]
             task = asyncio.create_task(self._generation_loop(resolution, interval))
             self._tasks[resolution] = task
-            logger.info(f"BarScheduler started for {resolution} (every {interval}s)")
+            logger.info("BarScheduler started for %s (every %ss)", resolution, interval)
         
         # Generate initial bars for all topics immediately
         await self._generate_initial_bars()
@@ -653,9 +649,9 @@ class BarScheduler:
                         limit=50,  # Initial backfill
                         generate_summaries=False  # Skip Grok for backfill (fast)
                     )
-                    logger.debug(f"Initial bars generated for {topic.label} at {resolution}")
+                    logger.debug("Initial bars generated for %s at %s", topic.label, resolution)
                 except Exception as e:
-                    logger.error(f"Error generating initial bars for {topic.label}/{resolution}: {e}")
+                    logger.error("Error generating initial bars for %s/%s: %s", topic.label, resolution, e)
     
     async def _generation_loop(self, resolution: str, interval_seconds: int):
         """
@@ -679,7 +675,7 @@ class BarScheduler:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Error in bar generation loop for {resolution}: {e}")
+                logger.error("Error in bar generation loop for %s: %s", resolution, e)
                 await asyncio.sleep(5)  # Backoff on error
     
     def _get_next_boundary(self, resolution: str, now: datetime) -> datetime:
@@ -697,48 +693,59 @@ class BarScheduler:
         if not active_topics:
             return
         
+        # Topics are independent; the Grok adapter bounds concurrent summary calls
+        await asyncio.gather(
+            *(self._generate_current_bar_for_topic(topic, resolution) for topic in active_topics)
+        )
+
+    async def _generate_current_bar_for_topic(self, topic: Topic, resolution: str):
+        """Generate the newest complete bar for one topic, if it isn't stored yet."""
         resolution_seconds = RESOLUTION_MAP[resolution]
-        
-        for topic in active_topics:
-            try:
-                # Get tick time range for this topic
-                tick_range = self.topic_manager.tick_store.get_time_range(topic.label)
-                if not tick_range:
-                    continue
-                
-                oldest_tick, newest_tick = tick_range
-                
-                # Generate bars for time windows that have tick data
-                # Start from the newest complete bar window
-                bar_end_ts = int(newest_tick.timestamp() // resolution_seconds) * resolution_seconds
-                bar_end = datetime.fromtimestamp(bar_end_ts, tz=timezone.utc)
-                bar_start = bar_end - timedelta(seconds=resolution_seconds)
-                
-                # Check if this bar already exists in store
-                existing = self.bar_store.get_latest_bar(topic.label, resolution)
-                if existing and existing.start >= bar_start:
-                    # Already have this bar or newer
-                    continue
-                
-                # Generate the bar
-                bar = await self.bar_generator.generate_bar_async(
-                    topic=topic.label,
-                    start=bar_start,
-                    end=bar_end,
-                    resolution=resolution,
-                    generate_summary=True  # Generate fresh Grok summary
-                )
-                await self.bar_store.add_bar(bar)
-                
-                logger.info(
-                    f"BarScheduler generated {resolution} bar for {topic.label}: "
-                    f"{bar_start.strftime('%H:%M:%S')}-{bar_end.strftime('%H:%M:%S')} "
-                    f"({bar.post_count} posts, summary={'yes' if bar.summary else 'no'})"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error generating {resolution} bar for {topic.label}: {e}")
-    
+
+        try:
+            # Get tick time range for this topic
+            tick_range = self.topic_manager.tick_store.get_time_range(topic.label)
+            if not tick_range:
+                return
+            
+            oldest_tick, newest_tick = tick_range
+            
+            # Generate bars for time windows that have tick data
+            # Start from the newest complete bar window
+            bar_end_ts = int(newest_tick.timestamp() // resolution_seconds) * resolution_seconds
+            bar_end = datetime.fromtimestamp(bar_end_ts, tz=timezone.utc)
+            bar_start = bar_end - timedelta(seconds=resolution_seconds)
+            
+            # Check if this bar already exists in store
+            existing = self.bar_store.get_latest_bar(topic.label, resolution)
+            if existing and existing.start >= bar_start:
+                # Already have this bar or newer
+                return
+            
+            # Generate the bar
+            bar = await self.bar_generator.generate_bar_async(
+                topic=topic.label,
+                start=bar_start,
+                end=bar_end,
+                resolution=resolution,
+                generate_summary=True  # Generate fresh Grok summary
+            )
+            await self.bar_store.add_bar(bar)
+            
+            # Bar bounds are whole seconds, so time() renders as HH:MM:SS when formatted
+            logger.info(
+                "BarScheduler generated %s bar for %s: %s-%s (%s posts, summary=%s)",
+                resolution,
+                topic.label,
+                bar_start.time(),
+                bar_end.time(),
+                bar.post_count,
+                "yes" if bar.summary else "no",
+            )
+            
+        except Exception as e:
+            logger.error("Error generating %s bar for %s: %s", resolution, topic.label, e)
+
     async def _generate_bars_for_topic(
         self, 
         topic: str, 
@@ -768,10 +775,10 @@ class BarScheduler:
         """
         topic = self.topic_manager.get_topic(topic_id)
         if not topic:
-            logger.warning(f"Topic {topic_id} not found")
+            logger.warning("Topic %s not found", topic_id)
             return
         
-        for resolution in self.resolutions:
+        async def regenerate(resolution: str):
             try:
                 await self._generate_bars_for_topic(
                     topic.label,
@@ -779,9 +786,12 @@ class BarScheduler:
                     limit=limit,
                     generate_summaries=generate_summaries
                 )
-                logger.info(f"Regenerated {resolution} bars for {topic.label}")
+                logger.info("Regenerated %s bars for %s", resolution, topic.label)
             except Exception as e:
-                logger.error(f"Error regenerating {resolution} bars for {topic.label}: {e}")
+                logger.error("Error regenerating %s bars for %s: %s", resolution, topic.label, e)
+
+        # Resolutions are independent, so their Grok calls overlap instead of queueing
+        await asyncio.gather(*(regenerate(resolution) for resolution in self.resolutions))
 
 
 __all__ = [
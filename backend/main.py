@@ -103,17 +103,20 @@ async def lifespan(app: FastAPI):
     rate_limiter = RateLimiter()
     
     # Configure Grok rate limits (generous - Grok API handles its own limits)
-    from adapter.rate_limiter import RateLimitConfig
+    from adapter.rate_limiter import RateLimitConfig, apply_grok_overrides
     rate_limiter.configure_limit("grok_fast", RateLimitConfig(
         requests_per_window=60,  # 60 requests per minute
         window_seconds=60,
-        strategy="sliding_window"
+        strategy="gcra",
+        burst=10
     ))
     rate_limiter.configure_limit("grok_reasoning", RateLimitConfig(
         requests_per_window=30,  # 30 requests per minute (reasoning is slower)
         window_seconds=60,
-        strategy="sliding_window"
+        strategy="gcra",
+        burst=5
     ))
+    apply_grok_overrides(rate_limiter)
 
     x_adapter = XAdapter(
         bearer_token=os.environ.get("X_BEARER_TOKEN"),
@@ -229,6 +232,7 @@ async def lifespan(app: FastAPI):
         await bar_scheduler.stop()
     if tick_poller:
         await tick_poller.stop()
+    await grok_adapter.aclose()
     logger.info("Goodbye!")
 
 
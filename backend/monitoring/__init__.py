@@ -74,6 +74,8 @@ class MetricsCollector:
         self._grok_calls = 0
         self._grok_errors = 0
         self._grok_latencies: List[float] = []
+        self._grok_prompt_tokens = 0
+        self._grok_cached_prompt_tokens = 0
         
         # X API metrics  
         self._x_api_calls = 0
@@ -99,9 +101,17 @@ class MetricsCollector:
         if error:
             self._error_counts[endpoint] = self._error_counts.get(endpoint, 0) + 1
     
-    def record_grok_call(self, latency_ms: float, error: bool = False) -> None:
-        """Record a Grok API call."""
+    def record_grok_call(
+        self,
+        latency_ms: float,
+        error: bool = False,
+        prompt_tokens: int = 0,
+        cached_prompt_tokens: int = 0,
+    ) -> None:
+        """Record a Grok API call, with its prompt tokens and how many were served from cache."""
         self._grok_calls += 1
+        self._grok_prompt_tokens += prompt_tokens
+        self._grok_cached_prompt_tokens += cached_prompt_tokens
         self._grok_latencies.append(latency_ms)
         if len(self._grok_latencies) > 1000:
             self._grok_latencies = self._grok_latencies[-1000:]
@@ -146,6 +156,10 @@ class MetricsCollector:
         
         # Calculate error rates
         grok_error_rate = self._grok_errors / self._grok_calls if self._grok_calls > 0 else 0
+        grok_prompt_cache_rate = (
+            self._grok_cached_prompt_tokens / self._grok_prompt_tokens
+            if self._grok_prompt_tokens > 0 else 0
+        )
         x_api_error_rate = self._x_api_errors / self._x_api_calls if self._x_api_calls > 0 else 0
         
         return {
@@ -163,6 +177,9 @@ class MetricsCollector:
                 "errors": self._grok_errors,
                 "error_rate": f"{grok_error_rate:.1%}",
                 "latency_ms": self._calculate_percentiles(self._grok_latencies),
+                "prompt_tokens": self._grok_prompt_tokens,
+                "cached_prompt_tokens": self._grok_cached_prompt_tokens,
+                "prompt_cache_rate": f"{grok_prompt_cache_rate:.1%}",
             },
             
             "x_api": {
@@ -4,6 +4,7 @@ End-to-end API tests with mock data.
 Tests the full flow: API → TopicManager → Adapters (mocked) → Response
 """
 
+import json
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, AsyncMock
@@ -495,6 +496,62 @@ class TestAPIDigest:
         assert "overall_summary" in digest
         assert "key_developments" in digest
 
+    def test_stream_digest(self, client_with_digest, mock_grok_adapter):
+        """Test streaming a digest as NDJSON, partial fields first."""
+        final = mock_grok_adapter.create_topic_digest_async.return_value
+
+        async def fake_stream(**kwargs):
+            yield TopicDigest.model_construct(overall_summary=final.overall_summary)
+            yield final
+
+        mock_grok_adapter.create_topic_digest_stream = fake_stream
+
+        response = client_with_digest.post(
+            "/api/v1/topics/tsla/digest/stream?lookback_bars=12"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"overall_summary": final.overall_summary}
+        assert lines[-1]["topic"] == "$TSLA"
+        assert lines[-1]["key_developments"] == final.key_developments
+
+    def test_stream_digest_failure_before_first_line(self, client_with_digest, mock_grok_adapter):
+        """Test a digest stream that fails to start returns 500, like /digest."""
+        async def failing_stream(**kwargs):
+            raise RuntimeError("No fallback available")
+            yield
+
+        mock_grok_adapter.create_topic_digest_stream = failing_stream
+
+        response = client_with_digest.post("/api/v1/topics/tsla/digest/stream")
+
+        assert response.status_code == 500
+        assert "No fallback available" in response.json()["detail"]
+
+    def test_stream_digest_failure_mid_stream(self, client_with_digest, mock_grok_adapter):
+        """Test a mid-stream failure ends the body with an error line."""
+        final = mock_grok_adapter.create_topic_digest_async.return_value
+
+        async def failing_stream(**kwargs):
+            yield TopicDigest.model_construct(overall_summary=final.overall_summary)
+            raise RuntimeError("connection reset")
+
+        mock_grok_adapter.create_topic_digest_stream = failing_stream
+
+        response = client_with_digest.post("/api/v1/topics/tsla/digest/stream")
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"overall_summary": final.overall_summary}
+        assert "connection reset" in lines[-1]["error"]
+
+    def test_stream_digest_unknown_topic(self, client_with_digest):
+        """Test streaming a digest for a missing topic returns 404."""
+        response = client_with_digest.post("/api/v1/topics/nope/digest/stream")
+        assert response.status_code == 404
+
 
 # ============================================================================
 # Full Flow Integration Tests
@@ -0,0 +1,94 @@
+"""Unit tests for adaptive concurrency control."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from adapter.backpressure import (
+    AIMDController,
+    CircuitOpenError,
+    is_overload_error,
+    retry_after_seconds,
+)
+
+
+def _rpc_error(status_name, metadata=()):
+    error = Exception(status_name)
+    error.code = Mock(return_value=Mock(name=status_name))
+    error.code.return_value.name = status_name
+    error.trailing_metadata = Mock(return_value=metadata)
+    return error
+
+
+class TestErrorClassification:
+    """Test overload error detection."""
+
+    def test_grpc_resource_exhausted_is_overload(self):
+        assert is_overload_error(_rpc_error("RESOURCE_EXHAUSTED"))
+
+    def test_grpc_invalid_argument_is_not_overload(self):
+        assert not is_overload_error(_rpc_error("INVALID_ARGUMENT"))
+
+    def test_http_status_codes(self):
+        error = Exception("http")
+        error.status_code = 429
+        assert is_overload_error(error)
+        error.status_code = 400
+        assert not is_overload_error(error)
+
+    def test_retry_after_from_grpc_metadata(self):
+        error = _rpc_error("RESOURCE_EXHAUSTED", (("retry-after", "2.5"),))
+        assert retry_after_seconds(error) == 2.5
+
+
+class TestAIMDController:
+    """Test the AIMD controller and circuit breaker."""
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        controller = AIMDController("test", initial=4, c_max=5, target_latency=1.0)
+
+        controller.record_success(0.5)
+        assert controller.cur == 4.5
+        controller.record_success(5.0)  # Too slow: no increase
+        assert controller.cur == 4.5
+        controller.record_success(0.5)
+        controller.record_success(0.5)
+        assert controller.cur == 5  # Capped at c_max
+
+        controller.record_failure()
+        assert controller.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_consecutive_failures(self):
+        controller = AIMDController("test", failure_threshold=2, open_seconds=60)
+
+        controller.record_failure()
+        assert controller.state == "closed"
+        controller.record_failure()
+        assert controller.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            async with controller.slot():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_success_closes_circuit(self):
+        controller = AIMDController("test", failure_threshold=1, open_seconds=0)
+        controller.record_failure()
+        assert controller.state == "half_open"
+
+        async with controller.slot():
+            controller.record_success(0.1)
+
+        assert controller.state == "closed"
+        assert controller.in_flight == 0
+
+    def test_failures_while_open_do_not_extend_cool_down(self):
+        controller = AIMDController("test", failure_threshold=1, open_seconds=60)
+        with patch('adapter.backpressure.time.monotonic', return_value=1000.0):
+            controller.record_failure()
+        with patch('adapter.backpressure.time.monotonic', return_value=1030.0):
+            controller.record_failure()  # A straggler that was already in flight
+        with patch('adapter.backpressure.time.monotonic', return_value=1061.0):
+            assert controller.state == "half_open"
+            controller.record_failure()  # The trial failed
+            assert controller.state == "open"
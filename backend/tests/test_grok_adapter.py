@@ -1,13 +1,22 @@
 """Unit tests for GrokAdapter."""
 
+import asyncio
+import time
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from pydantic import ValidationError
 
+import adapter.grok as grok_module
 from adapter.grok import (
     GrokAdapter,
     BarSummary,
-    TopicDigest
+    BarSummaryBatch,
+    FactCheckReport,
+    IntelSummary,
+    MonitorInsight,
+    TopicDigest,
+    TopicRollup
 )
 from adapter.grok.mocks import (
     mock_bar_summary,
@@ -20,6 +29,16 @@ from adapter.models import Tick
 from adapter.rate_limiter import RateLimiter, RateLimitConfig
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Adapters share xai-sdk clients process-wide; isolate tests that patch them."""
+    grok_module._CLIENT_CACHE.clear()
+    grok_module._ACLIENT_CACHE.clear()
+    yield
+    grok_module._CLIENT_CACHE.clear()
+    grok_module._ACLIENT_CACHE.clear()
+
+
 class TestRateLimiter:
     """Test the RateLimiter class."""
 
@@ -45,7 +64,7 @@ class TestRateLimiter:
         assert len(limiter.sliding_windows["test"]) == 1
 
     @patch('time.sleep')
-    @patch('time.time')
+    @patch('time.monotonic')
     def test_rate_limiter_with_wait(self, mock_time, mock_sleep):
         limiter = RateLimiter()
         limiter.configure_limit("test", RateLimitConfig(2, 60, "sliding_window"))
@@ -61,6 +80,54 @@ class TestRateLimiter:
         mock_sleep.assert_called_once()
         assert mock_sleep.call_args[0][0] > 0  # Wait time should be positive
 
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_sliding_window_prunes_expired_requests(self, mock_time, mock_sleep):
+        limiter = RateLimiter()
+        limiter.configure_limit("test", RateLimitConfig(2, 60, "sliding_window"))
+
+        mock_time.return_value = 1000
+        limiter.wait_if_needed("test")
+        mock_time.return_value = 1030
+        limiter.wait_if_needed("test")
+        assert limiter.get_remaining_requests("test") == 0
+        assert limiter.get_remaining_requests("test", time_window_seconds=10) == 1
+
+        mock_time.return_value = 1060  # The first request has left the window
+        assert limiter.get_remaining_requests("test") == 1
+        limiter.wait_if_needed("test")
+        mock_sleep.assert_not_called()
+        assert list(limiter.sliding_windows["test"]) == [1030, 1060]
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_sliding_window_keeps_only_the_newest_bookings(self, mock_time, mock_sleep):
+        limiter = RateLimiter()
+        limiter.configure_limit("test", RateLimitConfig(2, 60, "sliding_window"))
+        mock_time.return_value = 1000
+
+        for _ in range(5):
+            limiter.wait_if_needed("test")
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [60, 60, 120]
+        assert list(limiter.sliding_windows["test"]) == [1060, 1120]
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_fixed_window_books_next_window_when_full(self, mock_time, mock_sleep):
+        limiter = RateLimiter()
+        limiter.configure_limit("test", RateLimitConfig(2, 60, "fixed_window"))
+        mock_time.return_value = 1010  # 10s into the window starting at 960
+
+        limiter.wait_if_needed("test")
+        limiter.wait_if_needed("test")
+        mock_sleep.assert_not_called()
+
+        limiter.wait_if_needed("test")
+        assert mock_sleep.call_args[0][0] == pytest.approx(10)
+        state = limiter.fixed_windows["test"]
+        assert (state.window_start, state.count) == (1020, 1)
+
     def test_token_bucket_strategy(self):
         limiter = RateLimiter()
         limiter.configure_limit("test", RateLimitConfig(10, 60, "token_bucket"))
@@ -69,8 +136,133 @@ class TestRateLimiter:
         for i in range(10):
             limiter.wait_if_needed("test")
 
-        # Bucket should be nearly empty (allow tiny refill during test execution)
-        assert limiter.token_buckets["test"] < 0.01
+        # Bucket should be empty (allow tiny refill during test execution)
+        assert limiter.get_remaining_requests("test") == 0
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_gcra_strategy_spaces_requests_after_burst(self, mock_time, mock_sleep):
+        limiter = RateLimiter()
+        limiter.configure_limit("test", RateLimitConfig(60, 60, "gcra", burst=2))
+        mock_time.return_value = 1000
+
+        limiter.wait_if_needed("test")
+        limiter.wait_if_needed("test")
+        mock_sleep.assert_not_called()
+        assert limiter.get_remaining_requests("test") == 0
+
+        limiter.wait_if_needed("test")  # One emission interval (1s) past the burst
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0)
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_weighted_requests_consume_cost(self, mock_time, mock_sleep):
+        mock_time.return_value = 1000
+        limiter = RateLimiter()
+        limiter.configure_limit("tokens", RateLimitConfig(1000, 60, "token_bucket"))
+        limiter.configure_limit("gcra", RateLimitConfig(60, 60, "gcra", burst=10))
+
+        limiter.wait_if_needed("tokens", cost=900)
+        limiter.wait_if_needed("tokens", cost=200)  # 100 tokens short at 1000/60 per second
+        assert mock_sleep.call_args[0][0] == pytest.approx(6.0)
+
+        mock_sleep.reset_mock()
+        limiter.wait_if_needed("gcra", cost=10)  # Uses the whole burst
+        mock_sleep.assert_not_called()
+        limiter.wait_if_needed("gcra")
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0)
+
+    @patch('time.sleep')
+    @patch('time.monotonic')
+    def test_wait_for_all_sleeps_once_for_longest_wait(self, mock_time, mock_sleep):
+        mock_time.return_value = 1000
+        limiter = RateLimiter()
+        limiter.configure_limit("requests", RateLimitConfig(60, 60, "gcra", burst=1))
+        limiter.configure_limit("tokens", RateLimitConfig(600, 60, "token_bucket"))
+
+        limiter.wait_for_all({"requests": 1, "tokens": 600})
+        mock_sleep.assert_not_called()
+
+        limiter.wait_for_all({"requests": 1, "tokens": 30})  # 1s for the request, 3s for tokens
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(3.0)
+
+    def test_grok_overrides_apply_to_limiter(self):
+        from adapter.rate_limiter import apply_grok_overrides
+
+        limiter = RateLimiter()
+        limiter.configure_limit("grok_fast", RateLimitConfig(60, 60, "gcra", burst=10))
+        env = {'GROK_FAST_RPM': '120', 'GROK_REASONING_TPM': '50000', 'GROK_FAST_TPM': 'lots'}
+        with patch.dict('os.environ', env, clear=True):
+            apply_grok_overrides(limiter)  # The malformed TPM is logged and skipped
+            adapter = GrokAdapter(limiter)
+
+        assert limiter.configs["grok_fast"] == RateLimitConfig(120, 60, "gcra", burst=10)
+        assert limiter.configs["grok_reasoning_tokens"].requests_per_window == 50000
+        assert "grok_fast_tokens" not in limiter.configs
+        costs = adapter._rate_limit_costs("grok_reasoning", "s" * 400, "u" * 400)
+        assert costs == {"grok_reasoning": 1, "grok_reasoning_tokens": 201 + 512}
+
+    def test_new_adapters_keep_booked_token_debt(self):
+        limiter = RateLimiter()
+        limiter.configure_limit("grok_fast_tokens", RateLimitConfig(600, 60, "token_bucket"))
+        limiter.wait_if_needed("grok_fast_tokens", cost=600)
+
+        with patch.dict('os.environ', {'GROK_FAST_TPM': '600'}, clear=True):
+            GrokAdapter(limiter)
+
+        assert limiter.get_remaining_requests("grok_fast_tokens") == 0
+
+    @pytest.mark.asyncio
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    @patch('time.monotonic')
+    async def test_rate_limiter_async_wait(self, mock_time, mock_sleep):
+        limiter = RateLimiter()
+        limiter.configure_limit("test", RateLimitConfig(2, 60, "sliding_window"))
+        mock_time.return_value = 1000
+
+        await limiter.wait_if_needed_async("test")
+        await limiter.wait_if_needed_async("test")
+        await limiter.wait_if_needed_async("test")
+
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(60)
+
+    def test_concurrent_reservations_are_atomic(self):
+        import threading
+
+        limiter = RateLimiter()
+        limiter.configure_limit("test", RateLimitConfig(60, 60, "gcra", burst=1))
+        waits = []
+
+        def reserve():
+            for _ in range(50):
+                waits.append(limiter._reserve("test"))
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Every request got its own one-second slot
+        assert sorted(round(wait) for wait in waits) == list(range(200))
+
+    def test_categories_have_separate_locks(self):
+        limiter = RateLimiter()
+        limiter.configure_limit("a", RateLimitConfig(60, 60, "gcra"))
+        limiter.configure_limit("b", RateLimitConfig(60, 60, "gcra"))
+
+        with limiter._locks["a"]:
+            # Holding one category's lock doesn't block reservations in another
+            assert limiter._reserve("b") == 0.0
+
+    def test_unknown_strategy_is_rejected(self):
+        limiter = RateLimiter()
+        with pytest.raises(ValueError):
+            limiter.configure_limit("test", RateLimitConfig(10, 60, "leaky_bucket"))
+        assert "test" not in limiter.configs
 
 
 class TestGrokAdapter:
@@ -101,6 +293,65 @@ class TestGrokAdapter:
                 assert adapter.rate_limiter == limiter
                 mock_client_class.assert_called_once_with(api_key='test_key')
 
+    def test_adapters_share_client_per_api_key(self):
+        """Adapters with the same API key reuse one xai-sdk client."""
+        with patch('adapter.grok.Client') as mock_client_class:
+            with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+                first = GrokAdapter(RateLimiter())
+                second = GrokAdapter(RateLimiter())
+
+        mock_client_class.assert_called_once_with(api_key='test_key')
+        assert first._client is second._client
+
+    def test_shared_clients_are_closed_at_exit(self):
+        """The atexit hook closes and forgets every shared sync client."""
+        with patch('adapter.grok.Client'):
+            with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+                adapter = GrokAdapter(RateLimiter())
+
+        grok_module._close_shared_clients()
+
+        adapter._client.close.assert_called_once_with()
+        assert grok_module._CLIENT_CACHE == {}
+
+    def test_response_models_are_frozen(self):
+        """Response models reject attribute assignment; updates go through model_copy."""
+        summary = BarSummary(
+            summary="s", key_themes=[], sentiment=0.5, post_count=1, engagement_level="low"
+        )
+        with pytest.raises(ValidationError):
+            summary.post_count = 2
+        assert summary.model_copy(update={"post_count": 2}).post_count == 2
+        with pytest.raises(ValidationError):
+            BarSummary(
+                summary="s", key_themes=[], sentiment=0.5, post_count=1,
+                engagement_level="low", unexpected="x"
+            )
+
+    def test_response_schemas_are_built_once(self):
+        """JSON schemas for response models are cached per model."""
+        assert BarSummary.model_json_schema() is BarSummary.model_json_schema()
+        assert grok_module._response_format(TopicDigest) is grok_module._response_format(TopicDigest)
+        assert "post_count" in grok_module._response_format(BarSummary).schema
+
+    def test_system_messages_are_built_once(self):
+        """Messages for the constant system prompts are reused across calls."""
+        message = grok_module._system_message(grok_module._SYSTEM_DIGEST)
+        assert grok_module._system_message(grok_module._SYSTEM_DIGEST) is message
+
+    def test_empty_inputs_skip_the_api(self):
+        """Degenerate inputs are answered locally without a call or rate limit booking."""
+        limiter = Mock()
+        with patch('adapter.grok.Client') as mock_client_class:
+            with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+                adapter = GrokAdapter(limiter)
+
+        assert adapter.summarize_user("@desk", []).handle == "@desk"
+        assert adapter.fact_check("https://x.com/p/1", "  ").verdict == "unclear"
+        assert adapter.digest([]).highlights == []
+        mock_client_class.return_value.chat.create.assert_not_called()
+        limiter.wait_if_needed.assert_not_called()
+
     def test_mock_bar_summary_empty_posts(self):
         """Test mock bar summary with no posts."""
         start_time = datetime.now(timezone.utc)
@@ -149,6 +400,12 @@ class TestGrokAdapter:
         assert len(summary.highlight_posts) <= 2
         assert all(pid in ["tick1", "tick2"] for pid in summary.highlight_posts)
 
+    def test_mock_rng_is_stable_across_processes(self):
+        """Mock data doesn't depend on the per-process str hash seed."""
+        from adapter.grok.mocks import mock_rng
+
+        assert mock_rng("btc").random() == pytest.approx(0.9266628961482384)
+
     def test_mock_topic_digest_no_bars(self):
         """Test mock topic digest with no bars."""
 
@@ -224,6 +481,83 @@ class TestGrokAdapter:
             # Should override post_count to match actual data
             assert result.post_count == 1
 
+    @patch('adapter.grok.Client')
+    def test_rollup_topic_uses_one_call(self, mock_client_class):
+        """Bar summaries and the digest come back from a single fused call."""
+        now = datetime.now(timezone.utc)
+        bar = BarSummary(
+            summary="Rally", key_themes=["earnings"], sentiment=0.8, post_count=0,
+            engagement_level="high"
+        )
+        digest = TopicDigest(
+            topic="$TSLA", generated_at=now, time_range="Last 1 hour(s)",
+            overall_summary="Up", key_developments=[], trending_elements=[],
+            sentiment_trend="improving", recommendations=[]
+        )
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, TopicRollup(bars=[bar], digest=digest))
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+        ticks = [Tick(id=str(i), author="user", text=f"Earnings beat {i}", timestamp=now,
+                      topic="$TSLA") for i in range(3)]
+        windows = [
+            (ticks, now - timedelta(minutes=5), now),
+            ([], now, now + timedelta(minutes=5)),
+        ]
+
+        rollup = adapter.rollup_topic("$TSLA", windows)
+
+        assert mock_chat.parse.call_count == 1
+        assert [b.post_count for b in rollup.bars] == [3, 0]
+        assert rollup.bars[0].summary == "Rally"
+        assert rollup.digest.overall_summary == "Up"
+        user_prompt = mock_chat.append.call_args_list[1].args[0]
+        assert "=== BAR 1 [" in str(user_prompt)
+
+    @patch('adapter.grok.Client')
+    def test_summarize_bars_batch_uses_one_call(self, mock_client_class):
+        """Bars of different topics share one request; empty bars stay local."""
+        now = datetime.now(timezone.utc)
+        summaries = [
+            BarSummary(summary=summary, key_themes=[], sentiment=0.6, post_count=0,
+                       engagement_level="low")
+            for summary in ("Tesla", "Bitcoin")
+        ]
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, BarSummaryBatch(bars=summaries))
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+        tsla = [Tick(id=f"t{i}", author="user", text=f"Deliveries {i}", timestamp=now,
+                     topic="$TSLA") for i in range(3)]
+        btc = [Tick(id="b1", author="user", text="Halving soon", timestamp=now, topic="$BTC")]
+        jobs = [
+            ("$TSLA", tsla, now - timedelta(minutes=5), now),
+            ("$TSLA", [], now, now + timedelta(minutes=5)),
+            ("$BTC", btc, now - timedelta(minutes=5), now),
+        ]
+
+        results = adapter.summarize_bars_batch(jobs)
+
+        assert mock_chat.parse.call_count == 1
+        assert [r.summary for r in results] == ["Tesla", "No posts in this time window", "Bitcoin"]
+        assert [r.post_count for r in results] == [3, 0, 1]
+        user_prompt = str(mock_chat.append.call_args_list[1].args[0])
+        assert "=== BAR 2: $BTC [" in user_prompt
+
+        # Summaries land in the bar cache like summarize_bar's
+        assert adapter.summarize_bar(*jobs[2]).summary == "Bitcoin"
+        assert mock_chat.parse.call_count == 1
+
+        mock_chat.parse.return_value = (None, BarSummaryBatch(bars=summaries[:1]))
+        shifted = [(topic, ticks, start + timedelta(hours=1), end + timedelta(hours=1))
+                   for topic, ticks, start, end in jobs]
+        with pytest.raises(RuntimeError, match="summarize_bars_batch"):
+            adapter.summarize_bars_batch(shifted)
+
     @patch('adapter.grok.Client')
     def test_create_topic_digest_with_api_call(self, mock_client_class):
         """Test create_topic_digest when API client is available."""
@@ -254,3 +588,834 @@ class TestGrokAdapter:
             assert isinstance(result, TopicDigest)
             assert result.topic == "test_topic"
             assert result.overall_summary == "Test summary"
+
+
+class TestGrokAdapterAsync:
+    """Test the native async GrokAdapter paths."""
+
+    @staticmethod
+    def _make_adapter(mock_async_client_class, parsed):
+        mock_async_client = Mock()
+        mock_chat = Mock()
+        mock_chat.parse = AsyncMock(return_value=(None, parsed))
+        mock_async_client.chat.create.return_value = mock_chat
+        mock_async_client_class.return_value = mock_async_client
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            return GrokAdapter(RateLimiter()), mock_chat
+
+    @pytest.mark.asyncio
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_summarize_bar_async_awaits_async_client(self, mock_async_client_class, mock_client_class):
+        expected_summary = BarSummary(
+            summary="Async summary",
+            key_themes=["theme1"],
+            sentiment=0.6,
+            post_count=99,
+            engagement_level="medium"
+        )
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, expected_summary)
+        start_time = datetime.now(timezone.utc)
+        ticks = [Tick(
+            id="post1",
+            author="user1",
+            text="Test post",
+            timestamp=start_time,
+            metrics={"like_count": 10},
+            topic="test_topic"
+        )]
+
+        result = await adapter.summarize_bar_async(
+            "test_topic", ticks, start_time, start_time + timedelta(minutes=5)
+        )
+
+        mock_chat.parse.assert_awaited_once_with(BarSummary)
+        mock_client_class.return_value.chat.create.assert_not_called()
+        assert result.summary == "Async summary"
+        assert result.post_count == 1
+        assert result.highlight_posts == ["post1"]
+
+    @pytest.mark.asyncio
+    async def test_large_bars_are_scanned_off_the_event_loop(self):
+        now = datetime.now(timezone.utc)
+        ticks = [Tick(id=str(i), author="a", text="t", timestamp=now, topic="t") for i in range(3)]
+
+        with patch.object(grok_module, "_OFFLOAD_TICKS", 3), \
+                patch("adapter.grok.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            batch = await GrokAdapter._tick_batch_async(ticks)
+            await GrokAdapter._tick_batch_async(ticks[:2])
+
+        to_thread.assert_called_once()
+        assert batch.ticks is ticks
+
+    @pytest.mark.asyncio
+    async def test_summarize_bar_async_without_client_raises(self):
+        with patch.dict('os.environ', {}, clear=True):
+            adapter = GrokAdapter(RateLimiter())
+        start_time = datetime.now(timezone.utc)
+        ticks = [Tick(
+            id="post1",
+            author="user1",
+            text="Test post",
+            timestamp=start_time,
+            topic="test_topic"
+        )]
+
+        with pytest.raises(RuntimeError):
+            await adapter.summarize_bar_async("test_topic", ticks, start_time, start_time)
+
+    @pytest.mark.asyncio
+    async def test_summarize_bars_async_bounds_concurrency(self):
+        adapter = GrokAdapter(RateLimiter())
+        in_flight = 0
+        peak = 0
+
+        async def fake_summarize(topic, ticks, start_time, end_time):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return topic
+
+        start_time = datetime.now(timezone.utc)
+        jobs = [(f"topic{i}", [], start_time, start_time) for i in range(6)]
+        with patch.object(adapter, "summarize_bar_async", side_effect=fake_summarize):
+            results = await adapter.summarize_bars_async(jobs, max_concurrency=2)
+
+        assert results == [f"topic{i}" for i in range(6)]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_summarize_bars_async_can_return_exceptions(self):
+        adapter = GrokAdapter(RateLimiter())
+
+        async def fake_summarize(topic, ticks, start_time, end_time):
+            if topic == "bad":
+                raise RuntimeError("Grok API call failed")
+            return topic
+
+        start_time = datetime.now(timezone.utc)
+        jobs = [(topic, [], start_time, start_time) for topic in ("a", "bad", "b")]
+        with patch.object(adapter, "summarize_bar_async", side_effect=fake_summarize):
+            results = await adapter.summarize_bars_async(jobs, return_exceptions=True)
+
+        assert results[0] == "a" and results[2] == "b"
+        assert isinstance(results[1], RuntimeError)
+
+    @pytest.mark.asyncio
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_async_overload_errors_are_retried(self, mock_async_client_class, mock_client_class, mock_sleep):
+        insight = MonitorInsight(headline="Spike", topic="ai", impact_score=50, tags=["x"])
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, insight)
+        overloaded = Exception("unavailable")
+        overloaded.status_code = 503
+        mock_chat.parse = AsyncMock(side_effect=[overloaded, (None, insight)])
+
+        result = await adapter.monitor_topic_async("ai")
+
+        assert result.headline == "Spike"
+        assert mock_chat.parse.await_count == 2
+        mock_sleep.assert_awaited_once()
+        assert adapter._backpressure["grok_fast"].in_flight == 0
+
+    @pytest.mark.asyncio
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_identical_concurrent_calls_are_coalesced(self, mock_async_client_class, mock_client_class):
+        expected_insight = MonitorInsight(headline="Spike", topic="ai", impact_score=50, tags=["x"])
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, expected_insight)
+
+        async def slow_parse(schema):
+            await asyncio.sleep(0.01)
+            return None, expected_insight
+
+        mock_chat.parse = AsyncMock(side_effect=slow_parse)
+
+        results = await asyncio.gather(
+            adapter.monitor_topic_async("ai"),
+            adapter.monitor_topic_async("ai"),
+            adapter.monitor_topic_async("ai"),
+        )
+
+        assert mock_chat.parse.await_count == 1
+        assert all(result.headline == "Spike" for result in results)
+        assert adapter._inflight == {}
+
+    @pytest.mark.asyncio
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_cancelled_leader_does_not_fail_coalesced_callers(self, mock_async_client_class, mock_client_class):
+        expected_insight = MonitorInsight(headline="Spike", topic="ai", impact_score=50, tags=["x"])
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, expected_insight)
+        release = asyncio.Event()
+
+        async def slow_parse(schema):
+            await asyncio.wait_for(release.wait(), timeout=5)
+            return None, expected_insight
+
+        mock_chat.parse = AsyncMock(side_effect=slow_parse)
+
+        leader = asyncio.create_task(adapter.monitor_topic_async("ai"))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(adapter.monitor_topic_async("ai")) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+        results = await asyncio.wait_for(asyncio.gather(*followers), timeout=5)
+
+        assert leader.cancelled()
+        assert mock_chat.parse.await_count == 1
+        assert all(result.headline == "Spike" for result in results)
+        assert adapter._inflight == {}
+
+    @pytest.mark.asyncio
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_summarize_bar_stream_yields_partials_then_final(self, mock_async_client_class, mock_client_class):
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, None)
+        chunks = [
+            '{"summary": "Streaming, ',
+            'works", "key_',
+            'themes": ["a"], "sentiment": 0.4, ',
+            '"post_count": 1, "engagement_level": "low"}',
+        ]
+
+        async def stream():
+            for content in chunks:
+                yield None, Mock(content=content)
+
+        mock_chat.stream = stream
+        start_time = datetime.now(timezone.utc)
+        ticks = [Tick(
+            id="post1",
+            author="user1",
+            text="Test post",
+            timestamp=start_time,
+            metrics={"like_count": 10},
+            topic="test_topic"
+        )]
+
+        results = [
+            item async for item in adapter.summarize_bar_stream("test_topic", ticks, start_time, start_time)
+        ]
+
+        assert results[0].summary == "Streaming, works"
+        assert not hasattr(results[0], "sentiment")
+        final = results[-1]
+        assert final.key_themes == ["a"]
+        assert final.engagement_level == "low"
+        assert final.highlight_posts == ["post1"]
+
+    @pytest.mark.asyncio
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_abandoned_stream_releases_backpressure_slot(self, mock_async_client_class, mock_client_class):
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, None)
+
+        async def stream():
+            yield None, Mock(content='{"summary": "Partial", ')
+            yield None, Mock(content='"key_themes": []}')
+
+        mock_chat.stream = stream
+        start_time = datetime.now(timezone.utc)
+        ticks = [Tick(id="post1", author="user1", text="Test post", timestamp=start_time, topic="test_topic")]
+
+        summaries = adapter.summarize_bar_stream("test_topic", ticks, start_time, start_time)
+        first = await summaries.__anext__()
+        assert adapter._backpressure["grok_fast"].in_flight == 1
+        await summaries.aclose()
+
+        assert first.summary == "Partial"
+        assert adapter._backpressure["grok_fast"].in_flight == 0
+
+    @pytest.mark.asyncio
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_topic_digest_stream_yields_summary_first(self, mock_async_client_class, mock_client_class):
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, None)
+        chunks = [
+            '{"topic": "ai", "generated_at": "2024-01-01T00:00:00Z", ',
+            '"time_range": "Last 1 hour(s)", "overall_summary": "Models shipped", ',
+            '"key_developments": ["launch"], "trending_elements": [], ',
+            '"sentiment_trend": "stable", "recommendations": []}',
+        ]
+
+        async def stream():
+            for content in chunks:
+                yield None, Mock(content=content)
+
+        mock_chat.stream = stream
+        bars_data = [{"start": "10:00", "summary": "quiet", "post_count": 5, "sentiment": 0.5}]
+
+        results = [item async for item in adapter.create_topic_digest_stream("ai", bars_data, 1)]
+
+        assert any(
+            getattr(item, "overall_summary", None) == "Models shipped"
+            and not hasattr(item, "key_developments")
+            for item in results[:-1]
+        )
+        final = results[-1]
+        assert isinstance(final.generated_at, datetime)
+        assert final.key_developments == ["launch"]
+
+        cached = [item async for item in adapter.create_topic_digest_stream("ai", bars_data, 1)]
+        assert len(cached) == 1
+        assert cached[0].overall_summary == "Models shipped"
+
+    @pytest.mark.asyncio
+    @patch('adapter.grok.Client')
+    @patch('adapter.grok.AsyncClient')
+    async def test_topic_digest_batch_uses_deferred_completions(self, mock_async_client_class, mock_client_class):
+        adapter, mock_chat = self._make_adapter(mock_async_client_class, None)
+        adapter.use_batch = True
+        digest_json = TopicDigest(
+            topic="ai",
+            generated_at=datetime.now(timezone.utc),
+            time_range="Last 1 hour",
+            overall_summary="Calm hour",
+            key_developments=["a"],
+            trending_elements=[],
+            sentiment_trend="stable",
+            recommendations=[]
+        ).model_dump_json()
+        mock_chat.defer = AsyncMock(return_value=Mock(content=digest_json))
+
+        bars = [{"summary": "quiet", "sentiment": 0.5, "post_count": 3}]
+        digests = await adapter.create_topic_digest_batch([("ai", bars, 1), ("ml", [], 1)])
+
+        assert mock_chat.defer.await_count == 1
+        mock_chat.parse.assert_not_called()
+        assert digests[0].overall_summary == "Calm hour"
+        assert digests[1].topic == "ml"
+
+    @pytest.mark.asyncio
+    async def test_topic_digests_share_one_timestamp(self):
+        with patch.dict('os.environ', {}, clear=True):
+            adapter = GrokAdapter(RateLimiter())
+
+        digests = await adapter.create_topic_digests_async([("ai", [], 1), ("ml", [], 1)])
+
+        assert digests[0].generated_at == digests[1].generated_at
+
+
+class TestGrokAdapterCaching:
+    """Test result caching in GrokAdapter."""
+
+    @patch('adapter.grok.Client')
+    def test_summarize_bar_reuses_cached_summary(self, mock_client_class):
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, BarSummary(
+            summary="Cached summary",
+            key_themes=["theme1"],
+            sentiment=0.5,
+            post_count=0,
+            engagement_level="low"
+        ))
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+        start_time = datetime.now(timezone.utc)
+        end_time = start_time + timedelta(minutes=5)
+        ticks = [Tick(
+            id="post1",
+            author="user1",
+            text="Test post",
+            timestamp=start_time,
+            topic="test_topic"
+        )]
+
+        first = adapter.summarize_bar("test_topic", ticks, start_time, end_time)
+        first.key_themes.append("mutated by caller")
+        # A cache hit skips the full spam scan of the bar
+        with patch('adapter.grok._TickBatch', side_effect=AssertionError("batch built on a cache hit")):
+            second = adapter.summarize_bar("test_topic", ticks, start_time, end_time)
+
+        assert mock_chat.parse.call_count == 1
+        assert second.summary == "Cached summary"
+        assert "mutated by caller" not in second.key_themes
+        assert second.post_count == 1
+
+        adapter.summarize_bar("other_topic", ticks, start_time, end_time)
+        assert mock_chat.parse.call_count == 2
+
+    @patch('adapter.grok.Client')
+    def test_identical_structured_calls_hit_response_cache(self, mock_client_class):
+        report = FactCheckReport(
+            url="https://x.com/p/1", verdict="true", rationale="Sourced", confidence="high"
+        )
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, report)
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+
+        first = adapter.fact_check("https://x.com/p/1", "claim")
+        second = adapter.fact_check("https://x.com/p/1", "claim")
+        adapter.fact_check("https://x.com/p/1", "different claim")
+
+        assert mock_chat.parse.call_count == 2
+        assert second == first
+        assert second is not first
+        stats = adapter.get_cache_stats()["response"]
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 2
+        assert stats["entries"] == 2
+
+    @patch('adapter.grok.Client')
+    def test_disk_cache_serves_responses_after_restart(self, mock_client_class):
+        class FakeDiskCache(dict):
+            def set(self, key, value, expire=None):
+                self[key] = value
+
+        report = FactCheckReport(
+            url="https://x.com/p/1", verdict="true", rationale="Sourced", confidence="high"
+        )
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, report)
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+        disk = FakeDiskCache()
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+            restarted = GrokAdapter(RateLimiter())
+        adapter._disk_cache = restarted._disk_cache = disk
+
+        first = adapter.fact_check("https://x.com/p/1", "claim")
+        second = restarted.fact_check("https://x.com/p/1", "claim")
+
+        assert mock_chat.parse.call_count == 1
+        assert second == first
+
+        # Entries written by an older schema are treated as misses
+        disk[next(iter(disk))] = '{"url": "https://x.com/p/1"}'
+        restarted._response_cache.clear()
+        restarted.fact_check("https://x.com/p/1", "claim")
+        assert mock_chat.parse.call_count == 2
+
+    @patch('adapter.grok.time.sleep')
+    @patch('adapter.grok.Client')
+    def test_overload_errors_are_retried_with_backoff(self, mock_client_class, mock_sleep):
+        report = FactCheckReport(
+            url="https://x.com/p/1", verdict="true", rationale="Sourced", confidence="high"
+        )
+        overloaded = Exception("rate limited")
+        overloaded.status_code = 429
+        bad_request = Exception("invalid schema")
+        bad_request.status_code = 400
+        mock_chat = Mock()
+        mock_chat.parse.side_effect = [overloaded, overloaded, (None, report), bad_request]
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+
+        assert adapter.fact_check("https://x.com/p/1", "claim") == report
+        assert mock_chat.parse.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert all(0 <= call.args[0] <= 1.0 for call in mock_sleep.call_args_list)
+
+        # Client errors are not retried
+        with pytest.raises(RuntimeError):
+            adapter.fact_check("https://x.com/p/2", "claim")
+        assert mock_chat.parse.call_count == 4
+        assert mock_sleep.call_count == 2
+
+    @patch('adapter.grok.Client')
+    def test_identical_concurrent_sync_calls_are_coalesced(self, mock_client_class):
+        from concurrent.futures import ThreadPoolExecutor
+        import threading
+
+        insight = MonitorInsight(headline="Spike", topic="ai", impact_score=50, tags=["x"])
+        release = threading.Event()
+        joined = threading.Semaphore(0)
+
+        class JoinCountingDict(dict):
+            """Counts callers that find an in-flight future to wait on."""
+
+            def get(self, key, default=None):
+                future = super().get(key, default)
+                if future is not None:
+                    joined.release()
+                return future
+
+        def slow_parse(schema):
+            assert release.wait(5)
+            return None, insight
+
+        mock_chat = Mock()
+        mock_chat.parse.side_effect = slow_parse
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        # No response cache, so a follower that missed the in-flight call would parse again
+        env = {'XAI_API_KEY': 'test_key', 'GROK_RESPONSE_CACHE_SIZE': '0'}
+        with patch.dict('os.environ', env):
+            adapter = GrokAdapter(RateLimiter())
+        adapter._inflight_sync = JoinCountingDict()
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(adapter.monitor_topic, "ai") for _ in range(3)]
+            try:
+                # Both followers must be waiting on the leader's future before it resolves
+                assert joined.acquire(timeout=5)
+                assert joined.acquire(timeout=5)
+            finally:
+                release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert mock_chat.parse.call_count == 1
+        assert all(result.headline == "Spike" for result in results)
+        assert adapter._inflight_sync == {}
+
+    @patch('adapter.grok.Client')
+    def test_topic_digest_short_circuits_on_unchanged_bars(self, mock_client_class):
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, TopicDigest(
+            topic="test_topic",
+            generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            time_range="Last 1 hour(s)",
+            overall_summary="Digest",
+            key_developments=[],
+            trending_elements=[],
+            sentiment_trend="stable",
+            recommendations=[],
+        ))
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+        bars_data = [{"start": "10:00", "summary": "quiet", "post_count": 5, "sentiment": 0.5}]
+
+        first = adapter.create_topic_digest("test_topic", bars_data, 1)
+        with patch.object(adapter, '_topic_digest_request') as build_prompt:
+            second = adapter.create_topic_digest("test_topic", list(bars_data), 1)
+        build_prompt.assert_not_called()
+
+        assert mock_chat.parse.call_count == 1
+        assert second.overall_summary == "Digest"
+        assert second.generated_at >= first.generated_at
+
+        adapter.create_topic_digest("test_topic", [{**bars_data[0], "post_count": 6}], 1)
+        assert mock_chat.parse.call_count == 2
+
+    @patch('adapter.grok.Client')
+    def test_near_duplicate_bar_prompts_hit_similarity_cache(self, mock_client_class):
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, BarSummary(
+            summary="Similar summary",
+            key_themes=["etf"],
+            sentiment=0.7,
+            post_count=0,
+            engagement_level="medium"
+        ))
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key', 'GROK_SIMILARITY_THRESHOLD': '0.8'}):
+            adapter = GrokAdapter(RateLimiter())
+        start_time = datetime.now(timezone.utc)
+        ticks = [Tick(
+            id=f"post{i}",
+            author=f"user{i}",
+            text=f"ETF inflows keep climbing as desk {i} reports strong demand from funds",
+            timestamp=start_time,
+            topic="btc"
+        ) for i in range(12)]
+
+        adapter.summarize_bar("btc", ticks[:10], start_time, start_time + timedelta(minutes=5))
+        second = adapter.summarize_bar("btc", ticks[1:11], start_time, start_time + timedelta(minutes=5))
+        adapter.summarize_bar("eth", ticks[1:11], start_time, start_time + timedelta(minutes=5))
+
+        assert mock_chat.parse.call_count == 2
+        assert second.summary == "Similar summary"
+        assert second.post_count == 10
+
+    @patch('adapter.grok.Client')
+    def test_reordered_posts_hit_similarity_cache(self, mock_client_class):
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, IntelSummary(
+            handle="@desk", summary="Macro commentary", top_topics=[], sentiment="neutral",
+            recent_activity=[]
+        ))
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key', 'GROK_SIMILARITY_THRESHOLD': '0.9'}):
+            adapter = GrokAdapter(RateLimiter())
+        posts = ["Rates held steady this morning", "Curve flattening again into the close"]
+
+        adapter.summarize_user("@desk", posts)
+        second = adapter.summarize_user("@desk", posts[::-1])
+        adapter.summarize_user("@other", posts[::-1])
+
+        assert mock_chat.parse.call_count == 2
+        assert second.summary == "Macro commentary"
+
+    @patch('adapter.grok.Client')
+    def test_similar_digest_hit_is_restamped(self, mock_client_class):
+        stamped = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (None, TopicDigest(
+            topic="ai", generated_at=stamped, time_range="Last 1 hour(s)", overall_summary="Digest",
+            key_developments=[], trending_elements=[], sentiment_trend="stable", recommendations=[],
+        ))
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key', 'GROK_SIMILARITY_THRESHOLD': '0.8'}):
+            adapter = GrokAdapter(RateLimiter())
+        bars_data = [
+            {"start": f"10:{i:02d}", "summary": f"Model launch chatter continues across labs {i}",
+             "post_count": 5, "sentiment": 0.5}
+            for i in range(10)
+        ]
+
+        adapter.create_topic_digest("ai", bars_data, 1)
+        second = adapter.create_topic_digest("ai", [*bars_data[:-1], {**bars_data[-1], "post_count": 6}], 1)
+
+        assert mock_chat.parse.call_count == 1
+        assert second.generated_at > stamped
+
+    def test_similarity_cache_bounds_its_buckets(self):
+        from adapter.cache import SimilarityCache
+
+        cache = SimilarityCache(threshold=0.5, max_buckets=2)
+        cache.set("a", "alpha beta gamma", 1)
+        cache.set("b", "alpha beta gamma", 2)
+        assert cache.get("a", "alpha beta gamma") == 1  # "a" is now the most recent
+        cache.set("c", "alpha beta gamma", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b", "alpha beta gamma") is None
+        assert cache.get("a", "alpha beta gamma") == 1
+
+        with patch('adapter.cache.time.monotonic', return_value=time.monotonic() + cache.ttl + 1):
+            assert cache.get("a", "alpha beta gamma") is None
+        assert len(cache) == 1
+
+
+class TestGrokMonitoring:
+    """Test Grok call latency reporting."""
+
+    @patch('adapter.grok.Client')
+    def test_structured_call_records_latency(self, mock_client_class):
+        mock_chat = Mock()
+        mock_chat.parse.side_effect = [
+            (None, MonitorInsight(headline="Spike", topic="ai", impact_score=50, tags=[])),
+            RuntimeError("boom"),
+        ]
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+        mon = Mock()
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+        with patch('adapter.grok._get_monitor', return_value=mon):
+            adapter.monitor_topic("ai")
+            with pytest.raises(RuntimeError):
+                adapter.monitor_topic("ml")
+
+        calls = mon.metrics.record_grok_call.call_args_list
+        assert [call.kwargs["error"] for call in calls] == [False, True]
+        assert all(call.args[0] >= 0 for call in calls)
+
+    @patch('adapter.grok.Client')
+    def test_structured_call_records_cached_prompt_tokens(self, mock_client_class):
+        response = Mock()
+        response.usage.prompt_tokens = 900
+        response.usage.cached_prompt_text_tokens = 768
+        mock_chat = Mock()
+        mock_chat.parse.return_value = (
+            response, MonitorInsight(headline="Spike", topic="ai", impact_score=50, tags=[])
+        )
+        mock_client_class.return_value.chat.create.return_value = mock_chat
+        mon = Mock()
+
+        with patch.dict('os.environ', {'XAI_API_KEY': 'test_key'}):
+            adapter = GrokAdapter(RateLimiter())
+        with patch('adapter.grok._get_monitor', return_value=mon):
+            adapter.monitor_topic("ai")
+
+        kwargs = mon.metrics.record_grok_call.call_args.kwargs
+        assert kwargs["prompt_tokens"] == 900
+        assert kwargs["cached_prompt_tokens"] == 768
+
+
+class TestSpamPrefilter:
+    """Test local spam filtering before Grok calls."""
+
+    @staticmethod
+    def _tick(tick_id, text):
+        return Tick(
+            id=tick_id,
+            author="user",
+            text=text,
+            timestamp=datetime.now(timezone.utc),
+            topic="test_topic"
+        )
+
+    def test_all_spam_bar_skips_api_call(self):
+        adapter = GrokAdapter(RateLimiter())
+        adapter._structured_call = Mock()
+        start_time = datetime.now(timezone.utc)
+        ticks = [
+            self._tick("1", "FREE AIRDROP claim now"),
+            self._tick("2", "Send 0.1 ETH get 1 ETH back"),
+        ]
+
+        summary = adapter.summarize_bar("test_topic", ticks, start_time, start_time)
+
+        adapter._structured_call.assert_not_called()
+        assert summary.post_count == 2
+        assert "High spam ratio" in summary.key_themes
+        assert summary.highlight_posts == []
+
+    def test_spam_is_removed_from_prompt_and_flagged(self):
+        adapter = GrokAdapter(RateLimiter())
+        adapter._structured_call = Mock(return_value=BarSummary(
+            summary="Legit news",
+            key_themes=["earnings"],
+            sentiment=0.6,
+            post_count=0,
+            engagement_level="low"
+        ))
+        start_time = datetime.now(timezone.utc)
+        ticks = [
+            self._tick("1", "Earnings beat expectations"),
+            self._tick("2", "DM me for 100x signals"),
+            self._tick("3", "Join my group for free airdrop"),
+        ]
+
+        summary = adapter.summarize_bar("test_topic", ticks, start_time, start_time)
+
+        user_prompt = adapter._structured_call.call_args.kwargs["user_prompt"]
+        assert "Earnings beat expectations" in user_prompt
+        assert "100x" not in user_prompt
+        assert summary.post_count == 3
+        assert summary.highlight_posts == ["1"]
+        assert "High spam ratio" in summary.key_themes
+
+
+class TestHighlightSelection:
+    """Test highlight post selection."""
+
+    def test_selects_top_two_by_engagement_then_recency(self):
+        from adapter.grok import _TickBatch
+
+        now = datetime.now(timezone.utc)
+        ticks = [
+            Tick(id="low", author="a", text="t", timestamp=now, metrics={"like_count": 1}, topic="t"),
+            Tick(id="high", author="a", text="t", timestamp=now, metrics={"retweet_count": 10}, topic="t"),
+            Tick(id="tie_old", author="a", text="t", timestamp=now - timedelta(minutes=1),
+                 metrics={"like_count": 5}, topic="t"),
+            Tick(id="tie_new", author="a", text="t", timestamp=now, metrics={"like_count": 5}, topic="t"),
+        ]
+
+        assert _TickBatch(ticks).top_ids(2) == ["high", "tie_new"]
+
+    def test_spam_is_skipped_and_full_ties_keep_input_order(self):
+        from adapter.grok import _TickBatch, _highlight_ids
+
+        now = datetime.now(timezone.utc)
+        ticks = [
+            Tick(id="first", author="a", text="t", timestamp=now, metrics={"like_count": 5}, topic="t"),
+            Tick(id="spam", author="a", text="Free BTC giveaway, DM me", timestamp=now,
+                 metrics={"like_count": 99}, topic="t"),
+            Tick(id="second", author="a", text="t", timestamp=now, metrics={"like_count": 5}, topic="t"),
+        ]
+        batch = _TickBatch(ticks)
+
+        assert batch.spam_count == 1
+        assert batch.top_ids(2) == ["first", "second"]
+        assert batch.top_ids(1, include_spam=True) == ["spam"]
+        assert _highlight_ids(ticks) == ["first", "second"]
+
+
+class TestPromptBuilding:
+    """Test prompt construction helpers."""
+
+    @staticmethod
+    def _tick(tick_id, text):
+        return Tick(
+            id=tick_id,
+            author="user",
+            text=text,
+            timestamp=datetime.now(timezone.utc),
+            topic="test_topic"
+        )
+
+    def test_posts_text_respects_token_budget(self):
+        from adapter.grok import _build_posts_text
+
+        ticks = [self._tick(str(i), "word " * 40) for i in range(20)]
+
+        posts_text, included = _build_posts_text(ticks, token_budget=200)
+
+        assert 0 < included < 20
+        assert posts_text.count("\n") == included - 1
+        assert len(posts_text) // 4 <= 200
+
+    def test_long_posts_are_cut_at_word_boundary(self):
+        from adapter.grok import _build_posts_text
+
+        posts_text, included = _build_posts_text([self._tick("1", "abc " * 500)], token_budget=2048)
+
+        assert included == 1
+        assert posts_text.endswith("abc...")
+
+    def test_joined_lines_are_capped(self):
+        from adapter.grok import _MAX_LIST_PROMPT_CHARS, _join_lines
+
+        prompt = _join_lines(["word " * 200] * 50, prefix="- ")
+
+        assert len(prompt) <= _MAX_LIST_PROMPT_CHARS
+        assert prompt.startswith("- word")
+        assert all(line.endswith("...") for line in prompt.split("\n"))
+
+    def test_sample_keeps_most_engaging_posts_in_time_order(self):
+        from adapter.grok import _TickBatch
+
+        now = datetime.now(timezone.utc)
+        ticks = [
+            Tick(id=str(i), author="user", text=f"post {i}", timestamp=now + timedelta(seconds=i),
+                 metrics={"like_count": likes}, topic="test_topic")
+            for i, likes in enumerate([1, 50, 2, 40, 3, 30])
+        ]
+
+        sample = _TickBatch(ticks).sample(3)
+
+        assert [tick.id for tick in sample] == ["1", "3", "5"]
+        assert [tick.id for tick in _TickBatch(ticks).sample(0)] == ["1", "3", "5", "4", "2", "0"]
+
+    def test_engaging_late_post_survives_a_binding_budget(self):
+        from adapter.grok import _TickBatch, _build_posts_text
+
+        now = datetime.now(timezone.utc)
+        ticks = [
+            Tick(id=str(i), author="user", text=f"post {i} " + "word " * 40,
+                 timestamp=now + timedelta(seconds=i), metrics={"like_count": i % 2}, topic="test_topic")
+            for i in range(19)
+        ]
+        ticks.append(Tick(id="viral", author="user", text="viral post", timestamp=now + timedelta(minutes=5),
+                          metrics={"like_count": 500}, topic="test_topic"))
+
+        posts_text, included = _build_posts_text(_TickBatch(ticks).sample(25), token_budget=200)
+
+        assert included < len(ticks)
+        lines = posts_text.split("\n")
+        assert lines[-1] == "@user: viral post"
+        # The posts that fit are the engaging ones, written in time order
+        assert all(int(line.split()[2]) % 2 == 1 for line in lines[:-1])
+        assert lines[:-1] == sorted(lines[:-1], key=lambda line: int(line.split()[2]))
+
+    def test_sentiment_label_bands(self):
+        from adapter.grok import _sentiment_label
+
+        assert _sentiment_label(None) == "unknown"
+        assert _sentiment_label(0.2) == "negative (0.20)"
+        assert _sentiment_label(0.4) == "neutral (0.40)"
+        assert _sentiment_label(0.5) == "neutral (0.50)"
+        assert _sentiment_label(0.6) == "neutral (0.60)"
+        assert _sentiment_label(0.7) == "positive (0.70)"
+        assert _sentiment_label("mixed") == "mixed"
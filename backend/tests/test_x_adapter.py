@@ -85,6 +85,20 @@ class TestXAdapterHelpers:
         
         assert formatted == "2024-06-15T12:30:45Z"
 
+    def test_tick_counts_follow_metrics(self):
+        """Test Tick.counts reflects copied and edited metrics."""
+        tick = Tick(
+            id="1", author="a", text="t", timestamp=datetime.now(timezone.utc),
+            metrics={"like_count": 3}, topic="x"
+        )
+        assert tick.counts.like_count == 3
+
+        copy = tick.model_copy(update={"metrics": {"like_count": 7}})
+        assert copy.counts.like_count == 7
+
+        tick.metrics["like_count"] = 5
+        assert tick.counts.like_count == 5
+
     def test_get_time_bounds(self):
         """Test time bounds calculation."""
         adapter = XAdapter(bearer_token="test")